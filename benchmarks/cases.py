@@ -0,0 +1,51 @@
+"""
+벤치마크 케이스 정의 - 파서별 대표 호출과 ServiceManager 종단 간 호출
+"""
+from typing import Any, Callable, List, NamedTuple
+from core.service_manager import ServiceManager
+from parsers.exchange_parser import ExchangeParser
+from parsers.gold_parser import GoldParser
+from parsers.materials_parser import MaterialsParser
+
+
+class BenchmarkCase(NamedTuple):
+    """벤치마크 케이스 (이름, 파서 그룹, ServiceManager를 받아 한 번 실행하는 함수)"""
+    name: str
+    parser: str
+    run: Callable[[ServiceManager], Any]
+
+
+BENCHMARK_CASES: List[BenchmarkCase] = [
+    # 네이버 검색
+    BenchmarkCase("ticker.search_domestic", "ticker", lambda sm: sm.search_domestic_ticker("삼성전자")),
+    BenchmarkCase("ticker.search_domestic_redirect", "ticker", lambda sm: sm.search_domestic_ticker("005930")),
+    # 네이버 시세
+    BenchmarkCase("market.indices", "market", lambda sm: sm.get_market_indices()),
+    BenchmarkCase("market.sector_performance", "market", lambda sm: sm.get_sector_performance()),
+    BenchmarkCase("market.top_gainers", "market", lambda sm: sm.get_top_gainers()),
+    BenchmarkCase("market.top_gainers_structured", "market", lambda sm: sm.get_top_gainers(structured=True)),
+    BenchmarkCase("stock_quote.domestic", "stock_quote", lambda sm: sm.get_domestic_stock_quote("005930")),
+    # 네이버 시장지표
+    BenchmarkCase("interest.rates", "interest", lambda sm: sm.get_interest_rates()),
+    BenchmarkCase("interest.bond_yields", "interest", lambda sm: sm.get_bond_yields()),
+    BenchmarkCase("exchange.domestic", "exchange", lambda sm: ExchangeParser(sm.http_client).get_domestic_exchange()),
+    BenchmarkCase("exchange.world", "exchange", lambda sm: ExchangeParser(sm.http_client).get_world_exchange()),
+    BenchmarkCase("materials.all", "materials",
+                  lambda sm: MaterialsParser(sm.http_client, snapshot_ttl=0).get_all_materials()),
+    BenchmarkCase("gold.oil_and_precious_metals", "gold",
+                  lambda sm: GoldParser(sm.http_client, snapshot_ttl=0).get_oil_and_precious_metals()),
+    # FnGuide SVD 페이지
+    BenchmarkCase("fnguide.snapshot", "fnguide", lambda sm: sm.get_stock_snapshot("005930")),
+    BenchmarkCase("fnguide.financial_statements", "fnguide", lambda sm: sm.get_financial_statements("005930")),
+    BenchmarkCase("fnguide.financial_ratios", "fnguide", lambda sm: sm.get_financial_ratios("005930")),
+    BenchmarkCase("fnguide.exchange_disclosures", "fnguide", lambda sm: sm.get_exchange_disclosures("005930")),
+    # Yahoo Finance
+    BenchmarkCase("yahoo.lookup", "yahoo", lambda sm: sm.search_overseas_ticker("apple")),
+    BenchmarkCase("yahoo.quote", "yahoo", lambda sm: sm.get_stock_quote("AAPL")),
+    BenchmarkCase("yahoo.global_indices", "yahoo", lambda sm: sm.get_global_indices()),
+    BenchmarkCase("yahoo.commodities", "yahoo", lambda sm: sm.get_commodities()),
+    # MarketWatch / Investing / CoinGecko
+    BenchmarkCase("marketwatch.disclosures", "marketwatch", lambda sm: sm.get_overseas_disclosures("AAPL")),
+    BenchmarkCase("crypto.investing", "crypto", lambda sm: sm.get_crypto_data()),
+    BenchmarkCase("crypto_ticker.search", "crypto_ticker", lambda sm: sm.search_crypto_ticker("bitcoin")),
+]
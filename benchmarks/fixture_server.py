@@ -0,0 +1,91 @@
+"""
+로컬 HTTP 대역 서버 - 녹화된 픽스처를 실제 소켓으로 제공하여 종단 간 지연 측정
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urljoin, urlsplit
+from requests.adapters import HTTPAdapter
+from fixture_store import FixtureStore
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    """클라이언트가 스트리밍 응답을 중간에 끊은 경우(fetch_until)는 오류로 출력하지 않는 서버"""
+    
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class FixtureServer:
+    """/<host><path>?<query> 경로로 원본 URL의 픽스처를 응답하는 로컬 서버"""
+    
+    def __init__(self, store: FixtureStore, host: str = "127.0.0.1", port: int = 0):
+        self.store = store
+        handler = self._make_handler()
+        self._server = QuietHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def _make_handler(self):
+        store = self.store
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def do_GET(self):
+                original_url = "https:/" + self.path
+                fixture = store.load(original_url)
+                if fixture is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(fixture['status'])
+                self.send_header("Content-Type", fixture['content_type'])
+                self.send_header("Content-Length", str(len(fixture['body'])))
+                if fixture['location']:
+                    # 상대 경로 리다이렉트는 원본 URL 기준 절대 경로로 변환 (어댑터가 다시 로컬로 보냄)
+                    self.send_header("Location", urljoin(original_url, fixture['location']))
+                self.end_headers()
+                self.wfile.write(fixture['body'])
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+    
+    def start(self) -> "FixtureServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class RewriteAdapter(HTTPAdapter):
+    """외부 호스트 요청을 로컬 대역 서버 경로로 바꿔 보내는 어댑터"""
+    
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+        self._local_host = urlsplit(base_url).netloc
+    
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        if parts.netloc != self._local_host:
+            query = f"?{parts.query}" if parts.query else ""
+            request.url = f"{self.base_url}/{parts.hostname}{parts.path or '/'}{query}"
+        return super().send(request, **kwargs)
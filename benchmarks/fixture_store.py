@@ -0,0 +1,186 @@
+"""
+벤치마크용 HTML 픽스처 저장소 - 실제 응답을 녹화하고 네트워크 없이 재생
+"""
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from http import HTTPStatus
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from core.cache_paths import CACHE_DIR_ENV
+from core.disk_cache import DiskCache
+from core.rate_limiter import RateLimiter
+from core.resilience import Resilience
+from core.response_cache import ResponseCache
+from core.validator_store import ValidatorStore
+from parsers.http_client import HttpClient
+from parsers.http_transport import PooledTransport
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+INDEX_FILE = 'index.json'
+CASES_FILE = 'cases.json'
+
+
+def normalize_url(url: str) -> str:
+    """쿼리 파라미터 순서와 무관하게 같은 URL이 같은 키가 되도록 정규화"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path or '/'
+    return f"{parts.hostname}{path}" + (f"?{query}" if query else "")
+
+
+class FixtureStore:
+    """URL별 응답 본문과 헤더를 디렉토리에 저장하는 픽스처 저장소"""
+    
+    def __init__(self, directory: str = FIXTURE_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = self._read_json(INDEX_FILE)
+        self._cases: Dict[str, List[str]] = self._read_json(CASES_FILE)
+    
+    def _read_json(self, name: str) -> Dict[str, Any]:
+        """저장소 디렉토리의 JSON 파일 읽기 (없으면 빈 딕셔너리)"""
+        path = os.path.join(self.directory, name)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write_json(self, name: str, data: Dict[str, Any]) -> None:
+        """저장소 디렉토리에 JSON 파일 쓰기"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, name), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def has(self, url: str) -> bool:
+        """URL 픽스처 존재 여부"""
+        return normalize_url(url) in self._index
+    
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """URL 픽스처 반환 (status, content_type, location, body)"""
+        entry = self._index.get(normalize_url(url))
+        if entry is None:
+            return None
+        with open(os.path.join(self.directory, entry['file']), 'rb') as f:
+            body = f.read()
+        return {"status": entry['status'], "content_type": entry['content_type'],
+                "location": entry.get('location'), "body": body}
+    
+    def save(self, url: str, status: int, content_type: str, body: bytes, location: Optional[str] = None) -> None:
+        """응답을 픽스처로 저장하고 인덱스 갱신"""
+        key = normalize_url(url)
+        parts = urlsplit(url)
+        extension = 'json' if 'json' in content_type else 'html'
+        file_name = f"{parts.hostname}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.{extension}"
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, file_name), 'wb') as f:
+                f.write(body)
+            self._index[key] = {"url": url, "file": file_name, "status": status,
+                                "content_type": content_type, "location": location}
+            self._write_json(INDEX_FILE, self._index)
+    
+    def set_case_urls(self, case: str, urls: List[str]) -> None:
+        """케이스 실행 중 요청된 URL 목록 기록"""
+        with self._lock:
+            self._cases[case] = list(dict.fromkeys(urls))
+            self._write_json(CASES_FILE, self._cases)
+    
+    def is_case_recorded(self, case: str) -> bool:
+        """케이스에 필요한 픽스처가 모두 녹화되었는지 확인"""
+        urls = self._cases.get(case)
+        return bool(urls) and all(self.has(url) for url in urls)
+
+
+def build_response(request: requests.PreparedRequest, status: int, content_type: str, body: bytes,
+                   location: Optional[str] = None) -> requests.Response:
+    """픽스처 데이터로 requests 응답 객체 생성"""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    # 본문을 이미 읽은 응답으로 표시 (stream=True 요청의 iter_content도 이 본문을 재생)
+    response._content_consumed = True
+    response.headers = CaseInsensitiveDict({"Content-Type": content_type, "Content-Length": str(len(body))})
+    if location:
+        response.headers["Location"] = location
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response.reason = HTTPStatus(status).phrase
+    return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """실제 요청을 보내고 응답을 픽스처 저장소에 녹화하는 어댑터"""
+    
+    def __init__(self, store: FixtureStore, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.requested: List[str] = []
+    
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        self.requested.append(request.url)
+        # 리다이렉트 응답도 Location과 함께 녹화 (재생 시 동일한 흐름 유지)
+        self.store.save(request.url, response.status_code, response.headers.get('Content-Type', 'text/html'),
+                        response.content, response.headers.get('Location'))
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """네트워크 없이 픽스처 저장소에서 응답을 재생하는 어댑터 (없는 URL은 404)"""
+    
+    def __init__(self, store: FixtureStore, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.misses: Dict[str, int] = {}
+    
+    def send(self, request, **kwargs):
+        fixture = self.store.load(request.url)
+        if fixture is None:
+            self.misses[request.url] = self.misses.get(request.url, 0) + 1
+            return build_response(request, 404, 'text/plain', b'')
+        return build_response(request, fixture['status'], fixture['content_type'], fixture['body'],
+                              fixture['location'])
+
+
+@contextlib.contextmanager
+def isolated_cache_dir() -> Iterator[str]:
+    """실행하는 동안 종목 인덱스와 디스크 캐시를 빈 임시 디렉토리에 둠 (사용자의 ~/.cache 상태와 무관하게 측정)"""
+    previous = os.environ.get(CACHE_DIR_ENV)
+    with tempfile.TemporaryDirectory(prefix="search-economy-bench-") as path:
+        os.environ[CACHE_DIR_ENV] = path
+        try:
+            yield path
+        finally:
+            if previous is None:
+                os.environ.pop(CACHE_DIR_ENV, None)
+            else:
+                os.environ[CACHE_DIR_ENV] = previous
+
+
+def make_http_client(adapter: HTTPAdapter, cache: bool = False) -> HttpClient:
+    """모든 요청이 주어진 어댑터를 거치는 HttpClient 생성
+    
+    기본적으로 응답 캐시를 끄고, 디스크 캐시·조건부 요청·속도 제한은 항상 끕니다. 서킷 브레이커는 클라이언트 전용입니다.
+    """
+    transport = PooledTransport(pool_sizes={})
+    transport.session.mount("https://", adapter)
+    transport.session.mount("http://", adapter)
+    return HttpClient(cache=ResponseCache() if cache else ResponseCache(max_entries=0), transport=transport,
+                      disk_cache=DiskCache(max_bytes=0), validators=ValidatorStore(max_entries=0),
+                      resilience=Resilience(), rate_limiter=RateLimiter(host_rates={}, default_rate=None))
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+벤치마크 픽스처 녹화 스크립트 - 각 케이스를 실제 사이트에 한 번 실행하고 응답을 저장
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixture_store import FIXTURE_DIR, FixtureStore, RecordingAdapter, isolated_cache_dir, make_http_client
+from cases import BENCHMARK_CASES
+from core.service_manager import ServiceManager
+
+
+def main():
+    """픽스처 녹화 메인 함수"""
+    arg_parser = argparse.ArgumentParser(description="벤치마크 HTML 픽스처 녹화 (네트워크 필요)")
+    arg_parser.add_argument("--dir", default=FIXTURE_DIR,
+                            help="픽스처 저장 디렉토리 (기본값은 저장소에 포함된 픽스처, 개인 녹화는 benchmarks/fixtures/local)")
+    arg_parser.add_argument("--only", nargs="*", help="녹화할 케이스 이름 (접두어 일치)")
+    args = arg_parser.parse_args()
+    
+    store = FixtureStore(args.dir)
+    adapter = RecordingAdapter(store)
+    
+    # 재생과 같은 조건(빈 캐시 디렉토리)에서 녹화해야 케이스가 요청하는 URL이 같음
+    with isolated_cache_dir():
+        service_manager = ServiceManager(http_client=make_http_client(adapter))
+        for case in BENCHMARK_CASES:
+            if args.only and not any(case.name.startswith(prefix) for prefix in args.only):
+                continue
+            adapter.requested = []
+            try:
+                result = case.run(service_manager)
+                store.set_case_urls(case.name, adapter.requested)
+                status = "✓" if result else "⚠️  빈 결과"
+                print(f"{status} {case.name}: {len(adapter.requested)}개 응답 녹화")
+            except Exception as e:
+                print(f"❌ {case.name}: {e}")
+    
+    print(f"\n총 {len(store)}개 픽스처 저장: {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크 실행 스크립트 - 녹화된 픽스처로 파서 처리 시간, 메모리, 종단 간 지연 측정
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixture_store import FIXTURE_DIR, FixtureStore, ReplayAdapter, isolated_cache_dir, make_http_client
+from fixture_server import FixtureServer, RewriteAdapter
+from cases import BENCHMARK_CASES, BenchmarkCase
+from core.service_manager import ServiceManager
+
+
+def measure(case: BenchmarkCase, service_manager: ServiceManager, rounds: int, warmup: int) -> Dict[str, Any]:
+    """케이스를 반복 실행해 시간 통계와 최대 메모리 사용량 측정"""
+    for _ in range(warmup):
+        case.run(service_manager)
+    
+    timings: List[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        case.run(service_manager)
+        timings.append(time.perf_counter() - started)
+    
+    tracemalloc.start()
+    case.run(service_manager)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    mean = statistics.mean(timings)
+    return {
+        "min": min(timings),
+        "max": max(timings),
+        "mean": mean,
+        "median": statistics.median(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "ops": 1 / mean if mean else 0.0,
+        "peak_kb": peak / 1024,
+        "rounds": rounds,
+    }
+
+
+def run_group(group: str, cases: List[BenchmarkCase], service_manager: ServiceManager,
+              rounds: int, warmup: int) -> Dict[str, Dict[str, Any]]:
+    """그룹의 케이스들을 측정하고 표로 출력"""
+    print(f"\n=== {group} ({len(cases)}개 케이스) ===")
+    print(f"{'name':<36} {'min(ms)':>9} {'mean(ms)':>9} {'median(ms)':>11} {'stddev':>8} {'ops/s':>8} {'peak(KB)':>9}")
+    results = {}
+    for case in cases:
+        try:
+            stats = measure(case, service_manager, rounds, warmup)
+        except Exception as e:
+            print(f"{case.name:<36} 실패: {e}")
+            continue
+        results[f"{group}/{case.name}"] = stats
+        print(f"{case.name:<36} {stats['min'] * 1000:>9.2f} {stats['mean'] * 1000:>9.2f} "
+              f"{stats['median'] * 1000:>11.2f} {stats['stddev'] * 1000:>8.2f} "
+              f"{stats['ops']:>8.1f} {stats['peak_kb']:>9.1f}")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline_path: str, threshold: float) -> List[str]:
+    """기준 결과 대비 중앙값이 threshold 비율 이상 느려진 케이스 목록 반환"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = []
+    for name, stats in results.items():
+        previous = baseline.get(name)
+        if previous is None or not previous.get("median"):
+            continue
+        ratio = stats["median"] / previous["median"] - 1
+        if ratio > threshold:
+            regressions.append(f"{name}: median {previous['median'] * 1000:.2f}ms -> "
+                               f"{stats['median'] * 1000:.2f}ms (+{ratio:.0%})")
+    return regressions
+
+
+def main():
+    """벤치마크 메인 함수"""
+    arg_parser = argparse.ArgumentParser(description="녹화된 픽스처 기반 오프라인 벤치마크")
+    arg_parser.add_argument("--dir", default=FIXTURE_DIR, help="픽스처 디렉토리")
+    arg_parser.add_argument("--group", choices=["parser", "e2e", "all"], default="all",
+                            help="parser: 소켓 없이 파서 처리만, e2e: 로컬 대역 서버를 거친 ServiceManager 호출")
+    arg_parser.add_argument("--only", nargs="*", help="실행할 케이스 이름 (접두어 일치)")
+    arg_parser.add_argument("--rounds", type=int, default=20, help="측정 반복 횟수")
+    arg_parser.add_argument("--warmup", type=int, default=2, help="워밍업 횟수")
+    arg_parser.add_argument("--save", help="결과를 저장할 JSON 경로")
+    arg_parser.add_argument("--compare", help="비교할 기준 결과 JSON 경로")
+    arg_parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 중앙값 증가 비율")
+    args = arg_parser.parse_args()
+    
+    store = FixtureStore(args.dir)
+    cases = []
+    for case in BENCHMARK_CASES:
+        if args.only and not any(case.name.startswith(prefix) for prefix in args.only):
+            continue
+        if not store.is_case_recorded(case.name):
+            print(f"⏭️  {case.name}: 픽스처 없음 (record_fixtures.py로 녹화 필요)")
+            continue
+        cases.append(case)
+    if not cases:
+        print("실행할 케이스가 없습니다.")
+        return 0
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    # 그룹마다 빈 캐시 디렉토리에서 시작 (로컬 종목 인덱스 유무에 따라 결과가 달라지지 않도록)
+    if args.group in ("parser", "all"):
+        with isolated_cache_dir():
+            service_manager = ServiceManager(http_client=make_http_client(ReplayAdapter(store)))
+            results.update(run_group("parser", cases, service_manager, args.rounds, args.warmup))
+    if args.group in ("e2e", "all"):
+        server = FixtureServer(store).start()
+        try:
+            with isolated_cache_dir():
+                service_manager = ServiceManager(http_client=make_http_client(RewriteAdapter(server.base_url)))
+                results.update(run_group("e2e", cases, service_manager, args.rounds, args.warmup))
+        finally:
+            server.stop()
+    
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n결과 저장: {args.save}")
+    
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\n✓ 기준 대비 회귀 없음 (임계값 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,7 @@ import os
 # src 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from mcp_server import mcp
-
-def main():
-    """MCP 서버 메인 함수"""
-    mcp.run()
+from mcp_server import main
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,12 +2,22 @@
 FnGuide 분석 관련 API 라우트
 """
 from fastapi import APIRouter
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from parsers.fnguide_parser import FnGuideParser
 
 router = APIRouter(prefix="/fnguide", tags=["fnguide"])
 fnguide_parser = FnGuideParser()
 
+@router.get("/report/{ticker}")
+def get_company_report(ticker: str, sections: Optional[str] = None) -> Dict[str, Any]:
+    """종합 기업 리포트 조회 (sections: 쉼표 구분)"""
+    try:
+        from core.service_manager import service_manager
+        result = service_manager.get_company_report(ticker, sections.split(",") if sections else None)
+        return {"ticker": ticker, "report": result, "errors": result.errors}
+    except Exception as e:
+        return {"error": str(e)}
+
 @router.get("/snapshot/{ticker}")
 def get_snapshot(ticker: str) -> Dict[str, Any]:
     try:
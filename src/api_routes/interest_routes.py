@@ -8,24 +8,24 @@ router = APIRouter(prefix="/interest", tags=["interest"])
 
 
 @router.get("/rates")
-async def get_interest_rates():
+async def get_interest_rates(structured: bool = False):
     """기준금리 및 주요 금리 조회"""
-    return {"data": service_manager.get_interest_rates()}
+    return {"data": service_manager.get_interest_rates(structured)}
 
 
 @router.get("/bonds")
-async def get_bond_yields():
+async def get_bond_yields(structured: bool = False):
     """국고채 수익률 조회"""
-    return {"data": service_manager.get_bond_yields()}
+    return {"data": service_manager.get_bond_yields(structured)}
 
 
 @router.get("/cd")
-async def get_cd_rates():
+async def get_cd_rates(structured: bool = False):
     """CD금리 조회"""
-    return {"data": service_manager.get_cd_rates()}
+    return {"data": service_manager.get_cd_rates(structured)}
 
 
 @router.get("/corporate")
-async def get_corporate_bonds():
+async def get_corporate_bonds(structured: bool = False):
     """회사채 수익률 조회"""
-    return {"data": service_manager.get_corporate_bonds()}
\ No newline at end of file
+    return {"data": service_manager.get_corporate_bonds(structured)}
\ No newline at end of file
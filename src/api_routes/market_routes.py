@@ -14,24 +14,24 @@ async def get_market_indices():
 
 
 @router.get("/sectors")
-async def get_sector_performance():
+async def get_sector_performance(structured: bool = False):
     """업종별 등락률 조회"""
-    return {"data": service_manager.get_sector_performance()}
+    return {"data": service_manager.get_sector_performance(structured)}
 
 
 @router.get("/gainers")
-async def get_top_gainers():
+async def get_top_gainers(structured: bool = False):
     """상승률 상위 종목 조회"""
-    return {"data": service_manager.get_top_gainers()}
+    return {"data": service_manager.get_top_gainers(structured)}
 
 
 @router.get("/losers")
-async def get_top_losers():
+async def get_top_losers(structured: bool = False):
     """하락률 상위 종목 조회"""
-    return {"data": service_manager.get_top_losers()}
+    return {"data": service_manager.get_top_losers(structured)}
 
 
 @router.get("/volume")
-async def get_volume_leaders():
+async def get_volume_leaders(structured: bool = False):
     """거래량 상위 종목 조회"""
-    return {"data": service_manager.get_volume_leaders()}
\ No newline at end of file
+    return {"data": service_manager.get_volume_leaders(structured)}
\ No newline at end of file
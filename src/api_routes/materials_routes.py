@@ -36,6 +36,15 @@ def get_agriculture_futures() -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+@materials_router.get("/all")
+def get_all_materials() -> Dict[str, Any]:
+    try:
+        result = materials_parser.get_all_materials()
+        result.update(gold_parser.get_oil_and_precious_metals())
+        return result
+    except Exception as e:
+        return {"error": str(e)}
+
 @gold_router.get("/oil")
 def get_oil_prices() -> Dict[str, Any]:
     try:
@@ -2,7 +2,7 @@
 티커 검색 관련 API 라우트
 """
 from fastapi import APIRouter
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from parsers.ticker_parser import TickerParser
 
 router = APIRouter(prefix="/search", tags=["ticker"])
@@ -21,6 +21,19 @@ def search_domestic(query: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+@router.get("/tickers/{query}")
+def search_tickers(query: str, universes: Optional[str] = None, limit: int = 10) -> Dict[str, Any]:
+    """국내/해외/암호화폐 티커 통합 퍼지 검색 (universes: 쉼표 구분, 예: domestic,overseas)"""
+    try:
+        from core.service_manager import service_manager
+        selected = [name.strip() for name in universes.split(",") if name.strip()] if universes else None
+        return {
+            "query": query,
+            "tickers": service_manager.search_tickers(query, selected, limit)
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
 @router.get("/overseas/{query}")
 def search_overseas(query: str) -> Dict[str, Any]:
     try:
@@ -41,7 +54,8 @@ def get_multiple_overseas_quotes(symbols: list) -> Dict[str, Any]:
         result = service_manager.get_multiple_stock_quotes(symbols)
         return {
             "symbols": symbols,
-            "quotes": result
+            "quotes": result,
+            "errors": result.errors
         }
     except Exception as e:
         return {"error": str(e)}
@@ -54,7 +68,8 @@ def get_multiple_domestic_quotes(tickers: list) -> Dict[str, Any]:
         result = service_manager.get_multiple_domestic_stock_quotes(tickers)
         return {
             "tickers": tickers,
-            "quotes": result
+            "quotes": result,
+            "errors": result.errors
         }
     except Exception as e:
         return {"error": str(e)}
@@ -67,7 +82,8 @@ def get_multiple_crypto_quotes(symbols: list) -> Dict[str, Any]:
         result = service_manager.get_multiple_crypto_quotes(symbols)
         return {
             "symbols": symbols,
-            "quotes": result
+            "quotes": result,
+            "errors": result.errors
         }
     except Exception as e:
         return {"error": str(e)}
\ No newline at end of file
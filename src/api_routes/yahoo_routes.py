@@ -1,6 +1,7 @@
 """
 Yahoo Finance API 라우트
 """
+from typing import Optional
 from fastapi import APIRouter, HTTPException
 from core.service_manager import service_manager
 
@@ -8,20 +9,34 @@ router = APIRouter(prefix="/yahoo", tags=["yahoo"])
 
 
 @router.get("/global-indices")
-async def get_global_indices():
+async def get_global_indices(structured: bool = False):
     """글로벌 주요 지수 조회"""
     try:
-        result = service_manager.get_global_indices()
+        result = await service_manager.get_global_indices_async(structured)
+        return {"data": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/world-indices")
+async def get_world_indices(regions: Optional[str] = None, symbols: Optional[str] = None, structured: bool = False):
+    """세계 지수 조회 (regions, symbols: 쉼표 구분)"""
+    try:
+        result = await service_manager.get_world_indices_async(
+            regions.split(",") if regions else None,
+            symbols.split(",") if symbols else None,
+            structured,
+        )
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/us-treasury")
-async def get_us_treasury_yields():
+async def get_us_treasury_yields(structured: bool = False):
     """미국 국채 수익률 조회"""
     try:
-        result = service_manager.get_us_treasury_yields()
+        result = await service_manager.get_us_treasury_yields_async(structured)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -31,57 +46,57 @@ async def get_us_treasury_yields():
 async def get_vix_data():
     """VIX 공포지수 조회"""
     try:
-        result = service_manager.get_vix_data()
+        result = await service_manager.get_vix_data_async()
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/commodities")
-async def get_commodities():
+async def get_commodities(structured: bool = False):
     """글로벌 원자재 가격 조회"""
     try:
-        result = service_manager.get_commodities()
+        result = await service_manager.get_commodities_async(structured)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/forex")
-async def get_forex_majors():
+async def get_forex_majors(structured: bool = False):
     """주요 환율 조회"""
     try:
-        result = service_manager.get_forex_majors()
+        result = await service_manager.get_forex_majors_async(structured)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/asian-indices")
-async def get_asian_indices():
+async def get_asian_indices(structured: bool = False):
     """아시아 주요 지수 조회"""
     try:
-        result = service_manager.get_asian_indices()
+        result = await service_manager.get_asian_indices_async(structured)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/european-indices")
-async def get_european_indices():
+async def get_european_indices(structured: bool = False):
     """유럽 주요 지수 조회"""
     try:
-        result = service_manager.get_european_indices()
+        result = await service_manager.get_european_indices_async(structured)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/sectors")
-async def get_yahoo_sector_performance():
+async def get_yahoo_sector_performance(structured: bool = False):
     """섹터별 성과 조회"""
     try:
-        result = service_manager.get_yahoo_sector_performance()
+        result = await service_manager.get_yahoo_sector_performance_async(structured)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -91,7 +106,7 @@ async def get_yahoo_sector_performance():
 async def get_stock_quote(symbol: str):
     """개별 주식 정보 조회 (Yahoo Finance)"""
     try:
-        result = service_manager.get_stock_quote(symbol)
+        result = await service_manager.get_stock_quote_async(symbol)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -101,7 +116,7 @@ async def get_stock_quote(symbol: str):
 async def get_domestic_stock_quote(ticker: str):
     """국내 개별 주식 정보 조회"""
     try:
-        result = service_manager.get_domestic_stock_quote(ticker)
+        result = await service_manager.get_domestic_stock_quote_async(ticker)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -111,7 +126,7 @@ async def get_domestic_stock_quote(ticker: str):
 async def get_crypto_quote(symbol: str):
     """개별 암호화폐 정보 조회"""
     try:
-        result = service_manager.get_crypto_quote(symbol)
+        result = await service_manager.get_crypto_quote_async(symbol)
         return {"data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -121,7 +136,7 @@ async def get_crypto_quote(symbol: str):
 async def get_overseas_disclosures(symbol: str):
     """해외주식 공시정보 조회"""
     try:
-        result = service_manager.get_overseas_disclosures(symbol)
+        result = await service_manager.get_overseas_disclosures_async(symbol)
         return {"symbol": symbol, "data": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+배치 실행 모듈 - 호스트별 동시성 제한과 항목별 타임아웃을 갖는 병렬 실행기
+"""
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+# 호스트별 최대 동시 요청 수
+DEFAULT_HOST_LIMITS: Dict[str, int] = {
+    "finance.yahoo.com": 8,
+    "finance.naver.com": 6,
+    "comp.fnguide.com": 6,
+    "api.coingecko.com": 2,
+}
+
+
+class BatchResult(dict):
+    """입력 순서를 유지하는 배치 결과 (실패한 항목은 errors에 사유 기록)"""
+
+    def __init__(self):
+        super().__init__()
+        self.errors: Dict[Any, str] = {}
+
+
+class BatchExecutor:
+    """공유 스레드 풀 위에서 배치 작업을 병렬로 실행하는 클래스"""
+
+    def __init__(self, max_workers: int = 32, default_host_limit: int = 4,
+                 host_limits: Optional[Dict[str, int]] = None, item_timeout: float = 20.0):
+        self.default_host_limit = default_host_limit
+        self.host_limits = dict(DEFAULT_HOST_LIMITS if host_limits is None else host_limits)
+        self.item_timeout = item_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch")
+        self._semaphores: Dict[Optional[str], threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _limit(self, host: Optional[str]) -> int:
+        """호스트별 최대 동시 실행 수"""
+        return max(1, self.host_limits.get(host, self.default_host_limit))
+
+    def _semaphore(self, host: Optional[str]) -> threading.BoundedSemaphore:
+        """호스트별 동시성 세마포어 반환"""
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._limit(host))
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any], host: Optional[str] = None,
+            timeout: Optional[float] = None, default_factory: Callable[[], Any] = str) -> BatchResult:
+        """항목별로 fn을 병렬 실행하고 입력 순서대로 결과 반환
+
+        실패하거나 타임아웃된 항목은 default_factory()로 채우고 errors에 사유를 기록합니다.
+        배치 전체는 제출 시점부터 timeout x ceil(항목 수 / 호스트 동시 실행 수) 안에 반환되며,
+        타임아웃된 항목이 세마포어를 계속 잡고 있어도 대기 중인 항목은 이 기한이 지나면 포기합니다.
+        """
+        timeout = self.item_timeout if timeout is None else timeout
+        keys = list(dict.fromkeys(items))
+        semaphore = self._semaphore(host)
+        rounds = max(1, -(-len(keys) // self._limit(host)))
+        batch_deadline = time.monotonic() + timeout * rounds
+        started: Dict[Any, float] = {}
+
+        def run(item):
+            remaining = batch_deadline - time.monotonic()
+            if remaining <= 0 or not semaphore.acquire(timeout=remaining):
+                raise TimeoutError(f"timeout waiting for {host or 'default'} slot")
+            try:
+                started[item] = time.monotonic()
+                return fn(item)
+            finally:
+                semaphore.release()
+
+        result = BatchResult()
+        for item in keys:
+            result[item] = default_factory()
+
+        # 호출한 쪽의 컨텍스트(요청 우선순위 등)를 작업 스레드로 전달
+        futures = {self._executor.submit(contextvars.copy_context().run, run, item): item for item in keys}
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            deadlines = []
+            for future in list(pending):
+                start = started.get(futures[future])
+                # 시작 전(세마포어/스레드 풀 대기) 항목은 배치 기한, 실행 중인 항목은 시작 후 timeout까지
+                deadline = batch_deadline if start is None else min(start + timeout, batch_deadline)
+                if now >= deadline:
+                    # 실행 중인 스레드는 중단할 수 없으므로 결과만 포기
+                    pending.discard(future)
+                    result.errors[futures[future]] = (f"timeout after {timeout}s" if start is not None
+                                                      else f"timeout waiting for {host or 'default'} slot")
+                else:
+                    deadlines.append(deadline)
+            if not pending:
+                break
+
+            wait_for = max(0.0, min(deadlines) - now)
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = futures[future]
+                try:
+                    result[item] = future.result()
+                except Exception as e:
+                    result.errors[item] = str(e)
+
+        if result.errors:
+            logging.warning(f"배치 실행 중 {len(result.errors)}/{len(keys)}개 항목 실패 ({host}): {result.errors}")
+        return result
+
+
+# 싱글톤 인스턴스
+batch_executor = BatchExecutor()
@@ -0,0 +1,53 @@
+"""
+로컬 캐시 경로 모듈 - 디스크에 보관하는 인덱스/캐시 파일 위치 관리
+"""
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Optional
+
+# 캐시 디렉토리 경로를 바꾸려면 이 환경 변수를 지정
+CACHE_DIR_ENV = "SEARCH_ECONOMY_CACHE_DIR"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "search-economy-index")
+
+
+def cache_dir() -> str:
+    """캐시 디렉토리 경로 반환 (없으면 생성)"""
+    path = os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_path(name: str) -> str:
+    """캐시 디렉토리 안의 파일 경로 반환"""
+    return os.path.join(cache_dir(), name)
+
+
+def load_json(name: str) -> Optional[Any]:
+    """캐시 디렉토리의 JSON 파일 읽기 (없거나 손상되었으면 None)"""
+    path = cache_path(name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logging.warning(f"캐시 파일 읽기 실패 ({path}): {e}")
+        return None
+
+
+def save_json(name: str, data: Any) -> None:
+    """캐시 디렉토리에 JSON 파일을 원자적으로 저장 (같은 디렉토리의 고유한 임시 파일에 쓴 뒤 교체)"""
+    path = cache_path(name)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path),
+                                         prefix=f"{os.path.basename(path)}.", suffix=".tmp", delete=False) as f:
+            temp_path = f.name
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except Exception as e:
+        logging.warning(f"캐시 파일 저장 실패 ({path}): {e}")
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
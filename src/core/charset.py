@@ -0,0 +1,123 @@
+"""
+문자셋 판별 모듈 - 응답 헤더, <meta charset>, 호스트별 알려진 인코딩 순으로 판별하고 추정은 앞부분만 사용
+"""
+import codecs
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import chardet
+except ImportError:
+    chardet = None
+
+
+# 호스트별로 알려진 인코딩 (헤더와 <meta>가 모두 없을 때 사용)
+KNOWN_HOST_ENCODINGS: Dict[str, str] = {
+    "finance.naver.com": "euc-kr",
+    "finance.yahoo.com": "utf-8",
+    "comp.fnguide.com": "utf-8",
+    "kr.investing.com": "utf-8",
+    "www.marketwatch.com": "utf-8",
+}
+
+# 인코딩 정보가 없다는 뜻으로 취급하는 헤더 값 (requests가 text/* 기본값으로 채우는 ISO-8859-1 포함, 정규화된 이름)
+GENERIC_ENCODINGS = frozenset({"iso8859-1", "ascii"})
+
+# libxml2가 모르는 한국어 인코딩 별칭
+ENCODING_ALIASES = {"ks_c_5601-1987": "cp949", "x-windows-949": "cp949"}
+
+META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+
+
+def canonical_encoding(name: Optional[str]) -> Optional[str]:
+    """lxml에 넘길 인코딩 이름 (파이썬이 모르는 이름이면 None)"""
+    if not name:
+        return None
+    name = name.strip().lower()
+    name = ENCODING_ALIASES.get(name, name)
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        return None
+    return name
+
+
+def is_generic_encoding(name: str) -> bool:
+    """인코딩 정보가 없는 것과 같은 헤더 값인지"""
+    return codecs.lookup(name).name in GENERIC_ENCODINGS
+
+
+class CharsetResolver:
+    """본문 전체를 추정하지 않고 값싼 단서부터 차례로 확인하는 문자셋 판별기
+    
+    순서: 응답 헤더 -> 앞부분 <meta charset> -> 호스트별 알려진 인코딩 -> 이전에 판별한 호스트 인코딩
+    -> 앞부분 표본 추정(chardet) -> UTF-8. 어떤 경로로 결정했는지는 통계로 남깁니다.
+    """
+    
+    PATHS = ("forced", "header", "meta", "host", "learned", "detect", "default")
+    
+    def __init__(self, host_encodings: Optional[Dict[str, str]] = None,
+                 meta_window: int = 4096, sample_size: int = 32 * 1024):
+        self.host_encodings = dict(KNOWN_HOST_ENCODINGS if host_encodings is None else host_encodings)
+        self.meta_window = meta_window
+        self.sample_size = sample_size
+        self._learned: Dict[str, str] = {}
+        self._counts = {path: 0 for path in self.PATHS}
+        self._lock = threading.Lock()
+    
+    def resolve(self, content: bytes, declared_encoding: Optional[str] = None,
+                url: Optional[str] = None) -> Tuple[str, str]:
+        """(인코딩, 판별 경로) 반환"""
+        encoding, path = self._resolve(content, declared_encoding, urlsplit(url).hostname if url else None)
+        with self._lock:
+            self._counts[path] += 1
+        return encoding, path
+    
+    def record(self, path: str) -> None:
+        """판별 없이 인코딩을 정한 경우의 통계 기록 (fetch_euc_kr 등)"""
+        with self._lock:
+            self._counts[path] += 1
+    
+    def _resolve(self, content: bytes, declared_encoding: Optional[str],
+                 host: Optional[str]) -> Tuple[str, str]:
+        declared = canonical_encoding(declared_encoding)
+        if declared and not is_generic_encoding(declared):
+            return declared, "header"
+        
+        match = META_CHARSET.search(content[:self.meta_window])
+        meta = canonical_encoding(match.group(1).decode("ascii", "ignore")) if match else None
+        if meta:
+            self._learn(host, meta)
+            return meta, "meta"
+        
+        if host:
+            known = self.host_encodings.get(host)
+            if known:
+                return known, "host"
+            learned = self._learned.get(host)
+            if learned:
+                return learned, "learned"
+        
+        if chardet is not None:
+            detected = canonical_encoding(chardet.detect(content[:self.sample_size])["encoding"])
+            if detected:
+                self._learn(host, detected)
+                return detected, "detect"
+        return "utf-8", "default"
+    
+    def _learn(self, host: Optional[str], encoding: str) -> None:
+        """호스트의 인코딩 기억 (다음 응답에 헤더와 <meta>가 없을 때 사용)"""
+        if host and host not in self.host_encodings:
+            with self._lock:
+                self._learned[host] = encoding
+    
+    def stats(self) -> Dict[str, Any]:
+        """판별 경로별 횟수와 학습한 호스트 인코딩 반환"""
+        with self._lock:
+            return {"paths": dict(self._counts), "learned_hosts": dict(self._learned)}
+
+
+# 싱글톤 인스턴스
+charset_resolver = CharsetResolver()
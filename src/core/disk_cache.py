@@ -0,0 +1,191 @@
+"""
+디스크 캐시 모듈 - 프로세스 재시작과 여러 서버 프로세스 사이에서 공유되는 SQLite 기반 응답 캐시
+"""
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+from core.cache_paths import cache_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    encoding TEXT,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class DiskCacheEntry:
+    """디스크 캐시 항목 (압축 해제된 본문과 재검증용 헤더)"""
+    
+    __slots__ = ("content", "etag", "last_modified", "encoding", "expires_at")
+    
+    def __init__(self, content: bytes, etag: Optional[str], last_modified: Optional[str],
+                 encoding: Optional[str], expires_at: float):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.encoding = encoding
+        self.expires_at = expires_at
+    
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+    
+    def validators(self) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match, If-Modified-Since)"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """zlib 압축 본문을 SQLite(WAL)에 보관하고 전체 크기가 넘치면 오래 안 쓴 항목부터 축출하는 캐시
+    
+    max_bytes가 0이면 캐시를 사용하지 않습니다. 데이터베이스 파일은 처음 사용할 때 엽니다.
+    """
+    
+    FILE_NAME = "http_cache.sqlite3"
+    
+    def __init__(self, path: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+    
+    def _connect(self) -> sqlite3.Connection:
+        """데이터베이스 연결 (최초 1회, 락 보유 상태에서 호출)"""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path or cache_path(self.FILE_NAME), timeout=10,
+                                         check_same_thread=False, isolation_level=None)
+            # WAL 모드: MCP/HTTP 서버 프로세스가 동시에 읽고 써도 서로 막지 않음
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SCHEMA)
+            self._connection = connection
+        return self._connection
+    
+    def get(self, key: str) -> Optional[DiskCacheEntry]:
+        """항목 반환 (만료 여부와 무관, 없으면 None)"""
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT body, etag, last_modified, encoding, expires_at FROM entries WHERE key = ?",
+                    (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                self.hits += 1
+            body, etag, last_modified, encoding, expires_at = row
+            return DiskCacheEntry(zlib.decompress(body), etag, last_modified, encoding, expires_at)
+        except Exception as e:
+            logging.warning(f"디스크 캐시 조회 실패 ({key}): {e}")
+            return None
+    
+    def set(self, key: str, content: bytes, ttl: float, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, encoding: Optional[str] = None) -> None:
+        """항목 저장 후 전체 크기가 max_bytes를 넘으면 축출"""
+        if not self.enabled or ttl <= 0:
+            return
+        body = zlib.compress(content, 6)
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, body, size, etag, last_modified, encoding, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, body, len(body), etag, last_modified, encoding, now + ttl, now)
+                )
+                self._evict(connection)
+        except Exception as e:
+            logging.warning(f"디스크 캐시 저장 실패 ({key}): {e}")
+    
+    def touch(self, key: str, ttl: float) -> None:
+        """재검증(304) 성공 후 만료 시각 연장"""
+        if not self.enabled:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "UPDATE entries SET expires_at = ?, accessed_at = ? WHERE key = ?", (now + ttl, now, key)
+                )
+                self.revalidated += 1
+        except Exception as e:
+            logging.warning(f"디스크 캐시 갱신 실패 ({key}): {e}")
+    
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 안 쓴 항목 삭제 (락 보유 상태에서 호출)"""
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        removed = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            removed.append((key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        connection.executemany("DELETE FROM entries WHERE key = ?", removed)
+        self.evictions += len(removed)
+    
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+    
+    def stats(self) -> Dict[str, Any]:
+        """디스크 캐시 통계 반환"""
+        result: Dict[str, Any] = {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.evictions,
+        }
+        if self.enabled and self._connection is not None:
+            with self._lock:
+                entries, size = self._connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            result.update({"entries": entries, "bytes": size, "max_bytes": self.max_bytes})
+        return result
+    
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# 싱글톤 인스턴스 (같은 호스트의 모든 서버 프로세스가 같은 파일을 공유)
+disk_cache = DiskCache()
@@ -1,28 +1,68 @@
 """
 파서 인터페이스 정의
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List, Sequence
 from lxml import html
+from core.records import TableResult, extract_records
+from core.selectors import XPathLike, select
+from core.table_extractor import extract_rows, rows_to_markdown
 
 
 class HttpClientInterface(ABC):
     """HTTP 클라이언트 인터페이스"""
     
     @abstractmethod
-    def fetch_euc_kr(self, url: str) -> Optional[html.HtmlElement]:
+    def fetch_euc_kr(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
         pass
     
     @abstractmethod
-    def fetch_utf8(self, url: str) -> Optional[html.HtmlElement]:
+    def fetch_utf8(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
         pass
     
+    @abstractmethod
+    def fetch_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                   timeout: Optional[float] = None, headers: Optional[Dict[str, str]] = None) -> Optional[Any]:
+        pass
+    
+    @abstractmethod
+    def request(self, method: str, url: str, read_timeout: Optional[float] = None, **kwargs) -> Any:
+        """원시 응답이 필요한 요청 (POST 폼 전송, 텍스트 파일 다운로드 등 - 실패 시 예외)"""
+        pass
+    
+    def fetch_persisted(self, url: str, key: str, encoding: str = 'utf-8',
+                        max_age: Optional[float] = None) -> Optional[html.HtmlElement]:
+        """디스크 캐시를 거치는 페이지 조회 (기본 구현은 일반 조회와 같음)"""
+        return self.fetch_euc_kr(url) if encoding == 'euc-kr' else self.fetch_utf8(url)
+    
+    def fetch_until(self, url: str, selector: str, encoding: str = 'utf-8',
+                    count: int = 1, required: Sequence[str] = ()) -> Optional[html.HtmlElement]:
+        """필요한 요소가 닫힐 때까지만 받는 페이지 조회 (기본 구현은 전체 페이지 조회)"""
+        return self.fetch_euc_kr(url) if encoding == 'euc-kr' else self.fetch_utf8(url)
+    
     @staticmethod
     @abstractmethod
     def html_to_markdown(html_content: str) -> str:
         pass
 
 
+class AsyncHttpClientInterface(ABC):
+    """비동기 HTTP 클라이언트 인터페이스"""
+    
+    @abstractmethod
+    async def fetch_euc_kr(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
+        pass
+    
+    @abstractmethod
+    async def fetch_utf8(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
+        pass
+    
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+
 class ParserInterface(ABC):
     """파서 기본 인터페이스"""
     
@@ -36,14 +76,62 @@ class WebParserBase:
     
     def __init__(self, http_client: HttpClientInterface):
         self.http_client = http_client
+        self.async_http_client: Optional[AsyncHttpClientInterface] = None
+    
+    async def _fetch_euc_kr_async(self, url: str) -> Optional[html.HtmlElement]:
+        """비동기 클라이언트로 EUC-KR 페이지 조회 (없으면 스레드에서 동기 조회)"""
+        if self.async_http_client is not None:
+            return await self.async_http_client.fetch_euc_kr(url)
+        return await asyncio.to_thread(self.http_client.fetch_euc_kr, url)
+    
+    async def _fetch_utf8_async(self, url: str) -> Optional[html.HtmlElement]:
+        """비동기 클라이언트로 UTF-8 페이지 조회 (없으면 스레드에서 동기 조회)"""
+        if self.async_http_client is not None:
+            return await self.async_http_client.fetch_utf8(url)
+        return await asyncio.to_thread(self.http_client.fetch_utf8, url)
     
-    def _extract_element(self, tree: html.HtmlElement, xpath: str) -> Optional[str]:
+    async def _fetch_until_async(self, url: str, selector: str, count: int = 1,
+                                 required: Sequence[str] = ()) -> Optional[html.HtmlElement]:
+        """필요한 요소까지만 받는 스트리밍 조회를 스레드에서 실행"""
+        return await asyncio.to_thread(self.http_client.fetch_until, url, selector, 'utf-8', count, required)
+    
+    def _extract_element(self, tree: html.HtmlElement, xpath: XPathLike) -> Optional[str]:
         """XPath로 요소 추출 후 마크다운 변환"""
         try:
-            elements = tree.xpath(xpath)
+            elements = select(tree, xpath)
             if elements:
                 html_content = html.tostring(elements[0], encoding='unicode')
                 return self.http_client.html_to_markdown(html_content)
             return None
         except Exception:
-            return None
\ No newline at end of file
+            return None
+    
+    def _extract_table_rows(self, tree: html.HtmlElement, xpath: XPathLike, max_rows: Optional[int] = None,
+                            row_filter: Optional[Callable[[List[str]], bool]] = None) -> Optional[str]:
+        """XPath로 찾은 요소의 테이블 행을 직접 순회해 마크다운 표로 변환 (max_rows개에서 중단)"""
+        try:
+            elements = select(tree, xpath)
+            if elements:
+                return rows_to_markdown(extract_rows(elements[0], max_rows, row_filter))
+            return None
+        except Exception:
+            return None
+    
+    def _extract_table_records(self, tree: html.HtmlElement, xpath: XPathLike, max_rows: Optional[int] = None,
+                               row_filter: Optional[Callable[[List[str]], bool]] = None) -> Optional[List[Dict[str, Any]]]:
+        """XPath로 찾은 요소의 테이블 행을 구조화 레코드 딕셔너리 목록으로 변환"""
+        try:
+            elements = select(tree, xpath)
+            if elements:
+                return [record.to_dict() for record in extract_records(elements[0], max_rows, row_filter)]
+            return None
+        except Exception:
+            return None
+    
+    def _extract_table(self, tree: html.HtmlElement, xpath: XPathLike, max_rows: Optional[int] = None,
+                       row_filter: Optional[Callable[[List[str]], bool]] = None,
+                       structured: bool = False) -> TableResult:
+        """구조화 모드면 레코드 목록, 아니면 마크다운 표 반환 (실패 시 빈 값)"""
+        if structured:
+            return self._extract_table_records(tree, xpath, max_rows, row_filter) or []
+        return self._extract_table_rows(tree, xpath, max_rows, row_filter) or ""
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+페이지 스냅샷 모듈 - 한 번 가져온 페이지를 여러 섹션 조회에서 공유
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional
+from lxml import html
+from core.selectors import XPathLike, select
+
+
+class PageSnapshot:
+    """페이지를 한 번만 가져오고 요청된 섹션만 지연 변환하여 재사용하는 스냅샷 클래스"""
+    
+    def __init__(self, fetch: Callable[[], Optional[html.HtmlElement]],
+                 sections: Mapping[str, XPathLike],
+                 convert: Callable[[html.HtmlElement], str], ttl: float = 30, label: str = "페이지"):
+        self._fetch = fetch
+        self.sections = sections
+        self._convert = convert
+        self.ttl = ttl
+        self.label = label
+        self._tree: Optional[html.HtmlElement] = None
+        self._fetched_at = 0.0
+        self._converted: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def _ensure_fresh(self) -> Optional[html.HtmlElement]:
+        """스냅샷이 없거나 만료되었으면 다시 가져오기 (락 보유 상태에서 호출)"""
+        if self._tree is None or time.monotonic() - self._fetched_at >= self.ttl:
+            self._tree = self._fetch()
+            self._fetched_at = time.monotonic()
+            self._converted = {}
+        return self._tree
+    
+    def get(self, section: str) -> str:
+        """섹션 내용 반환 (처음 요청될 때만 변환)"""
+        try:
+            with self._lock:
+                tree = self._ensure_fresh()
+                if tree is None:
+                    return ""
+                if section not in self._converted:
+                    elements = select(tree, self.sections[section])
+                    self._converted[section] = self._convert(elements[0]) if elements else ""
+                return self._converted[section]
+        except Exception as e:
+            logging.error(f"{self.label} 파싱 실패 ({section}): {e}")
+            return ""
+    
+    def get_all(self) -> Dict[str, str]:
+        """모든 섹션 내용 반환"""
+        return {section: self.get(section) for section in self.sections}
+    
+    def invalidate(self) -> None:
+        """스냅샷 폐기"""
+        with self._lock:
+            self._tree = None
+            self._converted = {}
@@ -0,0 +1,172 @@
+"""
+프리페치 스케줄러 모듈 - 자주 조회되는 시장 페이지를 백그라운드에서 미리 갱신
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dtime
+from typing import Any, Callable, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+from core.rate_limiter import background
+
+
+# 거래 세션별 (시간대, 개장, 폐장) - 주말은 휴장으로 간주 (공휴일은 미반영)
+MARKET_SESSIONS: Dict[str, Tuple[ZoneInfo, dtime, dtime]] = {
+    "krx": (ZoneInfo("Asia/Seoul"), dtime(9, 0), dtime(15, 30)),
+    "us": (ZoneInfo("America/New_York"), dtime(9, 30), dtime(16, 0)),
+}
+
+# 값이 "0"이면 서버 시작 시 백그라운드 갱신을 하지 않음
+PREFETCH_ENV = "SEARCH_ECONOMY_PREFETCH"
+
+
+def prefetch_enabled() -> bool:
+    """환경 변수로 백그라운드 갱신 사용 여부 확인 (기본값: 사용)"""
+    return os.environ.get(PREFETCH_ENV, "1") != "0"
+
+
+def is_market_open(session: Optional[str], now: Optional[datetime] = None) -> bool:
+    """거래 세션 개장 여부 (session이 None이면 항상 개장으로 간주)"""
+    if session is None:
+        return True
+    zone, open_at, close_at = MARKET_SESSIONS[session]
+    local = (now or datetime.now(tz=zone)).astimezone(zone)
+    return local.weekday() < 5 and open_at <= local.time() < close_at
+
+
+class PrefetchJob:
+    """주기적으로 갱신되는 단일 작업과 최신 스냅샷"""
+    
+    def __init__(self, name: str, fn: Callable[[], Any], interval: float,
+                 session: Optional[str] = None, off_hours_interval: float = 600):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.session = session
+        self.off_hours_interval = off_hours_interval
+        self.value: Any = None
+        self.updated_at = 0.0
+        self.next_run = 0.0
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+    
+    def current_interval(self) -> float:
+        """장중/장외에 따른 현재 갱신 주기"""
+        return self.interval if is_market_open(self.session) else max(self.interval, self.off_hours_interval)
+    
+    def is_fresh(self) -> bool:
+        """스냅샷이 제공 가능한 신선도인지 (현재 갱신 주기의 2배 이내)"""
+        return self.value is not None and time.monotonic() - self.updated_at <= self.current_interval() * 2
+
+
+class PrefetchScheduler:
+    """등록된 작업을 주기적으로 실행하고 최신 결과를 메모리에 보관하는 스케줄러"""
+    
+    def __init__(self, max_workers: int = 4):
+        self._jobs: Dict[str, PrefetchJob] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def register(self, name: str, fn: Callable[[], Any], interval: float,
+                 session: Optional[str] = None, off_hours_interval: float = 600) -> None:
+        """갱신 작업 등록 (같은 이름이면 교체)"""
+        with self._lock:
+            self._jobs[name] = PrefetchJob(name, fn, interval, session, off_hours_interval)
+        self._wakeup.set()
+    
+    def get(self, name: str) -> Any:
+        """최신 스냅샷 반환 (스케줄러가 멈췄거나 스냅샷이 없거나 오래되었으면 None)"""
+        job = self._jobs.get(name)
+        if job is None or not self.running or not job.is_fresh():
+            return None
+        return job.value
+    
+    def refresh(self, name: str) -> Any:
+        """작업을 즉시 실행하고 결과 반환"""
+        job = self._jobs[name]
+        self._run_job(job)
+        return job.value
+    
+    def start(self) -> None:
+        """백그라운드 스레드 시작"""
+        if self.running:
+            return
+        self._stopped.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="prefetch")
+        self._thread = threading.Thread(target=self._loop, name="prefetch-scheduler", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """백그라운드 스레드 종료"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """작업별 실행 통계 반환"""
+        now = time.monotonic()
+        return {
+            job.name: {
+                "interval": job.current_interval(),
+                "age": round(now - job.updated_at, 1) if job.updated_at else None,
+                "fresh": job.is_fresh(),
+                "runs": job.runs,
+                "failures": job.failures,
+            }
+            for job in list(self._jobs.values())
+        }
+    
+    def _loop(self) -> None:
+        """실행 시각이 된 작업을 제출하고 다음 실행 시각까지 대기"""
+        while not self._stopped.is_set():
+            now = time.monotonic()
+            next_wakeup = now + 60
+            with self._lock:
+                jobs = list(self._jobs.values())
+            for job in jobs:
+                if job.running:
+                    continue
+                if job.next_run <= now:
+                    job.running = True
+                    self._executor.submit(self._run_job, job)
+                else:
+                    next_wakeup = min(next_wakeup, job.next_run)
+            self._wakeup.wait(max(0.05, next_wakeup - time.monotonic()))
+            self._wakeup.clear()
+    
+    def _run_job(self, job: PrefetchJob) -> None:
+        """작업 실행 후 결과가 있으면 스냅샷 교체 (빈 결과나 실패 시 이전 스냅샷 유지)"""
+        job.running = True
+        try:
+            # 갱신 요청은 대화형 요청보다 늦게 토큰을 받음
+            with background():
+                value = job.fn()
+            job.runs += 1
+            if value:
+                job.value = value
+                job.updated_at = time.monotonic()
+            else:
+                job.failures += 1
+        except Exception as e:
+            job.failures += 1
+            logging.error(f"프리페치 실패 ({job.name}): {e}")
+        finally:
+            job.next_run = time.monotonic() + job.current_interval()
+            job.running = False
+            self._wakeup.set()
@@ -0,0 +1,187 @@
+"""
+요청 속도 제한 모듈 - 호스트별 토큰 버킷과 우선순위 대기열 (대화형 요청 > 백그라운드 갱신)
+"""
+import contextlib
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+# 우선순위 (값이 작을수록 먼저 토큰을 받음)
+INTERACTIVE = 0
+BACKGROUND = 1
+LANE_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("request_priority", default=INTERACTIVE)
+
+
+def current_priority() -> int:
+    """현재 실행 흐름의 요청 우선순위"""
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def background() -> Iterator[None]:
+    """블록 안의 요청을 백그라운드 우선순위로 보냄 (프리페치, 인덱스 갱신 등)"""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+# 호스트별 (초당 요청 수, 버스트 크기) - 목록에 없는 호스트는 기본값
+DEFAULT_HOST_RATES: Dict[str, Tuple[float, int]] = {
+    "finance.naver.com": (10.0, 20),
+    "finance.yahoo.com": (5.0, 10),
+    "comp.fnguide.com": (5.0, 10),
+    "api.coingecko.com": (0.5, 5),
+    "www.marketwatch.com": (2.0, 4),
+}
+
+
+class LaneStats:
+    """우선순위별 대기 시간 통계"""
+    
+    __slots__ = ("acquired", "delayed", "total_wait", "max_wait")
+    
+    def __init__(self):
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def record(self, waited: float) -> None:
+        self.acquired += 1
+        if waited > 0.001:
+            self.delayed += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "avg_wait": round(self.total_wait / self.acquired, 4) if self.acquired else 0.0,
+            "max_wait": round(self.max_wait, 4),
+        }
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷
+    
+    토큰이 없으면 실패하지 않고 대기하며, 대기자는 (우선순위, 도착 순서)대로 토큰을 받습니다.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self._waiters: list = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self.lanes = {priority: LaneStats() for priority in LANE_NAMES}
+    
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 보충 (조건 변수 락 보유 상태에서 호출)"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def try_acquire(self, priority: int = INTERACTIVE) -> bool:
+        """대기자가 없고 토큰이 있으면 바로 하나 사용 (기다리지 않음)"""
+        with self._condition:
+            self._refill()
+            if self._waiters or self.tokens < 1:
+                return False
+            self.tokens -= 1
+            self.lanes[priority].record(0.0)
+            return True
+    
+    def acquire(self, priority: int = INTERACTIVE) -> float:
+        """토큰 하나를 받을 때까지 대기하고 대기한 시간(초) 반환"""
+        started = time.monotonic()
+        with self._condition:
+            entry = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    self._refill()
+                    is_next = self._waiters[0] == entry
+                    if is_next and self.tokens >= 1:
+                        self.tokens -= 1
+                        heapq.heappop(self._waiters)
+                        break
+                    # 맨 앞 대기자만 다음 토큰 시각까지 자고, 나머지는 앞 대기자가 깨워줄 때까지 대기
+                    self._condition.wait((1 - self.tokens) / self.rate if is_next else None)
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                self._condition.notify_all()
+            waited = time.monotonic() - started
+            self.lanes[priority].record(waited)
+        return waited
+    
+    def stats(self) -> Dict[str, Any]:
+        """버킷 상태와 우선순위별 대기 통계 반환"""
+        with self._condition:
+            self._refill()
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tokens": round(self.tokens, 2),
+                "queued": len(self._waiters),
+                **{LANE_NAMES[priority]: lane.to_dict() for priority, lane in self.lanes.items()},
+            }
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷으로 외부 요청 속도를 원본 서버가 허용하는 범위로 제한하는 클래스
+    
+    default_rate가 None이면 host_rates에 없는 호스트는 제한하지 않습니다.
+    """
+    
+    def __init__(self, host_rates: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default_rate: Optional[Tuple[float, int]] = (10.0, 20)):
+        self.host_rates = dict(DEFAULT_HOST_RATES if host_rates is None else host_rates)
+        self.default_rate = default_rate
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+    
+    def bucket(self, host: str) -> Optional[TokenBucket]:
+        """호스트의 토큰 버킷 반환 (제한하지 않는 호스트면 None)"""
+        with self._lock:
+            if host not in self._buckets:
+                rate = self.host_rates.get(host, self.default_rate)
+                self._buckets[host] = TokenBucket(*rate) if rate and rate[0] > 0 else None
+            return self._buckets[host]
+    
+    def try_acquire(self, host: str, priority: Optional[int] = None) -> bool:
+        """기다리지 않고 토큰을 받을 수 있으면 사용"""
+        bucket = self.bucket(host)
+        if bucket is None:
+            return True
+        return bucket.try_acquire(current_priority() if priority is None else priority)
+    
+    def acquire(self, host: str, priority: Optional[int] = None) -> float:
+        """호스트의 토큰을 받을 때까지 대기 (priority가 없으면 현재 실행 흐름의 우선순위)"""
+        bucket = self.bucket(host)
+        if bucket is None:
+            return 0.0
+        return bucket.acquire(current_priority() if priority is None else priority)
+    
+    def stats(self) -> Dict[str, Any]:
+        """호스트별 버킷 상태 반환"""
+        with self._lock:
+            buckets = [(host, bucket) for host, bucket in self._buckets.items() if bucket is not None]
+        return {host: bucket.stats() for host, bucket in buckets}
+
+
+# 싱글톤 인스턴스 (모든 HTTP 클라이언트가 호스트별 토큰을 공유)
+rate_limiter = RateLimiter()
@@ -0,0 +1,127 @@
+"""
+구조화 레코드 모듈 - 테이블 행을 마크다운 대신 타입이 있는 간결한 레코드로 변환
+"""
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from lxml import html
+from core.table_extractor import iter_table_rows
+
+
+# 구조화 모드에서는 레코드 딕셔너리 목록, 기본 모드에서는 마크다운 문자열
+TableResult = Union[str, List[Dict[str, Any]]]
+
+# 레코드 필드별 헤더 별칭 (소문자 비교)
+COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "symbol": ("symbol", "심볼", "티커"),
+    "name": ("name", "종목명", "업종명", "구분", "통화명"),
+    "price": ("price", "last price", "price (intraday)", "현재가", "금리", "매매기준율"),
+    "change": ("change", "전일비", "전일대비"),
+    "change_pct": ("change %", "% change", "등락률"),
+    "volume": ("volume", "거래량"),
+}
+
+NUMBER_PATTERN = re.compile(r'[-+]?\d[\d,]*(?:\.\d+)?|[-+]?\.\d+')
+NEGATIVE_MARKERS = ('하락', '하한', '▼')
+
+
+def parse_number(text: Optional[str]) -> Optional[float]:
+    """셀 텍스트에서 첫 번째 숫자 추출 ('하락 1,000' -> -1000.0, '+1.45%' -> 1.45)"""
+    if not text:
+        return None
+    match = NUMBER_PATTERN.search(text)
+    if match is None:
+        return None
+    value = float(match.group().replace(',', ''))
+    if value > 0 and any(marker in text for marker in NEGATIVE_MARKERS):
+        value = -value
+    return value
+
+
+class MarketRecord:
+    """종목/지수/금리 한 행을 표현하는 레코드 (이름, 가격, 변동, 등락률, 거래량)"""
+    
+    __slots__ = ("symbol", "name", "price", "change", "change_pct", "volume")
+    
+    def __init__(self, symbol: Optional[str] = None, name: Optional[str] = None,
+                 price: Optional[float] = None, change: Optional[float] = None,
+                 change_pct: Optional[float] = None, volume: Optional[int] = None):
+        self.symbol = symbol
+        self.name = name
+        self.price = price
+        self.change = change
+        self.change_pct = change_pct
+        self.volume = volume
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """값이 있는 필드만 담은 딕셔너리 반환"""
+        result = {}
+        for field in self.__slots__:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = value
+        return result
+    
+    def __repr__(self) -> str:
+        return f"MarketRecord({self.to_dict()})"
+
+
+def map_columns(header: List[str]) -> Dict[str, int]:
+    """헤더 셀 목록에서 레코드 필드별 컬럼 위치 찾기"""
+    columns: Dict[str, int] = {}
+    for index, cell in enumerate(header):
+        label = cell.strip().lower()
+        for field, aliases in COLUMN_ALIASES.items():
+            if field not in columns and label in aliases:
+                columns[field] = index
+                break
+    return columns
+
+
+def record_from_cells(cells: List[str], columns: Dict[str, int]) -> Optional[MarketRecord]:
+    """컬럼 매핑에 따라 셀 목록을 레코드로 변환 (이름이나 심볼이 없으면 None)"""
+    def cell(field: str) -> Optional[str]:
+        index = columns.get(field)
+        if index is None or index >= len(cells):
+            return None
+        return cells[index] or None
+    
+    symbol, name = cell("symbol"), cell("name")
+    if symbol is None and name is None:
+        return None
+    volume = parse_number(cell("volume"))
+    return MarketRecord(
+        symbol=symbol,
+        name=name,
+        price=parse_number(cell("price")),
+        change=parse_number(cell("change")),
+        change_pct=parse_number(cell("change_pct")),
+        volume=int(volume) if volume is not None else None,
+    )
+
+
+def extract_records(element: html.HtmlElement, max_rows: Optional[int] = None,
+                    row_filter: Optional[Callable[[List[str]], bool]] = None) -> List[MarketRecord]:
+    """요소 하위의 테이블 행을 순회하며 레코드로 변환 (첫 헤더 행으로 컬럼 매핑, max_rows개에서 중단)
+    
+    헤더 행은 row_filter와 무관하게 컬럼 매핑에 사용되고, 필터는 데이터 행에만 적용됩니다.
+    """
+    columns: Dict[str, int] = {}
+    records: List[MarketRecord] = []
+    for cells, is_header in iter_table_rows(element):
+        if not columns:
+            # 헤더를 찾기 전의 행(캡션 등)은 건너뜀
+            mapped = map_columns(cells)
+            if is_header or (("name" in mapped or "symbol" in mapped) and "price" in mapped):
+                columns = mapped
+            continue
+        if is_header:
+            continue
+        if row_filter is not None and not row_filter(cells):
+            continue
+        record = record_from_cells(cells, columns)
+        if record is None:
+            continue
+        records.append(record)
+        if max_rows is not None and len(records) >= max_rows:
+            break
+    return records
@@ -0,0 +1,230 @@
+"""
+복원력 정책 모듈 - 호스트별 타임아웃, 지터 지수 백오프 재시도, 서킷 브레이커
+"""
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# 재시도해도 되는 요청 메서드 (멱등)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# 일시적 장애로 보고 재시도하는 응답 코드
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않고 즉시 실패"""
+    
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 서킷 열림 ({retry_in:.1f}초 후 재시도)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class HostPolicy:
+    """호스트별 타임아웃과 재시도 설정"""
+    
+    __slots__ = ("connect_timeout", "read_timeout", "retries", "backoff", "max_backoff")
+    
+    def __init__(self, connect_timeout: float = 3.05, read_timeout: float = 20.0, retries: int = 2,
+                 backoff: float = 0.3, max_backoff: float = 5.0):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+    
+    def timeout(self, read_timeout: Optional[float] = None) -> Tuple[float, float]:
+        """requests용 (연결, 읽기) 타임아웃 (read_timeout이 주어지면 읽기 타임아웃만 교체)"""
+        return self.connect_timeout, self.read_timeout if read_timeout is None else read_timeout
+    
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt번째 재시도 전 대기 시간 (full jitter, Retry-After가 있으면 그 값을 우선)"""
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+
+# 호스트별 정책 (목록에 없는 호스트는 기본 정책)
+DEFAULT_HOST_POLICIES: Dict[str, HostPolicy] = {
+    "finance.naver.com": HostPolicy(read_timeout=10.0),
+    "finance.yahoo.com": HostPolicy(read_timeout=15.0),
+    "comp.fnguide.com": HostPolicy(read_timeout=15.0),
+    "api.coingecko.com": HostPolicy(read_timeout=10.0, backoff=1.0, max_backoff=10.0),
+    "www.marketwatch.com": HostPolicy(read_timeout=10.0, retries=1),
+}
+
+
+class CircuitBreaker:
+    """연속 실패가 임계값에 이르면 일정 시간 요청을 차단하고, 이후 한 건의 시험 요청으로 복구 여부 판단
+    
+    상태: closed(정상) -> open(차단) -> half_open(시험 요청 1건) -> closed 또는 open
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.short_circuited = 0
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def retry_in(self) -> float:
+        """차단이 풀릴 때까지 남은 시간"""
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+    
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인 (open 상태가 reset_timeout을 지나면 시험 요청 1건 허용)"""
+        with self._lock:
+            if self.state == self.OPEN and self.retry_in() <= 0:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.short_circuited += 1
+            return False
+    
+    def record_success(self) -> None:
+        """성공 기록 (시험 요청이 성공하면 닫힘)"""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+            self._probing = False
+    
+    def record_failure(self) -> None:
+        """실패 기록 (임계값 도달 또는 시험 요청 실패 시 열림)"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.trips += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._probing = False
+    
+    def stats(self) -> Dict[str, Any]:
+        """브레이커 상태 반환"""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "trips": self.trips,
+                "short_circuited": self.short_circuited,
+                "retry_in": round(self.retry_in(), 1) if self.state == self.OPEN else 0.0,
+            }
+
+
+class Resilience:
+    """모든 외부 요청에 호스트별 타임아웃, 재시도, 서킷 브레이커를 적용하는 정책 엔진"""
+    
+    def __init__(self, host_policies: Optional[Dict[str, HostPolicy]] = None,
+                 default_policy: Optional[HostPolicy] = None,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.host_policies = dict(DEFAULT_HOST_POLICIES if host_policies is None else host_policies)
+        self.default_policy = default_policy or HostPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).hostname or ""
+    
+    def policy(self, host: str) -> HostPolicy:
+        """호스트의 정책 반환"""
+        return self.host_policies.get(host, self.default_policy)
+    
+    def breaker(self, host: str) -> CircuitBreaker:
+        """호스트의 서킷 브레이커 반환 (첫 호출 시 생성)"""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+                self._counters[host] = {"requests": 0, "retries": 0, "timeouts": 0, "failures": 0}
+            return breaker
+    
+    def count(self, host: str, name: str) -> None:
+        """호스트별 카운터 증가"""
+        with self._lock:
+            counters = self._counters.get(host)
+            if counters is not None:
+                counters[name] += 1
+    
+    @staticmethod
+    def retry_after(headers: Any) -> Optional[float]:
+        """Retry-After 헤더의 초 단위 값 (날짜 형식이거나 없으면 None)"""
+        value = headers.get("Retry-After") if headers is not None else None
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+    
+    def call(self, method: str, url: str, send: Callable[[Tuple[float, float]], Any],
+             read_timeout: Optional[float] = None) -> Any:
+        """send(timeout)로 요청을 보내고 응답 반환 (멱등 요청만 재시도, 서킷이 열려 있으면 CircuitOpenError)
+        
+        재시도 후에도 5xx/429이면 그 응답을 그대로 반환하므로 호출자가 raise_for_status로 처리합니다.
+        """
+        host = self.host_of(url)
+        policy = self.policy(host)
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            raise CircuitOpenError(host, breaker.retry_in())
+        self.count(host, "requests")
+        
+        retries = policy.retries if method.upper() in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                response = send(policy.timeout(read_timeout))
+            except Exception as e:
+                if "timeout" in type(e).__name__.lower():
+                    self.count(host, "timeouts")
+                if attempt >= retries:
+                    self.count(host, "failures")
+                    breaker.record_failure()
+                    raise
+                retry_after = None
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                if attempt >= retries:
+                    self.count(host, "failures")
+                    breaker.record_failure()
+                    return response
+                retry_after = self.retry_after(response.headers)
+                response.close()
+            
+            delay = policy.delay(attempt, retry_after)
+            attempt += 1
+            self.count(host, "retries")
+            logging.debug(f"{host} 요청 재시도 {attempt}/{retries} ({delay:.2f}초 후): {url}")
+            time.sleep(delay)
+    
+    def stats(self) -> Dict[str, Any]:
+        """호스트별 브레이커 상태와 요청/재시도/타임아웃/실패 횟수 반환"""
+        with self._lock:
+            items = [(host, breaker, dict(self._counters[host])) for host, breaker in self._breakers.items()]
+        return {host: {**counters, **breaker.stats()} for host, breaker, counters in items}
+
+
+# 싱글톤 인스턴스 (모든 HTTP 클라이언트가 호스트별 브레이커 상태를 공유)
+resilience = Resilience()
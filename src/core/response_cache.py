@@ -0,0 +1,101 @@
+"""
+응답 캐시 모듈 - TTL 기반 LRU 인메모리 캐시
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# (호스트, 경로 접두사, TTL 초) - 위에서부터 처음 일치하는 규칙 적용
+DEFAULT_TTL_RULES: List[Tuple[str, str, float]] = [
+    ("finance.naver.com", "/sise", 5),
+    ("finance.naver.com", "/item/main.naver", 5),
+    ("finance.naver.com", "/item/news_notice.naver", 300),
+    ("finance.naver.com", "/marketindex", 30),
+    ("finance.naver.com", "/search", 600),
+    ("comp.fnguide.com", "/SVO2/ASP/SVD_Corp.asp", 6 * 3600),
+    ("comp.fnguide.com", "/SVO2/ASP/SVD_Finance.asp", 6 * 3600),
+    ("comp.fnguide.com", "/SVO2/ASP/SVD_FinanceRatio.asp", 6 * 3600),
+    ("comp.fnguide.com", "/SVO2/ASP/SVD_Invest.asp", 3600),
+    ("comp.fnguide.com", "", 600),
+    ("finance.yahoo.com", "/quote", 5),
+    ("finance.yahoo.com", "/lookup", 600),
+    ("finance.yahoo.com", "", 30),
+    ("www.marketwatch.com", "", 300),
+    ("kr.investing.com", "", 15),
+]
+
+
+class ResponseCache:
+    """URL + 인코딩 키 기반의 TTL LRU 캐시"""
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 10,
+                 ttl_rules: Optional[List[Tuple[str, str, float]]] = None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttl_rules = list(DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, url: str) -> float:
+        """URL에 적용할 TTL(초) 반환"""
+        parts = urlsplit(url)
+        for host, path_prefix, ttl in self.ttl_rules:
+            if parts.hostname == host and parts.path.startswith(path_prefix):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """유효한 캐시 값 반환 (없거나 만료 시 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """캐시에 값 저장 (TTL이 0 이하이면 저장하지 않음)"""
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키 삭제"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
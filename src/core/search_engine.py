@@ -0,0 +1,439 @@
+"""
+티커 검색 엔진 모듈 - n-gram 역색인과 편집 거리 기반의 한글 인식 퍼지 검색
+"""
+import heapq
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 한글 음절 분해용 자모 (유니코드 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 한글 표기 <-> 영문 표기 별칭 (검색어에 한쪽이 있으면 다른 쪽으로도 검색)
+ALIASES: Dict[str, str] = {
+    "삼성": "samsung", "현대": "hyundai", "기아": "kia", "엘지": "lg", "에스케이": "sk",
+    "카카오": "kakao", "네이버": "naver", "셀트리온": "celltrion", "포스코": "posco",
+    "한화": "hanwha", "롯데": "lotte", "두산": "doosan", "신한": "shinhan", "하나": "hana",
+    "애플": "apple", "테슬라": "tesla", "마이크로소프트": "microsoft", "엔비디아": "nvidia",
+    "아마존": "amazon", "구글": "google", "알파벳": "alphabet", "메타": "meta",
+    "넷플릭스": "netflix", "인텔": "intel", "코카콜라": "cocacola", "버크셔": "berkshire",
+    "비트코인": "bitcoin", "이더리움": "ethereum", "리플": "ripple", "솔라나": "solana",
+    "도지코인": "dogecoin", "에이다": "cardano", "카르다노": "cardano", "테더": "tether",
+}
+
+NON_WORD_PATTERN = re.compile(r'[\s\.,\-_()&/\'"]+')
+NONZERO_BYTE_PATTERN = re.compile(rb'[^\x00]')
+
+# 퍼지 일치를 검색 결과 목록에 넣는 최소 점수 (정확/접두어 일치는 점수와 무관하게 포함)
+MIN_SCORE = 0.5
+
+# 웹 검색으로 넘어가지 않고 로컬 결과로 답할 만큼 확실한 퍼지 일치 점수
+CONFIDENT_SCORE = 0.8
+
+# 일치 종류 (정렬 시 점수보다 먼저 비교)
+EXACT = "exact"
+PREFIX = "prefix"
+FUZZY = "fuzzy"
+MATCH_TIERS = {EXACT: 0, PREFIX: 1, FUZZY: 2}
+# 로컬 색인에 없어 웹 검색으로 찾은 결과
+WEB = "web"
+
+# 종목코드/티커 형태의 검색어 ('005930', 'AAPL', 'BRK.B', '^GSPC', 'BTC-USD', 'GC=F')
+SYMBOL_QUERY_PATTERN = re.compile(r'^(?:\d[0-9A-Z]{3,7}|\^?[A-Z][A-Z0-9]{0,5}(?:[.\-=][A-Z0-9]{1,4})?)$')
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 자모 단위로 분해 ('삼성' -> 'ㅅㅏㅁㅅㅓㅇ')"""
+    result = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            result.append(CHOSEONG[code // 588])
+            result.append(JUNGSEONG[(code % 588) // 28])
+            result.append(JONGSEONG[code % 28])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def normalize(text: str) -> str:
+    """소문자 변환 후 공백과 구두점 제거"""
+    return NON_WORD_PATTERN.sub('', text.lower())
+
+
+def search_form(text: str) -> str:
+    """색인/검색에 쓰는 형태 (정규화 + 자모 분해)"""
+    return decompose_hangul(normalize(text))
+
+
+def is_symbol_query(query: str) -> bool:
+    """종목코드나 대문자 티커처럼 생긴 검색어인지 (이런 검색어는 정확 일치만 결과로 인정)"""
+    return bool(SYMBOL_QUERY_PATTERN.match(query.strip()))
+
+
+def match_type(query: str, key: str) -> str:
+    """검색 형태끼리의 일치 종류"""
+    if query == key:
+        return EXACT
+    if key.startswith(query):
+        return PREFIX
+    return FUZZY
+
+
+def expand_aliases(text: str) -> List[str]:
+    """별칭 사전으로 한글/영문 표기 변형 생성"""
+    normalized = normalize(text)
+    variants = [normalized]
+    for korean, english in ALIASES.items():
+        for source, target in ((korean, english), (english, korean)):
+            if source in normalized:
+                variant = normalized.replace(source, target)
+                if variant not in variants:
+                    variants.append(variant)
+    return variants
+
+
+def bigrams(form: str) -> List[str]:
+    """앞뒤 경계를 포함한 문자 bigram 목록 (중복 제거)"""
+    padded = f" {form} "
+    return list(dict.fromkeys(padded[i:i + 2] for i in range(len(padded) - 1)))
+
+
+def pattern_masks(pattern: str) -> Dict[str, int]:
+    """문자별 위치 비트마스크 (비트 병렬 편집 거리 계산용, 검색어당 1회 생성)"""
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def edit_distances(pattern: str, text: str, masks: Optional[Dict[str, int]] = None) -> Tuple[int, int]:
+    """(pattern과 text 전체의 편집 거리, pattern과 text 접두어들 사이의 최소 편집 거리)
+    
+    Myers/Hyyrö 비트 병렬 알고리즘으로 text 한 글자당 정수 연산 몇 번으로 계산합니다.
+    """
+    length = len(pattern)
+    if not length:
+        return len(text), 0
+    masks = masks if masks is not None else pattern_masks(pattern)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    vp, vn, score = full, 0, length
+    best = length
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & full
+        vn = hp & xv
+        if score < best:
+            best = score
+    return score, best
+
+
+def similarity(query: str, key: str, masks: Optional[Dict[str, int]] = None) -> float:
+    """검색어와 색인 키의 유사도 (정확 일치 1.0, 접두어 일치 가산, 그 외 편집 거리 기반)"""
+    if query == key:
+        return 1.0
+    distance, prefix_distance = edit_distances(query, key, masks)
+    score = 1 - distance / max(len(query), len(key))
+    prefix_score = 0.6 + 0.35 * len(query) / max(len(query), len(key))
+    if prefix_distance == 0:
+        score = max(score, prefix_score)
+    elif query in key:
+        score = max(score, 0.5 + 0.3 * len(query) / len(key))
+    else:
+        # 오타가 섞인 접두어 ('aple' -> 'apple inc')
+        ratio = 1 - prefix_distance / len(query)
+        if ratio >= 0.75:
+            score = max(score, prefix_score * ratio)
+    return score
+
+
+def make_record(payload: Dict[str, Any], universe: str, score: float, match: str) -> Dict[str, Any]:
+    """검색 결과 한 건 (결과 데이터 + universe, score, match) - 로컬/웹 결과 공통 형식"""
+    record = dict(payload)
+    record["universe"] = universe
+    record["score"] = round(score, 3)
+    record["match"] = match
+    return record
+
+
+class SearchDocument:
+    """검색 대상 한 건 (유니버스, 심볼, 이름, 결과로 돌려줄 데이터, 동점일 때의 우선순위)"""
+    
+    __slots__ = ("universe", "symbol", "name", "payload", "rank")
+    
+    def __init__(self, universe: str, symbol: str, name: str, payload: Dict[str, Any],
+                 rank: Optional[float] = None):
+        self.universe = universe
+        self.symbol = symbol
+        self.name = name
+        self.payload = payload
+        self.rank = rank if rank is not None else float("inf")
+
+
+class UniverseIndex:
+    """유니버스 하나의 bigram 역색인 (키마다 문서 번호와 검색 형태 보관)
+    
+    엔진에 게시된 뒤에는 바꾸지 않고 복사본에 추가해 교체하므로 검색은 락 없이 읽습니다.
+    bigram 비트 집합 캐시만 검색 중에 채워지며 별도 락으로 보호합니다.
+    """
+    
+    def __init__(self):
+        self.documents: List[SearchDocument] = []
+        self.key_forms: List[str] = []
+        self.key_documents: List[int] = []
+        self.key_sizes: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+        self.symbols: Dict[str, int] = {}
+        # bigram별 비트 집합 (처음 쓰일 때 생성)
+        self.bitsets: Dict[str, int] = {}
+        self._bits_lock = threading.Lock()
+    
+    def copy(self) -> "UniverseIndex":
+        """문서 추가용 복사본 (문서 객체와 만들어 둔 비트 집합은 공유)"""
+        index = UniverseIndex()
+        index.documents = list(self.documents)
+        index.key_forms = list(self.key_forms)
+        index.key_documents = list(self.key_documents)
+        index.key_sizes = list(self.key_sizes)
+        index.postings = {gram: list(posting) for gram, posting in self.postings.items()}
+        index.symbols = dict(self.symbols)
+        with self._bits_lock:
+            index.bitsets = dict(self.bitsets)
+        return index
+    
+    def add(self, document: SearchDocument, names: Iterable[str]) -> None:
+        """문서와 색인 키(심볼, 이름, 별칭) 추가"""
+        doc_id = len(self.documents)
+        self.documents.append(document)
+        # 같은 심볼이 여럿이면 먼저 추가된(우선순위가 높은) 문서가 심볼 정확 일치를 차지
+        self.symbols.setdefault(normalize(document.symbol), doc_id)
+        for name in dict.fromkeys(search_form(name) for name in names):
+            if not name:
+                continue
+            key_id = len(self.key_forms)
+            grams = bigrams(name)
+            self.key_forms.append(name)
+            self.key_documents.append(doc_id)
+            self.key_sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(key_id)
+                # 이미 만든 비트 집합에는 새 키를 바로 반영 (게시 전 복사본에서만 호출됨)
+                if gram in self.bitsets:
+                    self.bitsets[gram] |= 1 << key_id
+    
+    def gram_bits(self, gram: str) -> int:
+        """bigram이 들어 있는 키 번호들의 비트 집합 (처음 쓰일 때 한 번만 생성)"""
+        bits = self.bitsets.get(gram)
+        if bits is not None:
+            return bits
+        with self._bits_lock:
+            bits = self.bitsets.get(gram)
+            if bits is None:
+                posting = self.postings.get(gram, ())
+                data = bytearray(posting[-1] // 8 + 1 if posting else 0)
+                for key_id in posting:
+                    data[key_id >> 3] |= 1 << (key_id & 7)
+                bits = int.from_bytes(data, "little")
+                self.bitsets[gram] = bits
+        return bits
+    
+    def candidates(self, form: str, limit: int) -> List[int]:
+        """bigram 겹침(Dice 계수) 상위 키 번호 목록
+        
+        키별 겹침 수를 비트 집합 덧셈(비트 슬라이스)으로 한꺼번에 세므로, 흔한 bigram의 긴 posting도 키 하나씩 훑지 않습니다.
+        """
+        all_grams = bigrams(form)
+        size = len(all_grams)
+        grams = [gram for gram in all_grams if gram in self.postings]
+        # 검색어 bigram의 절반도 공유하지 않는 키는 점수 계산 전에 제외
+        minimum = max(1, (size + 1) // 2)
+        if len(grams) < minimum:
+            return []
+        # slices[i]: 겹침 수의 i번째 비트가 1인 키들
+        slices: List[int] = []
+        present = 0
+        for gram in grams:
+            carry = self.gram_bits(gram)
+            present |= carry
+            for i, bits in enumerate(slices):
+                slices[i], carry = bits ^ carry, bits & carry
+                if not carry:
+                    break
+            if carry:
+                slices.append(carry)
+        # 겹침 수 >= minimum 인 키들 (상위 비트부터 비교)
+        greater, equal = 0, present
+        for i in reversed(range(max(len(slices), minimum.bit_length()))):
+            bits = slices[i] if i < len(slices) else 0
+            if minimum >> i & 1:
+                equal &= bits
+            else:
+                greater |= equal & bits
+                equal &= ~bits
+        matched = greater | equal
+        if not matched:
+            return []
+        width = (present.bit_length() + 7) // 8
+        slice_bytes = [bits.to_bytes(width, "little") for bits in slices]
+        key_sizes = self.key_sizes
+        scored = []
+        for found in NONZERO_BYTE_PATTERN.finditer(matched.to_bytes(width, "little")):
+            position = found.start()
+            byte = found.group()[0]
+            while byte:
+                low = byte & -byte
+                offset = low.bit_length() - 1
+                byte ^= low
+                key_id = (position << 3) | offset
+                count = sum(1 << i for i, data in enumerate(slice_bytes) if data[position] & low)
+                scored.append((2 * count / (size + key_sizes[key_id]), key_id))
+        return [key_id for _, key_id in heapq.nlargest(limit, scored)]
+
+
+class SearchEngine:
+    """국내/해외/암호화폐 티커를 함께 검색하는 메모리 검색 엔진"""
+    
+    def __init__(self, candidate_limit: int = 40, memo_size: int = 4096):
+        self.candidate_limit = candidate_limit
+        self.memo_size = memo_size
+        self._universes: Dict[str, UniverseIndex] = {}
+        self._versions: Dict[str, Any] = {}
+        self._memo: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 색인이 바뀔 때마다 증가 (바뀌기 전 색인으로 계산한 결과는 메모에 넣지 않음)
+        self._generation = 0
+        self.lookups = 0
+        self.memo_hits = 0
+    
+    def version(self, universe: str) -> Any:
+        """유니버스 데이터 버전 (원본 갱신 여부 판단용)"""
+        return self._versions.get(universe)
+    
+    def replace_universe(self, universe: str,
+                         documents: Iterable[Tuple[str, str, Sequence[str], Dict[str, Any], Optional[float]]],
+                         version: Any = None) -> None:
+        """유니버스 전체를 (심볼, 이름, 추가 이름들, 결과 데이터, 우선순위) 목록으로 교체"""
+        index = UniverseIndex()
+        for symbol, name, extra_names, payload, rank in documents:
+            index.add(SearchDocument(universe, symbol, name, payload, rank), [symbol, name, *extra_names])
+        with self._lock:
+            self._universes[universe] = index
+            self._versions[universe] = version
+            self._generation += 1
+            self._memo.clear()
+    
+    def add(self, universe: str, symbol: str, name: str, extra_names: Sequence[str] = (),
+            payload: Optional[Dict[str, Any]] = None) -> None:
+        """문서 한 건 추가 (이미 있는 심볼이면 무시) - 웹 검색 결과 학습용
+        
+        검색 중인 스레드가 보는 색인은 그대로 두고, 복사본에 추가한 뒤 교체합니다.
+        """
+        with self._lock:
+            current = self._universes.get(universe)
+            if current is not None and normalize(symbol) in current.symbols:
+                return
+            index = current.copy() if current is not None else UniverseIndex()
+            payload = payload if payload is not None else {"ticker": symbol, "name": name}
+            index.add(SearchDocument(universe, symbol, name, payload), [symbol, name, *extra_names])
+            self._universes[universe] = index
+            self._generation += 1
+            self._memo.clear()
+    
+    def learn(self, query: str, universe: str, results: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """웹 검색 결과를 색인에 추가하고 search()와 같은 형식(universe, score, match='web')으로 반환"""
+        forms = [form for form in (search_form(variant) for variant in expand_aliases(query)) if form]
+        records = []
+        for result in results:
+            symbol = result.get("ticker") or result.get("symbol")
+            name = result.get("name")
+            if symbol and name:
+                self.add(universe, symbol, name, payload=result)
+            keys = [search_form(key) for key in (symbol, name) if key]
+            score = max((similarity(form, key) for form in forms for key in keys if key), default=0.0)
+            records.append(make_record(result, universe, score, WEB))
+        return records
+    
+    def search(self, query: str, universes: Optional[Sequence[str]] = None, limit: int = 10,
+               min_score: float = MIN_SCORE) -> List[Dict[str, Any]]:
+        """정확 일치 -> 접두어 일치 -> 퍼지 일치(점수 순) 순으로 정렬된 검색 결과 (각 결과에 universe, score, match 포함)
+        
+        min_score는 퍼지 일치에만 적용합니다. 종목코드/티커 형태의 검색어는 심볼이나 이름이 정확히 같은 결과만 반환합니다.
+        """
+        universes = tuple(universes) if universes else tuple(sorted(self._universes))
+        memo_key = (query, universes, limit, min_score)
+        with self._lock:
+            self.lookups += 1
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+                self.memo_hits += 1
+                return [dict(result) for result in cached]
+            indexes = {name: self._universes[name] for name in universes if name in self._universes}
+            generation = self._generation
+        
+        exact_only = is_symbol_query(query)
+        variants = [(variant, search_form(variant)) for variant in expand_aliases(query)]
+        variants = [(variant, form, pattern_masks(form)) for variant, form in variants if form]
+        scored: List[Tuple[int, float, str, int]] = []
+        for universe, index in indexes.items():
+            # 문서별 (일치 등급, 점수) 중 가장 좋은 값
+            best: Dict[int, Tuple[int, float]] = {}
+            for variant, form, masks in variants:
+                doc_id = index.symbols.get(variant)
+                if doc_id is not None:
+                    best[doc_id] = (MATCH_TIERS[EXACT], 1.0)
+                for key_id in index.candidates(form, self.candidate_limit):
+                    doc_id = index.key_documents[key_id]
+                    key = index.key_forms[key_id]
+                    candidate = (MATCH_TIERS[match_type(form, key)], similarity(form, key, masks))
+                    current = best.get(doc_id)
+                    if current is None or (candidate[0], -candidate[1]) < (current[0], -current[1]):
+                        best[doc_id] = candidate
+            for doc_id, (tier, score) in best.items():
+                if exact_only and tier != MATCH_TIERS[EXACT]:
+                    continue
+                if tier == MATCH_TIERS[FUZZY] and score < min_score:
+                    continue
+                scored.append((tier, score, universe, doc_id))
+        
+        def order(item):
+            document = indexes[item[2]].documents[item[3]]
+            return item[0], -item[1], document.rank, len(document.name)
+        
+        tier_names = {tier: name for name, tier in MATCH_TIERS.items()}
+        scored.sort(key=order)
+        results = []
+        for tier, score, universe, doc_id in scored[:limit]:
+            results.append(make_record(indexes[universe].documents[doc_id].payload, universe, score,
+                                       tier_names[tier]))
+        
+        with self._lock:
+            if generation == self._generation:
+                self._memo[memo_key] = results
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return [dict(result) for result in results]
+    
+    def stats(self) -> Dict[str, Any]:
+        """유니버스별 문서 수와 메모 적중률 반환"""
+        return {
+            "universes": {name: len(index.documents) for name, index in self._universes.items()},
+            "lookups": self.lookups,
+            "memo_hits": self.memo_hits,
+            "memo_hit_ratio": round(self.memo_hits / self.lookups, 3) if self.lookups else 0.0,
+        }
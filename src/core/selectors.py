@@ -0,0 +1,162 @@
+"""
+선택자 저장소 모듈 - 사이트별로 버전을 붙여 미리 컴파일한 XPath와 정규식을 보관하고 실행 중 교체
+"""
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Pattern, Union
+from lxml import etree
+
+
+# 문자열 XPath 또는 컴파일된 XPath
+XPathLike = Union[str, etree.XPath]
+
+
+def select(tree: etree._Element, xpath: XPathLike) -> Any:
+    """컴파일된 XPath면 그대로 실행하고, 문자열이면 tree.xpath로 실행"""
+    return xpath(tree) if isinstance(xpath, etree.XPath) else tree.xpath(xpath)
+
+
+class SelectorSet:
+    """한 사이트의 특정 버전 선택자 묶음 (이름 -> 컴파일된 XPath/정규식)"""
+    
+    __slots__ = ("site", "version", "xpaths", "patterns", "sources", "registered_at")
+    
+    def __init__(self, site: str, version: str, xpaths: Dict[str, str], patterns: Dict[str, str],
+                 base: Optional["SelectorSet"] = None):
+        self.site = site
+        self.version = version
+        # 새 버전에 없는 이름은 기준 버전에서 물려받음 (바뀐 선택자만 교체 가능)
+        self.sources: Dict[str, Dict[str, str]] = {
+            "xpaths": {**(base.sources["xpaths"] if base else {}), **xpaths},
+            "patterns": {**(base.sources["patterns"] if base else {}), **patterns},
+        }
+        self.xpaths: Dict[str, etree.XPath] = {
+            name: etree.XPath(source) for name, source in self.sources["xpaths"].items()
+        }
+        self.patterns: Dict[str, Pattern] = {
+            name: re.compile(source) for name, source in self.sources["patterns"].items()
+        }
+        self.registered_at = time.time()
+    
+    def xpath(self, name: str) -> etree.XPath:
+        return self.xpaths[name]
+    
+    def pattern(self, name: str) -> Pattern:
+        return self.patterns[name]
+
+
+class SiteXPaths(Mapping):
+    """사이트의 현재 활성 XPath를 이름으로 꺼내는 읽기 전용 뷰 (버전이 바뀌면 다음 조회부터 새 XPath)"""
+    
+    def __init__(self, registry: "SelectorRegistry", site: str):
+        self._registry = registry
+        self.site = site
+    
+    def __getitem__(self, name: str) -> etree.XPath:
+        return self._registry.get(self.site).xpaths[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._registry.get(self.site).xpaths)
+    
+    def __len__(self) -> int:
+        return len(self._registry.get(self.site).xpaths)
+
+
+class SelectorRegistry:
+    """사이트별 선택자 버전을 관리하는 저장소
+    
+    파서는 모듈 로드 시 register로 선택자를 한 번 컴파일해 두고, 요청마다 get(site)로 현재 버전을 꺼내 씁니다.
+    사이트 레이아웃이 바뀌면 재배포 없이 새 버전을 등록(또는 load_file)하거나 activate로 이전 버전으로 되돌립니다.
+    """
+    
+    def __init__(self):
+        self._versions: Dict[str, Dict[str, SelectorSet]] = {}
+        self._active: Dict[str, SelectorSet] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, site: str, version: str, xpaths: Optional[Dict[str, str]] = None,
+                 patterns: Optional[Dict[str, str]] = None, activate: bool = True) -> SelectorSet:
+        """선택자 버전 등록 (컴파일 실패 시 ValueError, 기존 활성 버전은 그대로 유지)"""
+        with self._lock:
+            base = self._active.get(site)
+        try:
+            selector_set = SelectorSet(site, version, xpaths or {}, patterns or {}, base)
+        except (etree.XPathSyntaxError, re.error) as e:
+            raise ValueError(f"{site} 선택자 {version} 컴파일 실패: {e}") from e
+        with self._lock:
+            self._versions.setdefault(site, {})[version] = selector_set
+            if activate or site not in self._active:
+                self._active[site] = selector_set
+        return selector_set
+    
+    def activate(self, site: str, version: str) -> None:
+        """등록된 버전으로 교체 (롤백용)"""
+        with self._lock:
+            self._active[site] = self._versions[site][version]
+    
+    def get(self, site: str) -> SelectorSet:
+        """사이트의 현재 선택자 묶음"""
+        return self._active[site]
+    
+    def xpath(self, site: str, name: str) -> etree.XPath:
+        return self._active[site].xpaths[name]
+    
+    def pattern(self, site: str, name: str) -> Pattern:
+        return self._active[site].patterns[name]
+    
+    def view(self, site: str) -> SiteXPaths:
+        """PageSnapshot 등 섹션 이름 -> XPath 매핑을 받는 곳에 넘길 뷰"""
+        return SiteXPaths(self, site)
+    
+    def versions(self, site: str) -> List[str]:
+        """사이트에 등록된 버전 목록 (등록 순)"""
+        with self._lock:
+            return list(self._versions.get(site, {}))
+    
+    def load_file(self, path: str) -> List[str]:
+        """JSON 파일의 선택자 버전을 등록하고 활성화한 사이트 목록 반환
+        
+        형식: {"사이트": {"version": "...", "xpaths": {...}, "patterns": {...}}}
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        loaded = []
+        for site, spec in data.items():
+            try:
+                self.register(site, spec["version"], spec.get("xpaths"), spec.get("patterns"))
+                loaded.append(site)
+            except (KeyError, ValueError) as e:
+                logging.error(f"선택자 파일 적용 실패 ({site}): {e}")
+        return loaded
+    
+    def benchmark(self, site: str, tree: etree._Element, rounds: int = 100,
+                  version: Optional[str] = None) -> Dict[str, float]:
+        """주어진 트리에서 XPath별 평균 실행 시간(마이크로초) 측정 (버전 간 비교용)"""
+        selector_set = self._versions[site][version] if version else self.get(site)
+        timings = {}
+        for name, xpath in selector_set.xpaths.items():
+            started = time.perf_counter()
+            for _ in range(rounds):
+                xpath(tree)
+            timings[name] = (time.perf_counter() - started) / rounds * 1_000_000
+        return timings
+    
+    def stats(self) -> Dict[str, Any]:
+        """사이트별 활성 버전과 등록된 버전 목록"""
+        with self._lock:
+            return {
+                site: {
+                    "active": self._active[site].version,
+                    "versions": list(versions),
+                    "xpaths": len(self._active[site].xpaths),
+                    "patterns": len(self._active[site].patterns),
+                }
+                for site, versions in self._versions.items()
+            }
+
+
+# 싱글톤 인스턴스
+selectors = SelectorRegistry()
@@ -1,63 +1,190 @@
 """
 서비스 매니저 - 의존성 주입 및 서비스 관리
 """
-from typing import Dict, Any, List
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, List, Optional
 from core.base_parser import ParserFactory
-from core.interfaces import HttpClientInterface
-from parsers.http_client import HttpClient
+from core.batch_executor import batch_executor
+from core.prefetch_scheduler import PrefetchScheduler
+from core.interfaces import HttpClientInterface, AsyncHttpClientInterface, WebParserBase
+from core.records import TableResult
+from core.search_engine import CONFIDENT_SCORE, SearchEngine
+from parsers.http_client import HttpClient, http_client as shared_http_client
+from parsers.async_http_client import AsyncHttpClient
 # 파서들을 import하여 팩토리에 등록되도록 함
 from parsers import ticker_parser, fnguide_parser, crypto_parser, market_parser, interest_parser, yahoo_parser, stock_quote_parser, crypto_ticker_parser, marketwatch_parser
 
+# 백그라운드에서 미리 갱신할 메서드: (스냅샷 이름, 파서 타입, 파서 메서드, 장중 갱신 주기(초), 거래 세션)
+DEFAULT_PREFETCH_JOBS = [
+    ("market_indices", "market", "get_market_indices", 10, "krx"),
+    ("interest_rates", "interest", "get_interest_rates", 60, "krx"),
+    ("global_indices", "yahoo", "get_global_indices", 15, "us"),
+    ("us_treasury_yields", "yahoo", "get_us_treasury_yields", 60, "us"),
+    ("forex_majors", "yahoo", "get_forex_majors", 30, None),
+    ("asian_indices", "yahoo", "get_asian_indices", 30, None),
+    ("european_indices", "yahoo", "get_european_indices", 30, None),
+]
+
 
 class ServiceManager:
     """서비스 의존성 관리 클래스"""
     
-    def __init__(self):
-        self._http_client = HttpClient()
+    # 검색 유니버스 -> (전 종목 목록을 가진 파서 타입, 인덱스 속성)
+    SEARCH_UNIVERSES = {
+        "domestic": ("ticker", "ticker_index"),
+        "overseas": ("yahoo", "overseas_index"),
+        "crypto": ("crypto_ticker", "coin_index"),
+    }
+    
+    def __init__(self, http_client: Optional[HttpClientInterface] = None):
+        self._http_client = http_client or shared_http_client
+        # 비동기 클라이언트는 HttpClient의 캐시/검증자/복원력 구성을 공유하므로 처음 필요할 때 만듦
+        self._async_http_client: Optional[AsyncHttpClient] = None
+        self._async_client_lock = threading.Lock()
         self._parsers = {}
+        # 배치 작업 스레드가 동시에 같은 파서(와 종목 인덱스)를 중복 생성하지 않도록
+        self._parsers_lock = threading.Lock()
+        self._prefetch = PrefetchScheduler()
+        self._search_engine = SearchEngine()
+        # 유니버스별 재색인 락 (동시에 들어온 검색이 같은 색인을 중복해서 만들지 않도록)
+        self._universe_locks = {universe: threading.Lock() for universe in self.SEARCH_UNIVERSES}
     
     @property
     def http_client(self) -> HttpClientInterface:
         return self._http_client
     
+    @property
+    def async_http_client(self) -> Optional[AsyncHttpClientInterface]:
+        """공유 비동기 클라이언트 (다른 HttpClientInterface 구현이 주입되면 None: 파서는 스레드에서 동기 조회)"""
+        if self._async_http_client is None and isinstance(self._http_client, HttpClient):
+            with self._async_client_lock:
+                if self._async_http_client is None:
+                    self._async_http_client = AsyncHttpClient(self._http_client)
+        return self._async_http_client
+    
+    @property
+    def prefetch(self) -> PrefetchScheduler:
+        return self._prefetch
+    
+    @property
+    def search_engine(self) -> SearchEngine:
+        return self._search_engine
+    
     def get_parser(self, parser_type: str):
-        """파서 인스턴스 반환 (싱글톤)"""
-        if parser_type not in self._parsers:
-            self._parsers[parser_type] = ParserFactory.create_parser(
-                parser_type, self._http_client
-            )
-        return self._parsers[parser_type]
+        """파서 인스턴스 반환 (싱글톤, 생성은 락 안에서 한 번만)"""
+        parser = self._parsers.get(parser_type)
+        if parser is None:
+            with self._parsers_lock:
+                parser = self._parsers.get(parser_type)
+                if parser is None:
+                    parser = ParserFactory.create_parser(parser_type, self._http_client)
+                    if isinstance(parser, WebParserBase):
+                        parser.async_http_client = self.async_http_client
+                    self._parsers[parser_type] = parser
+        return parser
+    
+    def start_prefetch(self, jobs=None) -> None:
+        """자주 조회되는 메서드의 백그라운드 갱신 시작 (이후 조회는 최신 스냅샷에서 응답)"""
+        for name, parser_type, method, interval, session in (jobs or DEFAULT_PREFETCH_JOBS):
+            fn = getattr(self.get_parser(parser_type), method)
+            self._prefetch.register(name, fn, interval, session)
+        self._prefetch.start()
+    
+    def stop_prefetch(self) -> None:
+        """백그라운드 갱신 중지"""
+        self._prefetch.stop()
+    
+    async def aclose(self) -> None:
+        """백그라운드 갱신 중지 및 비동기 클라이언트 커넥션 풀 종료"""
+        self.stop_prefetch()
+        if self._async_http_client is not None:
+            await self._async_http_client.close()
+    
+    def _reindex_universe(self, universe: str, entries, fetched_at: float) -> None:
+        """종목 목록으로 유니버스 색인 교체"""
+        self._search_engine.replace_universe(
+            universe, (entry.search_document() for entry in entries), version=fetched_at)
+    
+    def _sync_search_universe(self, universe: str) -> None:
+        """검색할 유니버스만 로컬 종목 인덱스와 맞춤
+        
+        처음에는 락 안에서 한 번만 색인하고(동시 요청은 완료를 기다림), 이후 인덱스가 갱신되면
+        백그라운드 스레드에서 재색인하는 동안 이전 색인으로 계속 응답합니다.
+        """
+        parser_type, attribute = self.SEARCH_UNIVERSES[universe]
+        index = getattr(self.get_parser(parser_type), attribute)
+        entries, fetched_at = index.snapshot()
+        if not entries or self._search_engine.version(universe) == fetched_at:
+            return
+        lock = self._universe_locks[universe]
+        if self._search_engine.version(universe) is None:
+            with lock:
+                if self._search_engine.version(universe) is None:
+                    self._reindex_universe(universe, entries, fetched_at)
+            return
+        if not lock.acquire(blocking=False):
+            return  # 다른 스레드가 재색인 중
+        
+        def reindex():
+            try:
+                self._reindex_universe(universe, entries, fetched_at)
+            except Exception as e:
+                logging.error(f"{universe} 검색 색인 갱신 실패: {e}")
+            finally:
+                lock.release()
+        
+        threading.Thread(target=reindex, name=f"search-reindex-{universe}", daemon=True).start()
+    
+    def _ranked_search(self, query: str, universe: str, fallback) -> List[Dict[str, Any]]:
+        """로컬 색인에 확실한 결과가 있으면 그대로 응답하고, 없으면 웹 검색 후 결과를 색인에 추가
+        
+        확실한 결과는 심볼/이름 정확 일치, 접두어 일치, CONFIDENT_SCORE 이상의 퍼지 일치입니다.
+        웹 검색 결과도 로컬 결과와 같은 형식(universe, score, match='web')으로 반환합니다.
+        """
+        self._sync_search_universe(universe)
+        if self._search_engine.version(universe) is not None:
+            results = self._search_engine.search(query, [universe], min_score=CONFIDENT_SCORE)
+            if results:
+                return results
+        results = fallback(query)
+        if not isinstance(results, list):
+            return results
+        return self._search_engine.learn(query, universe, results)
+    
+    def search_tickers(self, query: str, universes: Optional[List[str]] = None,
+                       limit: int = 10) -> List[Dict[str, Any]]:
+        """국내/해외/암호화폐 티커 통합 퍼지 검색 (오타, 초성·자모, 한영 별칭 허용, 점수 순)"""
+        for universe in universes or self.SEARCH_UNIVERSES:
+            if universe in self.SEARCH_UNIVERSES:
+                self._sync_search_universe(universe)
+        return self._search_engine.search(query, universes, limit=limit)
     
     def search_domestic_ticker(self, query: str) -> Dict[str, Any]:
         """국내 티커 검색"""
         parser = self.get_parser('ticker')
-        return parser.search_domestic(query)
+        return self._ranked_search(query, "domestic", parser.search_domestic)
     
     def search_overseas_ticker(self, query: str) -> List[Dict[str, str]]:
-        """해외 티커 검색 (Yahoo Finance)"""
+        """해외 티커 검색 (로컬 미국 상장 종목 색인, 없으면 Yahoo Finance)"""
         parser = self.get_parser('yahoo')
-        return parser.search_overseas_ticker(query)
+        return self._ranked_search(query, "overseas", parser.search_overseas_ticker)
     
     def search_multiple_domestic_tickers(self, queries: List[str]) -> Dict[str, List[Dict[str, str]]]:
-        """복수 국내 티커 검색"""
-        results = {}
-        for query in queries:
-            results[query] = self.search_domestic_ticker(query)
-        return results
+        """복수 국내 티커 검색 (병렬)"""
+        return batch_executor.map(self.search_domestic_ticker, queries,
+                                  host="finance.naver.com", default_factory=list)
     
     def search_multiple_overseas_tickers(self, queries: List[str]) -> Dict[str, List[Dict[str, str]]]:
-        """복수 해외 티커 검색"""
-        results = {}
-        for query in queries:
-            results[query] = self.search_overseas_ticker(query)
-        return results
+        """복수 해외 티커 검색 (병렬)"""
+        return batch_executor.map(self.search_overseas_ticker, queries,
+                                  host="finance.yahoo.com", default_factory=list)
     
     def search_multiple_crypto_tickers(self, queries: List[str]) -> Dict[str, List[Dict[str, str]]]:
-        """복수 암호화폐 티커 검색"""
-        results = {}
-        for query in queries:
-            results[query] = self.search_crypto_ticker(query)
-        return results
+        """복수 암호화폐 티커 검색 (병렬)"""
+        return batch_executor.map(self.search_crypto_ticker, queries,
+                                  host="api.coingecko.com", default_factory=list)
     
     def get_stock_snapshot(self, ticker: str) -> str:
         """주식 스냅샷 조회"""
@@ -114,6 +241,11 @@ class ServiceManager:
         parser = self.get_parser('fnguide')
         return parser.get_earnings_reports(ticker)
     
+    def get_company_report(self, ticker: str, sections: Optional[List[str]] = None) -> Dict[str, str]:
+        """종합 기업 리포트 조회 (여러 FnGuide 페이지를 동시에 조회)"""
+        parser = self.get_parser('fnguide')
+        return parser.get_company_report(ticker, sections)
+    
     def get_crypto_data(self) -> str:
         """암호화폐 데이터 조회"""
         parser = self.get_parser('crypto')
@@ -121,88 +253,115 @@ class ServiceManager:
     
     def get_market_indices(self) -> str:
         """주요 지수 정보 조회"""
+        snapshot = self._prefetch.get("market_indices")
+        if snapshot is not None:
+            return snapshot
         parser = self.get_parser('market')
         return parser.get_market_indices()
     
-    def get_sector_performance(self) -> str:
+    def get_sector_performance(self, structured: bool = False) -> TableResult:
         """업종별 등락률 조회"""
         parser = self.get_parser('market')
-        return parser.get_sector_performance()
+        return parser.get_sector_performance(structured)
     
-    def get_top_gainers(self) -> str:
+    def get_top_gainers(self, structured: bool = False) -> TableResult:
         """상승률 상위 종목 조회"""
         parser = self.get_parser('market')
-        return parser.get_top_gainers()
+        return parser.get_top_gainers(structured)
     
-    def get_top_losers(self) -> str:
+    def get_top_losers(self, structured: bool = False) -> TableResult:
         """하락률 상위 종목 조회"""
         parser = self.get_parser('market')
-        return parser.get_top_losers()
+        return parser.get_top_losers(structured)
     
-    def get_volume_leaders(self) -> str:
+    def get_volume_leaders(self, structured: bool = False) -> TableResult:
         """거래량 상위 종목 조회"""
         parser = self.get_parser('market')
-        return parser.get_volume_leaders()
+        return parser.get_volume_leaders(structured)
     
-    def get_interest_rates(self) -> str:
+    def get_interest_rates(self, structured: bool = False) -> TableResult:
         """기준금리 및 주요 금리 조회"""
+        snapshot = None if structured else self._prefetch.get("interest_rates")
+        if snapshot is not None:
+            return snapshot
         parser = self.get_parser('interest')
-        return parser.get_interest_rates()
+        return parser.get_interest_rates(structured)
     
-    def get_bond_yields(self) -> str:
+    def get_bond_yields(self, structured: bool = False) -> TableResult:
         """국고채 수익률 조회"""
         parser = self.get_parser('interest')
-        return parser.get_bond_yields()
+        return parser.get_bond_yields(structured)
     
-    def get_cd_rates(self) -> str:
+    def get_cd_rates(self, structured: bool = False) -> TableResult:
         """CD금리 조회"""
         parser = self.get_parser('interest')
-        return parser.get_cd_rates()
+        return parser.get_cd_rates(structured)
     
-    def get_corporate_bonds(self) -> str:
+    def get_corporate_bonds(self, structured: bool = False) -> TableResult:
         """회사채 수익률 조회"""
         parser = self.get_parser('interest')
-        return parser.get_corporate_bonds()
+        return parser.get_corporate_bonds(structured)
+    
+    def get_world_indices(self, regions: Optional[List[str]] = None, symbols: Optional[List[str]] = None,
+                          structured: bool = False) -> TableResult:
+        """세계 지수 조회 (지역/심볼 필터, 세 지수 도구와 같은 데이터 공유)"""
+        parser = self.get_parser('yahoo')
+        return parser.get_world_indices(regions, symbols, structured)
     
-    def get_global_indices(self) -> str:
+    def get_global_indices(self, structured: bool = False) -> TableResult:
         """글로벌 주요 지수 조회"""
+        snapshot = None if structured else self._prefetch.get("global_indices")
+        if snapshot is not None:
+            return snapshot
         parser = self.get_parser('yahoo')
-        return parser.get_global_indices()
+        return parser.get_global_indices(structured)
     
-    def get_us_treasury_yields(self) -> str:
+    def get_us_treasury_yields(self, structured: bool = False) -> TableResult:
         """미국 국채 수익률 조회"""
+        snapshot = None if structured else self._prefetch.get("us_treasury_yields")
+        if snapshot is not None:
+            return snapshot
         parser = self.get_parser('yahoo')
-        return parser.get_us_treasury_yields()
+        return parser.get_us_treasury_yields(structured)
     
     def get_vix_data(self) -> str:
         """VIX 공포지수 조회"""
         parser = self.get_parser('yahoo')
         return parser.get_vix_data()
     
-    def get_commodities(self) -> str:
+    def get_commodities(self, structured: bool = False) -> TableResult:
         """글로벌 원자재 가격 조회"""
         parser = self.get_parser('yahoo')
-        return parser.get_commodities()
+        return parser.get_commodities(structured)
     
-    def get_forex_majors(self) -> str:
+    def get_forex_majors(self, structured: bool = False) -> TableResult:
         """주요 환율 조회"""
+        snapshot = None if structured else self._prefetch.get("forex_majors")
+        if snapshot is not None:
+            return snapshot
         parser = self.get_parser('yahoo')
-        return parser.get_forex_majors()
+        return parser.get_forex_majors(structured)
     
-    def get_asian_indices(self) -> str:
+    def get_asian_indices(self, structured: bool = False) -> TableResult:
         """아시아 주요 지수 조회"""
+        snapshot = None if structured else self._prefetch.get("asian_indices")
+        if snapshot is not None:
+            return snapshot
         parser = self.get_parser('yahoo')
-        return parser.get_asian_indices()
+        return parser.get_asian_indices(structured)
     
-    def get_european_indices(self) -> str:
+    def get_european_indices(self, structured: bool = False) -> TableResult:
         """유럽 주요 지수 조회"""
+        snapshot = None if structured else self._prefetch.get("european_indices")
+        if snapshot is not None:
+            return snapshot
         parser = self.get_parser('yahoo')
-        return parser.get_european_indices()
+        return parser.get_european_indices(structured)
     
-    def get_yahoo_sector_performance(self) -> str:
+    def get_yahoo_sector_performance(self, structured: bool = False) -> TableResult:
         """섹터별 성과 조회"""
         parser = self.get_parser('yahoo')
-        return parser.get_sector_performance()
+        return parser.get_sector_performance(structured)
     
     def get_stock_quote(self, symbol: str) -> str:
         """개별 주식 정보 조회 (Yahoo Finance)"""
@@ -237,7 +396,12 @@ class ServiceManager:
     def search_crypto_ticker(self, query: str) -> List[Dict[str, str]]:
         """암호화폐 티커 검색"""
         parser = self.get_parser('crypto_ticker')
-        return parser.search_crypto_ticker(query)
+        return self._ranked_search(query, "crypto", parser.search_crypto_ticker)
+    
+    def resolve_crypto_symbols(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """복수 암호화폐 심볼을 CoinGecko 코인 정보로 일괄 변환 (로컬 코인 목록)"""
+        parser = self.get_parser('crypto_ticker')
+        return parser.resolve_symbols(symbols)
     
     def get_top_cryptos(self, limit: int = 20, currency: str = 'krw') -> List[Dict[str, str]]:
         """상위 암호화폐 목록 조회"""
@@ -249,6 +413,75 @@ class ServiceManager:
         parser = self.get_parser('marketwatch')
         return parser.get_overseas_disclosures(symbol)
 
+    
+    async def get_world_indices_async(self, regions: Optional[List[str]] = None,
+                                      symbols: Optional[List[str]] = None, structured: bool = False) -> TableResult:
+        """세계 지수 조회 (비동기)"""
+        return await self.get_parser('yahoo').get_world_indices_async(regions, symbols, structured)
+    
+    async def get_global_indices_async(self, structured: bool = False) -> TableResult:
+        """글로벌 주요 지수 조회 (비동기)"""
+        snapshot = None if structured else self._prefetch.get("global_indices")
+        if snapshot is not None:
+            return snapshot
+        return await self.get_parser('yahoo').get_global_indices_async(structured)
+    
+    async def get_us_treasury_yields_async(self, structured: bool = False) -> TableResult:
+        """미국 국채 수익률 조회 (비동기)"""
+        snapshot = None if structured else self._prefetch.get("us_treasury_yields")
+        if snapshot is not None:
+            return snapshot
+        return await self.get_parser('yahoo').get_us_treasury_yields_async(structured)
+    
+    async def get_vix_data_async(self) -> str:
+        """VIX 공포지수 조회 (비동기)"""
+        return await self.get_parser('yahoo').get_vix_data_async()
+    
+    async def get_commodities_async(self, structured: bool = False) -> TableResult:
+        """글로벌 원자재 가격 조회 (비동기)"""
+        return await self.get_parser('yahoo').get_commodities_async(structured)
+    
+    async def get_forex_majors_async(self, structured: bool = False) -> TableResult:
+        """주요 환율 조회 (비동기)"""
+        snapshot = None if structured else self._prefetch.get("forex_majors")
+        if snapshot is not None:
+            return snapshot
+        return await self.get_parser('yahoo').get_forex_majors_async(structured)
+    
+    async def get_asian_indices_async(self, structured: bool = False) -> TableResult:
+        """아시아 주요 지수 조회 (비동기)"""
+        snapshot = None if structured else self._prefetch.get("asian_indices")
+        if snapshot is not None:
+            return snapshot
+        return await self.get_parser('yahoo').get_asian_indices_async(structured)
+    
+    async def get_european_indices_async(self, structured: bool = False) -> TableResult:
+        """유럽 주요 지수 조회 (비동기)"""
+        snapshot = None if structured else self._prefetch.get("european_indices")
+        if snapshot is not None:
+            return snapshot
+        return await self.get_parser('yahoo').get_european_indices_async(structured)
+    
+    async def get_yahoo_sector_performance_async(self, structured: bool = False) -> TableResult:
+        """섹터별 성과 조회 (비동기)"""
+        return await self.get_parser('yahoo').get_sector_performance_async(structured)
+    
+    async def get_stock_quote_async(self, symbol: str) -> str:
+        """개별 주식 정보 조회 (비동기)"""
+        return await self.get_parser('yahoo').get_stock_quote_async(symbol)
+    
+    async def get_domestic_stock_quote_async(self, ticker: str) -> str:
+        """국내 개별 주식 정보 조회 (비동기)"""
+        return await self.get_parser('stock_quote').get_domestic_stock_quote_async(ticker)
+    
+    async def get_crypto_quote_async(self, symbol: str) -> str:
+        """개별 암호화폐 정보 조회 (비동기)"""
+        return await self.get_parser('yahoo').get_crypto_quote_async(symbol)
+    
+    async def get_overseas_disclosures_async(self, symbol: str) -> str:
+        """해외주식 공시정보 조회 (비동기, 동기 파서를 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get_overseas_disclosures, symbol)
+
 
 # 전역 서비스 매니저 인스턴스
 service_manager = ServiceManager()
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+점진적 HTML 파싱 모듈 - 응답을 청크 단위로 파싱하다가 필요한 요소가 닫히면 다운로드 중단
+"""
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple
+from lxml import etree, html
+
+
+class ElementSelector:
+    """간단한 요소 선택자 ('table', '#id', 'div.price', 'section#quote.main')
+    
+    클래스 조건은 XPath contains(@class, ...)와 같은 부분 문자열 일치입니다.
+    """
+    
+    PATTERN = re.compile(r'^(?P<tag>[a-zA-Z][a-zA-Z0-9]*)?(?:#(?P<id>[\w-]+))?(?:\.(?P<cls>[\w-]+))?$')
+    
+    __slots__ = ("selector", "tag", "id", "cls")
+    
+    def __init__(self, selector: str):
+        match = self.PATTERN.match(selector.strip())
+        if not match or not any(match.groupdict().values()):
+            raise ValueError(f"지원하지 않는 선택자: {selector}")
+        self.selector = selector
+        self.tag = (match.group("tag") or "").lower() or None
+        self.id = match.group("id")
+        self.cls = match.group("cls")
+    
+    def matches(self, element: etree._Element) -> bool:
+        """요소가 선택자 조건을 모두 만족하는지"""
+        if self.tag is not None and element.tag != self.tag:
+            return False
+        if self.id is not None and element.get("id") != self.id:
+            return False
+        if self.cls is not None and self.cls not in (element.get("class") or ""):
+            return False
+        return True
+
+
+def parse_until(chunks: Iterable[bytes], selector: ElementSelector, encoding: Optional[str] = None,
+                count: int = 1, required: Sequence[ElementSelector] = ()) -> Tuple[Optional[html.HtmlElement], bool, int]:
+    """청크를 점진적으로 파싱하다가 선택자에 맞는 요소 count개와 required 선택자마다 요소 1개가 닫히면 중단
+    
+    중첩된 일치 요소가 아직 열려 있으면 모두 닫힐 때까지 더 읽습니다.
+    반환값은 (그때까지의 문서 트리, 중간에 중단했는지, 읽은 바이트 수)입니다.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end"), encoding=encoding)
+    parser.set_element_class_lookup(html.HtmlElementClassLookup())
+    # 선택자별 [필요한 개수, 열린 요소 수, 닫힌 요소 수]
+    targets: List[Tuple[ElementSelector, List[int]]] = [(selector, [count, 0, 0])]
+    targets.extend((extra, [1, 0, 0]) for extra in required)
+    size = 0
+    aborted = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        size += len(chunk)
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            for target, state in targets:
+                if not target.matches(element):
+                    continue
+                if event == "start":
+                    state[1] += 1
+                else:
+                    state[1] -= 1
+                    state[2] += 1
+        if all(closed >= needed and open_matches <= 0 for _, (needed, open_matches, closed) in targets):
+            aborted = True
+            break
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        root = None
+    return root, aborted, size
@@ -0,0 +1,55 @@
+"""
+테이블 행 추출 모듈 - markdownify 없이 lxml <tr> 요소를 직접 순회
+"""
+from typing import Callable, Iterator, List, Optional, Tuple
+from lxml import etree, html
+
+IMAGE_ALT_XPATH = etree.XPath('.//img/@alt')
+
+
+def cell_text(cell: html.HtmlElement) -> str:
+    """셀 텍스트 추출 (이미지 alt 텍스트 포함, 공백 정리)"""
+    text = cell.text_content()
+    alts = [alt for alt in IMAGE_ALT_XPATH(cell) if alt.strip()]
+    if alts:
+        text = ' '.join(alts) + ' ' + text
+    return ' '.join(text.split())
+
+
+def iter_table_rows(element: html.HtmlElement) -> Iterator[Tuple[List[str], bool]]:
+    """요소 하위의 <tr>을 순서대로 순회하며 (셀 텍스트 목록, 헤더 여부) 반환
+    
+    제너레이터이므로 호출 측에서 필요한 행 수만큼만 읽고 멈출 수 있습니다.
+    """
+    for row in element.iter('tr'):
+        cells = [cell for cell in row if cell.tag in ('td', 'th')]
+        if not cells:
+            continue
+        texts = [cell_text(cell) for cell in cells]
+        if not any(texts):
+            continue
+        yield texts, all(cell.tag == 'th' for cell in cells)
+
+
+def extract_rows(element: html.HtmlElement, max_rows: Optional[int] = None,
+                 row_filter: Optional[Callable[[List[str]], bool]] = None) -> List[Tuple[List[str], bool]]:
+    """조건에 맞는 행을 max_rows개까지만 수집"""
+    rows = []
+    for cells, is_header in iter_table_rows(element):
+        if row_filter is not None and not row_filter(cells):
+            continue
+        rows.append((cells, is_header))
+        if max_rows is not None and len(rows) >= max_rows:
+            break
+    return rows
+
+
+def rows_to_markdown(rows: List[Tuple[List[str], bool]]) -> str:
+    """행 목록을 마크다운 표 라인으로 변환"""
+    lines = []
+    for index, (cells, is_header) in enumerate(rows):
+        escaped = [cell.replace('|', '\\|') for cell in cells]
+        lines.append('| ' + ' | '.join(escaped) + ' |')
+        if is_header and index == 0:
+            lines.append('| ' + ' | '.join('---' for _ in cells) + ' |')
+    return '\n'.join(lines)
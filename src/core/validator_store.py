@@ -0,0 +1,89 @@
+"""
+검증자 저장소 모듈 - URL별 ETag/Last-Modified와 파싱된 트리를 보관해 조건부 요청(304)에 재사용
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ValidatorEntry:
+    """마지막 응답의 검증자와 파싱 결과"""
+    
+    __slots__ = ("etag", "last_modified", "value", "size")
+    
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], value: Any, size: int):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.value = value
+        self.size = size
+    
+    def headers(self) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match, If-Modified-Since)"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    """검증자를 보낸 서버의 응답만 보관하는 LRU 저장소 (304 응답 시 재다운로드 없이 이전 결과 반환)
+    
+    max_entries가 0이면 조건부 요청을 하지 않습니다.
+    """
+    
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, ValidatorEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.conditional_requests = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+        self.bytes_saved = 0
+    
+    def get(self, key: Hashable) -> Optional[ValidatorEntry]:
+        """키의 검증자 항목 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def remember(self, key: Hashable, etag: Optional[str], last_modified: Optional[str],
+                 value: Any, size: int) -> None:
+        """200 응답의 검증자와 파싱 결과 저장 (검증자가 없으면 기존 항목 삭제)"""
+        with self._lock:
+            self.bytes_received += size
+            if self.max_entries <= 0:
+                return
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = ValidatorEntry(etag, last_modified, value, size)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def record_request(self, conditional: bool) -> None:
+        """요청 통계 기록 (검증자를 실어 보낸 요청인지)"""
+        if conditional:
+            with self._lock:
+                self.conditional_requests += 1
+    
+    def record_not_modified(self, size: int) -> None:
+        """304 응답 통계 기록 (다시 받지 않은 본문 크기만큼 절약)"""
+        with self._lock:
+            self.not_modified += 1
+            self.bytes_saved += size
+    
+    def stats(self) -> Dict[str, Any]:
+        """조건부 요청 통계 반환"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "conditional_requests": self.conditional_requests,
+                "not_modified": self.not_modified,
+                "bytes_received": self.bytes_received,
+                "bytes_saved": self.bytes_saved,
+            }
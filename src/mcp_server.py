@@ -3,6 +3,8 @@
 """
 import logging
 from mcp.server.fastmcp import FastMCP
+from core.prefetch_scheduler import prefetch_enabled
+from core.service_manager import service_manager
 
 # 도메인별 도구 모듈들 import
 from mcp_tools.ticker_tools import register_ticker_tools
@@ -25,7 +27,7 @@ mcp = FastMCP("search-economy-index")
 register_ticker_tools(mcp)      # 티커 검색 (4개 함수)
 register_fnguide_tools(mcp)     # 주식 분석 (11개 함수)
 register_crypto_tools(mcp)      # 암호화폐 (1개 함수)
-register_materials_tools(mcp)   # 원자재/귀금속 (5개 함수)
+register_materials_tools(mcp)   # 원자재/귀금속 (6개 함수)
 register_exchange_tools(mcp)    # 환율 (2개 함수)
 register_market_tools(mcp)      # 시장 지표 (5개 함수)
 register_interest_tools(mcp)    # 금리/채권 (4개 함수)
@@ -33,6 +35,8 @@ register_yahoo_tools(mcp)       # Yahoo Finance 글로벌 (15개 함수)
 
 def main():
     """MCP 서버 메인 함수"""
+    if prefetch_enabled():
+        service_manager.start_prefetch()
     mcp.run()
 
 if __name__ == "__main__":
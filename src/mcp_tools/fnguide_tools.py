@@ -7,6 +7,14 @@ from core.service_manager import service_manager
 def register_fnguide_tools(mcp):
     """FnGuide 분석 관련 도구들을 MCP 서버에 등록"""
     
+    @mcp.tool(description="Get a combined Korean company report in one call (pages are fetched concurrently). Prefer this over calling several FnGuide tools for the same ticker. sections: any of ['snapshot', 'company_overview', 'financial_statements', 'financial_ratios', 'investment_indicators', 'analyst_consensus', 'ownership_analysis', 'industry_analysis', 'competitor_comparison', 'earnings_reports', 'exchange_disclosures'] (default: the first six)")
+    def get_company_report(ticker: str, sections: list = None) -> Dict[str, Any]:
+        try:
+            result = service_manager.get_company_report(ticker, sections)
+            return {"ticker": ticker, "report": result, "errors": result.errors}
+        except Exception as e:
+            return {"error": str(e)}
+    
     @mcp.tool(description="Get comprehensive Korean domestic stock snapshot with price, volume, and key metrics")
     def get_stock_snapshot(ticker: str) -> Dict[str, Any]:
         try:
@@ -8,34 +8,34 @@ from core.service_manager import service_manager
 def register_interest_tools(mcp):
     """금리 및 채권 관련 도구들을 MCP 서버에 등록"""
     
-    @mcp.tool(description="Get Korean interest rates including base rate, CD rate, and call rate")
-    def get_interest_rates() -> Dict[str, Any]:
+    @mcp.tool(description="Get Korean interest rates including base rate, CD rate, and call rate (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_interest_rates(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_interest_rates()
+            result = service_manager.get_interest_rates(structured)
             return {"interest_rates": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get Korean government bond yields and treasury securities information")
-    def get_bond_yields() -> Dict[str, Any]:
+    @mcp.tool(description="Get Korean government bond yields and treasury securities information (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_bond_yields(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_bond_yields()
+            result = service_manager.get_bond_yields(structured)
             return {"bond_yields": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get Certificate of Deposit (CD) rates in Korean market")
-    def get_cd_rates() -> Dict[str, Any]:
+    @mcp.tool(description="Get Certificate of Deposit (CD) rates in Korean market (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_cd_rates(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_cd_rates()
+            result = service_manager.get_cd_rates(structured)
             return {"cd_rates": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get corporate bond yields and credit spreads information")
-    def get_corporate_bonds() -> Dict[str, Any]:
+    @mcp.tool(description="Get corporate bond yields and credit spreads information (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_corporate_bonds(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_corporate_bonds()
+            result = service_manager.get_corporate_bonds(structured)
             return {"corporate_bonds": result}
         except Exception as e:
             return {"error": str(e)}
\ No newline at end of file
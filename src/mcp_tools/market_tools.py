@@ -16,34 +16,34 @@ def register_market_tools(mcp):
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get sector performance and industry group rankings")
-    def get_sector_performance() -> Dict[str, Any]:
+    @mcp.tool(description="Get sector performance and industry group rankings (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_sector_performance(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_sector_performance()
+            result = service_manager.get_sector_performance(structured)
             return {"sector_performance": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get top gaining stocks with highest price increases")
-    def get_top_gainers() -> Dict[str, Any]:
+    @mcp.tool(description="Get top gaining stocks with highest price increases (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_top_gainers(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_top_gainers()
+            result = service_manager.get_top_gainers(structured)
             return {"top_gainers": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get top losing stocks with highest price decreases")
-    def get_top_losers() -> Dict[str, Any]:
+    @mcp.tool(description="Get top losing stocks with highest price decreases (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_top_losers(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_top_losers()
+            result = service_manager.get_top_losers(structured)
             return {"top_losers": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get stocks with highest trading volume")
-    def get_volume_leaders() -> Dict[str, Any]:
+    @mcp.tool(description="Get stocks with highest trading volume (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_volume_leaders(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_volume_leaders()
+            result = service_manager.get_volume_leaders(structured)
             return {"volume_leaders": result}
         except Exception as e:
             return {"error": str(e)}
\ No newline at end of file
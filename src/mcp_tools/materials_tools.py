@@ -35,6 +35,15 @@ def register_materials_tools(mcp):
         except Exception as e:
             return {"error": str(e)}
 
+    @mcp.tool(description="Get energy futures, non-ferrous metals, agriculture futures, oil and precious metals prices in one call")
+    def get_all_materials() -> Dict[str, Any]:
+        try:
+            result = materials_parser.get_all_materials()
+            result.update(gold_parser.get_oil_and_precious_metals())
+            return result
+        except Exception as e:
+            return {"error": str(e)}
+
     @mcp.tool(description="Get oil prices and petroleum market information")
     def get_oil_prices() -> Dict[str, Any]:
         try:
@@ -36,6 +36,18 @@ def register_ticker_tools(mcp):
             logger.error(f"해외 티커 검색 실패: {e}")
             return {"error": str(e)}
 
+    @mcp.tool(
+        description="Fuzzy ticker search across Korean domestic, overseas (US listed) and crypto tickers with ranked scores. Tolerates typos, Hangul initial consonants (e.g., 'ㅅㅅㅈㅈ') and Korean/English aliases (e.g., '삼성' ↔ 'Samsung'). universes: any of ['domestic', 'overseas', 'crypto'] (default: all)"
+    )
+    def search_tickers(query: str, universes: list = None, limit: int = 10) -> Dict[str, Any]:
+        try:
+            logger.info(f"통합 티커 검색: {query}, 유니버스: {universes}")
+            result = service_manager.search_tickers(query, universes, limit)
+            return {"query": query, "tickers": result}
+        except Exception as e:
+            logger.error(f"통합 티커 검색 실패: {e}")
+            return {"error": str(e)}
+
     @mcp.tool(
         description="Search cryptocurrency ticker symbols from CoinGecko. For prices, use get_crypto_quote."
     )
@@ -48,6 +60,18 @@ def register_ticker_tools(mcp):
             logger.error(f"암호화폐 티커 검색 실패: {e}")
             return {"error": str(e)}
 
+    @mcp.tool(
+        description="Resolve many cryptocurrency symbols to CoinGecko coins at once (highest market cap wins for shared symbols). Provide list like ['BTC', 'ETH-KRW', 'SOL']"
+    )
+    def resolve_crypto_symbols(symbols: list) -> Dict[str, Any]:
+        try:
+            logger.info(f"복수 암호화폐 심볼 변환: {symbols}")
+            result = service_manager.resolve_crypto_symbols(symbols)
+            return {"symbols": symbols, "coins": result}
+        except Exception as e:
+            logger.error(f"복수 암호화폐 심볼 변환 실패: {e}")
+            return {"error": str(e)}
+
     @mcp.tool(
         description="Get top cryptocurrencies by market cap. Source: CoinGecko API (must cite). Currency: krw (default) or usd"
     )
@@ -67,7 +91,7 @@ def register_ticker_tools(mcp):
         try:
             logger.info(f"복수 해외 주식 조회: {symbols}")
             result = service_manager.get_multiple_stock_quotes(symbols)
-            return {"symbols": symbols, "quotes": result}
+            return {"symbols": symbols, "quotes": result, "errors": result.errors}
         except Exception as e:
             logger.error(f"복수 해외 주식 조회 실패: {e}")
             return {"error": str(e)}
@@ -79,7 +103,7 @@ def register_ticker_tools(mcp):
         try:
             logger.info(f"복수 국내 주식 조회: {tickers}")
             result = service_manager.get_multiple_domestic_stock_quotes(tickers)
-            return {"tickers": tickers, "quotes": result}
+            return {"tickers": tickers, "quotes": result, "errors": result.errors}
         except Exception as e:
             logger.error(f"복수 국내 주식 조회 실패: {e}")
             return {"error": str(e)}
@@ -91,7 +115,7 @@ def register_ticker_tools(mcp):
         try:
             logger.info(f"복수 암호화폐 조회: {symbols}")
             result = service_manager.get_multiple_crypto_quotes(symbols)
-            return {"symbols": symbols, "quotes": result}
+            return {"symbols": symbols, "quotes": result, "errors": result.errors}
         except Exception as e:
             logger.error(f"복수 암호화폐 조회 실패: {e}")
             return {"error": str(e)}
@@ -103,7 +127,7 @@ def register_ticker_tools(mcp):
         try:
             logger.info(f"복수 국내 티커 검색: {queries}")
             result = service_manager.search_multiple_domestic_tickers(queries)
-            return {"queries": queries, "results": result}
+            return {"queries": queries, "results": result, "errors": result.errors}
         except Exception as e:
             logger.error(f"복수 국내 티커 검색 실패: {e}")
             return {"error": str(e)}
@@ -115,7 +139,7 @@ def register_ticker_tools(mcp):
         try:
             logger.info(f"복수 해외 티커 검색: {queries}")
             result = service_manager.search_multiple_overseas_tickers(queries)
-            return {"queries": queries, "results": result}
+            return {"queries": queries, "results": result, "errors": result.errors}
         except Exception as e:
             logger.error(f"복수 해외 티커 검색 실패: {e}")
             return {"error": str(e)}
@@ -127,7 +151,7 @@ def register_ticker_tools(mcp):
         try:
             logger.info(f"복수 암호화폐 티커 검색: {queries}")
             result = service_manager.search_multiple_crypto_tickers(queries)
-            return {"queries": queries, "results": result}
+            return {"queries": queries, "results": result, "errors": result.errors}
         except Exception as e:
             logger.error(f"복수 암호화폐 티커 검색 실패: {e}")
             return {"error": str(e)}
@@ -8,18 +8,26 @@ from core.service_manager import service_manager
 def register_yahoo_tools(mcp):
     """Yahoo Finance 관련 도구들을 MCP 서버에 등록"""
     
-    @mcp.tool(description="Get global major stock indices from Yahoo Finance (S&P500, Dow Jones, NASDAQ, etc.)")
-    def get_global_indices() -> Dict[str, Any]:
+    @mcp.tool(description="Get global major stock indices from Yahoo Finance (S&P500, Dow Jones, NASDAQ, etc.) (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_global_indices(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_global_indices()
+            result = service_manager.get_global_indices(structured)
             return {"global_indices": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get US Treasury bond yields and rates from Yahoo Finance")
-    def get_us_treasury_yields() -> Dict[str, Any]:
+    @mcp.tool(description="Get world stock indices from Yahoo Finance filtered by region and/or symbol. regions: any of ['americas', 'europe', 'asia', 'middle_east_africa', 'currency']; symbols: like ['^GSPC', '^N225', '^KS11']. Omit both for all indices (structured=true returns typed rows: symbol/name/price/change/change_pct/volume/region)")
+    def get_world_indices(regions: list = None, symbols: list = None, structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_us_treasury_yields()
+            result = service_manager.get_world_indices(regions, symbols, structured)
+            return {"regions": regions, "symbols": symbols, "world_indices": result}
+        except Exception as e:
+            return {"error": str(e)}
+
+    @mcp.tool(description="Get US Treasury bond yields and rates from Yahoo Finance (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_us_treasury_yields(structured: bool = False) -> Dict[str, Any]:
+        try:
+            result = service_manager.get_us_treasury_yields(structured)
             return {"us_treasury_yields": result}
         except Exception as e:
             return {"error": str(e)}
@@ -32,42 +40,42 @@ def register_yahoo_tools(mcp):
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get global commodities prices (gold, oil, copper, etc.) from Yahoo Finance")
-    def get_commodities() -> Dict[str, Any]:
+    @mcp.tool(description="Get global commodities prices (gold, oil, copper, etc.) from Yahoo Finance (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_commodities(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_commodities()
+            result = service_manager.get_commodities(structured)
             return {"commodities": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get major forex currency pairs (EUR/USD, GBP/USD, etc.) from Yahoo Finance")
-    def get_forex_majors() -> Dict[str, Any]:
+    @mcp.tool(description="Get major forex currency pairs (EUR/USD, GBP/USD, etc.) from Yahoo Finance (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_forex_majors(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_forex_majors()
+            result = service_manager.get_forex_majors(structured)
             return {"forex_majors": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get Asian major stock indices (Nikkei, Hang Seng, Shanghai, etc.) from Yahoo Finance")
-    def get_asian_indices() -> Dict[str, Any]:
+    @mcp.tool(description="Get Asian major stock indices (Nikkei, Hang Seng, Shanghai, etc.) from Yahoo Finance (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_asian_indices(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_asian_indices()
+            result = service_manager.get_asian_indices(structured)
             return {"asian_indices": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get European major stock indices (FTSE, DAX, CAC40, etc.) from Yahoo Finance")
-    def get_european_indices() -> Dict[str, Any]:
+    @mcp.tool(description="Get European major stock indices (FTSE, DAX, CAC40, etc.) from Yahoo Finance (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_european_indices(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_european_indices()
+            result = service_manager.get_european_indices(structured)
             return {"european_indices": result}
         except Exception as e:
             return {"error": str(e)}
 
-    @mcp.tool(description="Get sector performance data from Yahoo Finance")
-    def get_yahoo_sector_performance() -> Dict[str, Any]:
+    @mcp.tool(description="Get sector performance data from Yahoo Finance (structured=true returns typed rows: symbol/name/price/change/change_pct/volume)")
+    def get_yahoo_sector_performance(structured: bool = False) -> Dict[str, Any]:
         try:
-            result = service_manager.get_yahoo_sector_performance()
+            result = service_manager.get_yahoo_sector_performance(structured)
             return {"sector_performance": result}
         except Exception as e:
             return {"error": str(e)}
@@ -0,0 +1,161 @@
+"""
+비동기 HTTP 클라이언트 모듈 (aiohttp 기반)
+"""
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+from lxml import html
+from core.interfaces import AsyncHttpClientInterface
+from core.rate_limiter import current_priority
+from core.resilience import RETRY_STATUSES, CircuitOpenError
+from parsers.http_client import HttpClient
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncHttpClient(AsyncHttpClientInterface):
+    """asyncio 기반 HTTP 클라이언트 클래스
+    
+    동기 HttpClient와 헤더 및 응답 캐시를 공유합니다.
+    aiohttp가 설치되어 있지 않으면 동기 클라이언트를 스레드에서 실행합니다.
+    """
+    
+    def __init__(self, sync_client: HttpClient, limit: int = 100, limit_per_host: int = 20):
+        self.sync_client = sync_client
+        self.cache = sync_client.cache
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session = None
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+    
+    async def fetch_euc_kr(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
+        """EUC-KR 인코딩 페이지를 비동기로 가져와서 HTML 트리로 반환"""
+        return await self._fetch(url, 'euc-kr', use_cache)
+    
+    async def fetch_utf8(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
+        """UTF-8 인코딩 페이지를 비동기로 가져와서 HTML 트리로 반환"""
+        return await self._fetch(url, 'utf-8', use_cache)
+    
+    async def close(self) -> None:
+        """커넥션 풀 종료"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def _fetch(self, url: str, encoding: str, use_cache: bool) -> Optional[html.HtmlElement]:
+        """캐시 조회 후 미스일 때만 다운로드 (동시 요청은 하나로 병합)"""
+        key = (url, encoding)
+        if use_cache:
+            tree = self.cache.get(key)
+            if tree is not None:
+                return tree
+        
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            tree = await self._load(url, encoding)
+            if tree is not None and use_cache:
+                self.cache.set(key, tree, self.cache.ttl_for(url))
+            future.set_result(tree)
+            return tree
+        except BaseException:
+            # 선행 요청이 취소되면 대기 중인 요청은 조회 실패(None)로 처리
+            future.set_result(None)
+            raise
+        finally:
+            del self._in_flight[key]
+    
+    async def _load(self, url: str, encoding: str) -> Optional[html.HtmlElement]:
+        """원본 서버에서 페이지를 받아 HTML 트리로 변환 (동기 클라이언트와 검증자 저장소, 복원력 정책 공유)"""
+        if aiohttp is None:
+            return await asyncio.to_thread(self.sync_client._load, url, encoding)
+        
+        validators = self.sync_client.validators
+        previous = validators.get((url, encoding))
+        try:
+            validators.record_request(previous is not None)
+            response = await self._request(url, previous.headers() if previous is not None else None)
+            async with response:
+                if response.status == 304 and previous is not None:
+                    validators.record_not_modified(previous.size)
+                    return previous.value
+                response.raise_for_status()
+                content = await response.read()
+                declared_encoding = response.charset
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+            # lxml 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 수행
+            tree = await asyncio.to_thread(
+                self.sync_client.build_tree, content, encoding, declared_encoding, url
+            )
+            validators.remember((url, encoding), etag, last_modified, tree, len(content))
+            return tree
+        except Exception as e:
+            logging.debug(f"비동기 페이지 조회 실패 ({url}): {e}")
+            return None
+    
+    async def _request(self, url: str, headers: Optional[Dict[str, str]]):
+        """동기 클라이언트와 같은 호스트별 속도 제한, 타임아웃, 재시도, 서킷 브레이커로 GET 요청"""
+        resilience = self.sync_client.resilience
+        rate_limiter = self.sync_client.rate_limiter
+        host = resilience.host_of(url)
+        policy = resilience.policy(host)
+        breaker = resilience.breaker(host)
+        if not breaker.allow():
+            raise CircuitOpenError(host, breaker.retry_in())
+        resilience.count(host, "requests")
+        
+        session = self._get_session()
+        connect_timeout, read_timeout = policy.timeout()
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        attempt = 0
+        while True:
+            # 토큰이 없을 때만 스레드에서 대기 (이벤트 루프를 막지 않음)
+            if not rate_limiter.try_acquire(host):
+                await asyncio.to_thread(rate_limiter.acquire, host, current_priority())
+            try:
+                response = await session.get(url, headers=headers, timeout=timeout)
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    resilience.count(host, "timeouts")
+                if attempt >= policy.retries:
+                    resilience.count(host, "failures")
+                    breaker.record_failure()
+                    raise
+                retry_after = None
+            else:
+                if response.status not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                if attempt >= policy.retries:
+                    resilience.count(host, "failures")
+                    breaker.record_failure()
+                    return response
+                retry_after = resilience.retry_after(response.headers)
+                response.release()
+            
+            delay = policy.delay(attempt, retry_after)
+            attempt += 1
+            resilience.count(host, "retries")
+            await asyncio.sleep(delay)
+    
+    def _get_session(self):
+        """aiohttp 세션 반환 (첫 호출 시 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=dict(self.sync_client.session.headers),
+            )
+        return self._session
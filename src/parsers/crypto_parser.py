@@ -5,6 +5,14 @@ import logging
 from typing import Dict, Any
 from core.base_parser import WebParserBase, ParserFactory
 from core.interfaces import HttpClientInterface, ParserInterface
+from core.selectors import select, selectors
+
+
+# Investing.com 암호화폐 페이지 선택자
+selectors.register("investing", "v1", xpaths={
+    # CRYPTO_TABLE_SELECTOR와 같은 조건 (시세 표 class: datatable-v2_table__...)
+    "crypto_table": '//table[contains(@class, "datatable")]',
+})
 
 
 class CryptoParserInterface(ParserInterface):
@@ -18,6 +26,9 @@ class CryptoParser(WebParserBase, CryptoParserInterface):
     """Investing.com 암호화폐 정보 파싱 클래스"""
     
     BASE_URL = "https://kr.investing.com/crypto"
+    SITE = "investing"
+    # 시세 표가 닫히면 나머지 페이지(스크립트, 뉴스 등)는 받지 않음
+    CRYPTO_TABLE_SELECTOR = "table.datatable"
     
     def __init__(self, http_client: HttpClientInterface):
         super().__init__(http_client)
@@ -28,9 +39,13 @@ class CryptoParser(WebParserBase, CryptoParserInterface):
     def get_crypto_data(self) -> str:
         """암호화폐 데이터 조회"""
         try:
+            xpath = selectors.xpath(self.SITE, "crypto_table")
+            tree = self.http_client.fetch_until(self.BASE_URL, self.CRYPTO_TABLE_SELECTOR)
+            if tree is not None and select(tree, xpath):
+                return self._extract_element(tree, xpath) or ""
+            # 중간에 끊긴 트리에 시세 표가 없으면 (표시 방식 변경 등) 전체 페이지로 다시 확인
             tree = self.http_client.fetch_utf8(self.BASE_URL)
             if tree is not None:
-                xpath = '//*[@id="__next"]/div[2]/div[2]/div[2]/div[1]/div[5]/div/div[2]/div[1]/table'
                 return self._extract_element(tree, xpath) or ""
             return ""
         except Exception as e:
@@ -2,10 +2,11 @@
 암호화폐 티커 검색을 위한 유틸리티 모듈
 """
 import logging
-import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from core.base_parser import WebParserBase, ParserFactory
+from core.batch_executor import batch_executor
 from core.interfaces import HttpClientInterface, ParserInterface
+from parsers.ticker_index import CoinListIndex
 
 
 class CryptoTickerParserInterface(ParserInterface):
@@ -19,13 +20,14 @@ class CryptoTickerParser(WebParserBase, CryptoTickerParserInterface):
     """CoinGecko API를 사용한 암호화폐 티커 검색 클래스"""
     
     BASE_URL = "https://api.coingecko.com/api/v3"
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (compatible; CryptoSearch/1.0)',
+        'Accept': 'application/json'
+    }
     
     def __init__(self, http_client: HttpClientInterface):
         super().__init__(http_client)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; CryptoSearch/1.0)'
-        })
+        self.coin_index = CoinListIndex(http_client)
     
     def parse(self, query: str) -> Dict[str, Any]:
         return {
@@ -33,13 +35,20 @@ class CryptoTickerParser(WebParserBase, CryptoTickerParserInterface):
         }
     
     def search_crypto_ticker(self, query: str) -> List[Dict[str, str]]:
-        """암호화폐 티커 검색 (Data source: CoinGecko API)"""
+        """암호화폐 티커 검색 (로컬 코인 목록에서 먼저 찾고, 없을 때만 CoinGecko 검색 API 호출)"""
+        indexed = self.coin_index.search(query)
+        if indexed:
+            return indexed
+        return self._search_api(query)
+    
+    def _search_api(self, query: str) -> List[Dict[str, str]]:
+        """CoinGecko 검색 API 호출 (로컬 코인 목록을 거치지 않음)"""
         try:
-            url = f"{self.BASE_URL}/search?query={query}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self.http_client.fetch_json(
+                f"{self.BASE_URL}/search", params={'query': query}, headers=self.HEADERS
+            )
+            if data is None:
+                return []
             tickers = []
             
             if 'coins' in data:
@@ -58,6 +67,21 @@ class CryptoTickerParser(WebParserBase, CryptoTickerParserInterface):
             logging.error(f"암호화폐 티커 검색 실패: {e}")
             return []
     
+    def resolve_symbols(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """복수 심볼을 코인 정보로 일괄 변환 (로컬 코인 목록의 심볼 정확 일치, 없는 심볼만 검색 API로 보완)"""
+        resolved = self.coin_index.resolve_symbols(symbols)
+        missing = [symbol for symbol, coin in resolved.items() if coin is None]
+        if missing:
+            def lookup(symbol: str) -> Optional[Dict[str, Any]]:
+                # 로컬 목록의 부분 문자열 결과는 심볼이 다르므로 검색 API 결과에서 정확히 같은 심볼만 사용
+                base = symbol.split("-")[0].upper()
+                matches = [item for item in self._search_api(base) if item["symbol"] == base]
+                return matches[0] if matches else None
+            
+            resolved.update(batch_executor.map(lookup, missing, host="api.coingecko.com",
+                                               default_factory=lambda: None))
+        return resolved
+    
     def get_top_cryptos(self, limit: int = 20, currency: str = 'krw') -> List[Dict[str, str]]:
         """상위 암호화폐 목록 조회 (Data source: CoinGecko API)"""
         try:
@@ -69,10 +93,9 @@ class CryptoTickerParser(WebParserBase, CryptoTickerParserInterface):
                 'page': 1
             }
             
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self.http_client.fetch_json(url, params=params, headers=self.HEADERS)
+            if data is None:
+                return []
             cryptos = []
             
             for coin in data:
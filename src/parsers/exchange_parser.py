@@ -3,10 +3,26 @@
 """
 import logging
 import re
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from lxml import html
-import requests
 from markdownify import markdownify as md
+from core.batch_executor import batch_executor
+from core.interfaces import HttpClientInterface
+from core.selectors import selectors
+from core.table_extractor import iter_table_rows, rows_to_markdown
+from parsers.http_client import http_client as shared_http_client
+
+BLANK_LINES_PATTERN = re.compile(r"\n\s*\n\s*\n")
+
+# 네이버 금융 환율 페이지 선택자
+selectors.register("naver.exchange", "v1", xpaths={
+    "domestic_body": '/html/body/div',
+    "world_table": '//table[contains(@class, "tbl_exchange")]',
+    "any_table": '//table',
+    "world_page_links": '//a[contains(@href, "worldExchangeList.naver")]/@href',
+}, patterns={
+    "page_number": r'page=(\d+)',
+})
 
 
 class ExchangeParser:
@@ -14,37 +30,29 @@ class ExchangeParser:
     
     DOMESTIC_URL = "https://finance.naver.com/marketindex/?tabSel=exchange#tab_section"
     WORLD_BASE_URL = "https://finance.naver.com/marketindex/worldExchangeList.naver"
+    WORLD_MAX_PAGES = 20
+    SITE = "naver.exchange"
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Accept-Charset': 'UTF-8'
-        })
+    def __init__(self, http_client: Optional[HttpClientInterface] = None):
+        self.http_client = http_client or shared_http_client
     
     def _html_to_markdown(self, html_content: str) -> str:
         """HTML을 마크다운으로 변환합니다."""
         if not html_content:
             return ""
         markdown = md(html_content, heading_style="ATX")
-        markdown = re.sub(r"\n\s*\n\s*\n", "\n\n", markdown)
+        markdown = BLANK_LINES_PATTERN.sub("\n\n", markdown)
         return markdown.strip()
     
     def get_domestic_exchange(self) -> str:
         """국내환율 정보 조회"""
         try:
-            response = self.session.get(self.DOMESTIC_URL)
-            response.raise_for_status()
-            
-            # EUC-KR 인코딩 처리
-            content = response.content.decode('euc-kr', errors='ignore')
-            tree = html.fromstring(content)
+            tree = self.http_client.fetch_euc_kr(self.DOMESTIC_URL)
+            if tree is None:
+                return ""
             
             # 국내환율 전체 페이지
-            body_elem = tree.xpath('/html/body/div')
+            body_elem = selectors.xpath(self.SITE, "domestic_body")(tree)
             if body_elem:
                 html_content = html.tostring(body_elem[0], encoding='unicode')
                 return self._html_to_markdown(html_content)
@@ -55,34 +63,59 @@ class ExchangeParser:
             logging.error(f"국내환율 페이지 파싱 실패: {e}")
             return ""
     
+    def _world_exchange_table(self, tree: html.HtmlElement) -> Optional[html.HtmlElement]:
+        """국제시장환율 페이지의 환율 테이블"""
+        site = selectors.get(self.SITE)
+        tables = site.xpath("world_table")(tree) or site.xpath("any_table")(tree)
+        return tables[0] if tables else None
+    
+    def _world_exchange_page_count(self, tree: html.HtmlElement) -> int:
+        """페이지 이동 링크에서 마지막 페이지 번호 찾기 (링크가 없으면 1페이지)"""
+        site = selectors.get(self.SITE)
+        page_number = site.pattern("page_number")
+        pages = [int(match) for href in site.xpath("world_page_links")(tree)
+                 for match in page_number.findall(href)]
+        return min(max(pages, default=1), self.WORLD_MAX_PAGES)
+    
+    def _fetch_world_page(self, page: int) -> Optional[html.HtmlElement]:
+        """국제시장환율 한 페이지 조회"""
+        return self.http_client.fetch_euc_kr(f"{self.WORLD_BASE_URL}?page={page}")
+    
     def get_world_exchange(self) -> str:
-        """국제시장환율 정보 조회 (1-4페이지 통합)"""
+        """국제시장환율 정보 조회 (전체 페이지를 동시에 가져와 하나의 환율표로 통합)"""
         try:
-            all_content = []
+            first = self._fetch_world_page(1)
+            if first is None:
+                return ""
             
-            # 1-4페이지 모두 수집
-            for page in range(1, 5):
-                url = f"{self.WORLD_BASE_URL}?page={page}"
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                # EUC-KR 인코딩 처리
-                content = response.content.decode('euc-kr', errors='ignore')
-                tree = html.fromstring(content)
-                
-                # 전체 body 내용
-                body_elem = tree.xpath('/html/body')
-                if body_elem:
-                    html_content = html.tostring(body_elem[0], encoding='unicode')
-                    markdown_content = self._html_to_markdown(html_content)
-                    # 불필요한 URL 텍스트 제거
-                    markdown_content = re.sub(r'/marketindex/worldExchangeDetail\.naver\?marketindexCd=', '', markdown_content)
-                    markdown_content = re.sub(r'/marketindex/worldExchangeList\.naver\?page=[1-4]', '', markdown_content)
-                    markdown_content = re.sub(r'\(FX_[^)]+\)', '', markdown_content)
-                    all_content.append(f"## 페이지 {page}\n\n{markdown_content}")
+            # 1페이지에서 페이지 수를 확인한 뒤 나머지 페이지를 병렬로 조회
+            pages = list(range(2, self._world_exchange_page_count(first) + 1))
+            rest = batch_executor.map(self._fetch_world_page, pages, host="finance.naver.com",
+                                      default_factory=lambda: None)
             
-            return "\n\n---\n\n".join(all_content)
+            header: Optional[List[str]] = None
+            rows: List[List[str]] = []
+            seen = set()
+            for tree in [first] + [rest[page] for page in pages]:
+                table = self._world_exchange_table(tree) if tree is not None else None
+                if table is None:
+                    continue
+                for cells, is_header in iter_table_rows(table):
+                    if is_header:
+                        header = header or cells
+                        continue
+                    # 페이지 경계에서 반복되는 통화는 통화명 + 심볼 기준으로 한 번만
+                    key = tuple(cells[:2])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    rows.append(cells)
+            
+            if not rows:
+                return ""
+            table_rows = ([(header, True)] if header else []) + [(cells, False) for cells in rows]
+            return rows_to_markdown(table_rows)
             
         except Exception as e:
             logging.error(f"국제시장환율 페이지 파싱 실패: {e}")
-            return ""
\ No newline at end of file
+            return ""
@@ -3,14 +3,54 @@ FnGuide 사이트 파싱을 위한 유틸리티 모듈
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from core.base_parser import BaseFnGuideParser, ParserFactory
+from core.batch_executor import batch_executor
 from core.interfaces import HttpClientInterface
+from core.selectors import selectors
+
+
+# FnGuide 기업 페이지 선택자 (본문 영역과 마크다운에서 지울 링크 패턴)
+selectors.register("fnguide", "v1", xpaths={
+    "comp_body": '//*[@id="compBody"]',
+}, patterns={
+    "javascript_link": r'\(javascript:[^)]*\)',
+    "asp_link": r'\([^)]*\.asp\?[^)]*\)',
+    "homepage_link": r'\(javascript:goHompage\([^)]*\)\)',
+})
+
+# 네이버 금융 종목 공시 페이지 선택자
+selectors.register("naver.notice", "v1", xpaths={
+    "notice_links": '//a[contains(@href, "news_notice_read.naver")]',
+})
 
 
 class FnGuideParser(BaseFnGuideParser):
     """FnGuide 금융 정보 파싱 클래스"""
 
+    HOST = "comp.fnguide.com"
+    SITE = "fnguide"
+    # 종합 리포트 섹션 이름 -> SVD 페이지 (거래소공시는 네이버 금융 공시 페이지)
+    SECTION_ENDPOINTS = {
+        "snapshot": "SVD_Main.asp",
+        "company_overview": "SVD_Corp.asp",
+        "financial_statements": "SVD_Finance.asp",
+        "financial_ratios": "SVD_FinanceRatio.asp",
+        "investment_indicators": "SVD_Invest.asp",
+        "analyst_consensus": "SVD_Consensus.asp",
+        "ownership_analysis": "SVD_shareanalysis.asp",
+        "industry_analysis": "SVD_ujanal.asp",
+        "competitor_comparison": "SVD_Comparison.asp",
+        "earnings_reports": "SVD_ProResultCorp.asp",
+        "exchange_disclosures": None,
+    }
+    # 분기마다 바뀌는 페이지 - 디스크 캐시에 보관해 재시작 후에도 재사용
+    PERSISTED_ENDPOINTS = {"SVD_Corp.asp", "SVD_Finance.asp", "SVD_FinanceRatio.asp"}
+    DEFAULT_REPORT_SECTIONS = [
+        "snapshot", "company_overview", "financial_statements",
+        "financial_ratios", "investment_indicators", "analyst_consensus",
+    ]
+
     def __init__(self, http_client: HttpClientInterface):
         super().__init__(http_client)
 
@@ -18,9 +58,12 @@ class FnGuideParser(BaseFnGuideParser):
         """페이지를 가져와서 파싱합니다."""
         try:
             url = self._build_url(endpoint, ticker)
-            tree = self.http_client.fetch_utf8(url)
+            if endpoint in self.PERSISTED_ENDPOINTS:
+                tree = self.http_client.fetch_persisted(url, f"fnguide/{endpoint}/{ticker}")
+            else:
+                tree = self.http_client.fetch_utf8(url)
             if tree is not None:
-                result = self._extract_element(tree, '//*[@id="compBody"]') or ""
+                result = self._extract_element(tree, selectors.xpath(self.SITE, "comp_body")) or ""
                 return self._clean_fnguide_content(result)
             return ""
         except Exception as e:
@@ -39,7 +82,7 @@ class FnGuideParser(BaseFnGuideParser):
                 
                 if tree is not None:
                     # 공시 링크들 추출
-                    links = tree.xpath('//a[contains(@href, "news_notice_read.naver")]')
+                    links = selectors.xpath("naver.notice", "notice_links")(tree)
                     
                     page_content = [f"=== 페이지 {page} ==="]
                     
@@ -66,41 +109,61 @@ class FnGuideParser(BaseFnGuideParser):
             logging.error(f"네이버 금융 공시 파싱 실패: {e}")
             return f"{ticker} 공시 정보 조회 중 오류가 발생했습니다."
 
+    def _fetch_report_section(self, section: str, ticker: str) -> str:
+        """종합 리포트 섹션 하나 조회"""
+        endpoint = self.SECTION_ENDPOINTS[section]
+        if endpoint is None:
+            return self._fetch_disclosure(ticker)
+        return self._fetch_page(endpoint, ticker)
+
+    def get_company_report(self, ticker: str, sections: Optional[List[str]] = None) -> Dict[str, str]:
+        """여러 섹션을 동시에 가져와 변환한 종합 리포트 (섹션 이름 -> 내용, 요청 순서 유지)
+
+        알 수 없는 섹션은 무시하며, 실패한 섹션은 빈 문자열로 채우고 errors에 사유를 기록합니다.
+        """
+        requested = sections or self.DEFAULT_REPORT_SECTIONS
+        unknown = [section for section in requested if section not in self.SECTION_ENDPOINTS]
+        if unknown:
+            logging.warning(f"알 수 없는 리포트 섹션 무시: {unknown}")
+        valid = [section for section in requested if section in self.SECTION_ENDPOINTS]
+        return batch_executor.map(lambda section: self._fetch_report_section(section, ticker), valid,
+                                  host=self.HOST)
+
     def get_snapshot(self, ticker: str) -> str:
         """스냅샷 정보 조회"""
-        return self._fetch_page("SVD_Main.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["snapshot"], ticker)
 
     def get_company_overview(self, ticker: str) -> str:
         """기업개요 정보 조회"""
-        return self._fetch_page("SVD_Corp.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["company_overview"], ticker)
 
     def get_financial_statements(self, ticker: str) -> str:
         """재무제표 정보 조회"""
-        return self._fetch_page("SVD_Finance.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["financial_statements"], ticker)
 
     def get_financial_ratios(self, ticker: str) -> str:
         """재무비율 정보 조회"""
-        return self._fetch_page("SVD_FinanceRatio.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["financial_ratios"], ticker)
 
     def get_investment_indicators(self, ticker: str) -> str:
         """투자지표 정보 조회"""
-        return self._fetch_page("SVD_Invest.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["investment_indicators"], ticker)
 
     def get_analyst_consensus(self, ticker: str) -> str:
         """컨센서스 정보 조회"""
-        return self._fetch_page("SVD_Consensus.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["analyst_consensus"], ticker)
 
     def get_ownership_analysis(self, ticker: str) -> str:
         """지분분석 정보 조회"""
-        return self._fetch_page("SVD_shareanalysis.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["ownership_analysis"], ticker)
 
     def get_industry_analysis(self, ticker: str) -> str:
         """업종분석 정보 조회"""
-        return self._fetch_page("SVD_ujanal.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["industry_analysis"], ticker)
 
     def get_competitor_comparison(self, ticker: str) -> str:
         """경쟁사비교 정보 조회"""
-        return self._fetch_page("SVD_Comparison.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["competitor_comparison"], ticker)
 
     def get_exchange_disclosures(self, ticker: str) -> str:
         """거래소공시 정보 조회"""
@@ -108,20 +171,20 @@ class FnGuideParser(BaseFnGuideParser):
 
     def get_earnings_reports(self, ticker: str) -> str:
         """실적속보 정보 조회"""
-        return self._fetch_page("SVD_ProResultCorp.asp", ticker)
+        return self._fetch_page(self.SECTION_ENDPOINTS["earnings_reports"], ticker)
     
     def _clean_fnguide_content(self, content: str) -> str:
         """FnGuide 콘텐츠에서 불필요한 패턴 제거"""
-        import re
         if not content:
             return ""
+        site = selectors.get(self.SITE)
         
         # JavaScript 패턴 제거
-        content = re.sub(r'\(javascript:[^)]*\)', '', content)
+        content = site.pattern("javascript_link").sub('', content)
         # ASP 파일 URL 패턴 제거
-        content = re.sub(r'\([^)]*\.asp\?[^)]*\)', '', content)
+        content = site.pattern("asp_link").sub('', content)
         # goHompage JavaScript 패턴 제거
-        content = re.sub(r'\(javascript:goHompage\([^)]*\)\)', '', content)
+        content = site.pattern("homepage_link").sub('', content)
         
         return content
 
@@ -1,75 +1,65 @@
 """
 유가 및 귀금속 정보 파싱을 위한 유틸리티 모듈
 """
-import logging
 import re
-from typing import Dict, Any
+from typing import Dict, Optional
 from lxml import html
-import requests
 from markdownify import markdownify as md
+from core.interfaces import HttpClientInterface
+from core.page_snapshot import PageSnapshot
+from core.selectors import selectors
+from parsers.http_client import http_client as shared_http_client
+
+BLANK_LINES_PATTERN = re.compile(r"\n\s*\n\s*\n")
+
+# 네이버 금융 유가 및 귀금속 페이지 선택자 (섹션 이름 -> XPath)
+selectors.register("naver.gold", "v1", xpaths={
+    'oil_prices': '//*[@id="content"]/div[3]',       # 유가
+    'precious_metals': '//*[@id="content"]/div[4]',  # 귀금속
+}, patterns={
+    "detail_link": r'\(/marketindex/oilDetail\.naver\?marketindexCd=[^)]+\)',
+})
 
 
 class GoldParser:
     """네이버 금융 유가 및 귀금속 정보 파싱 클래스"""
     
     BASE_URL = "https://finance.naver.com/marketindex/?tabSel=gold#tab_section"
+    SITE = "naver.gold"
+    SECTIONS = selectors.view(SITE)
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Accept-Charset': 'UTF-8'
-        })
+    def __init__(self, http_client: Optional[HttpClientInterface] = None, snapshot_ttl: float = 30):
+        self.http_client = http_client or shared_http_client
+        self._snapshot = PageSnapshot(
+            self._fetch_tree, self.SECTIONS, self._element_to_markdown, snapshot_ttl, "유가 및 귀금속 페이지"
+        )
     
     def _html_to_markdown(self, html_content: str) -> str:
         """HTML을 마크다운으로 변환합니다."""
         if not html_content:
             return ""
         markdown = md(html_content, heading_style="ATX")
-        markdown = re.sub(r"\n\s*\n\s*\n", "\n\n", markdown)
+        markdown = BLANK_LINES_PATTERN.sub("\n\n", markdown)
         # 불필요한 URL 텍스트 제거
-        markdown = re.sub(r'\(/marketindex/oilDetail\.naver\?marketindexCd=[^)]+\)', '', markdown)
+        markdown = selectors.pattern(self.SITE, "detail_link").sub('', markdown)
         return markdown.strip()
     
-    def _fetch_page(self) -> Dict[str, str]:
-        """유가 및 귀금속 페이지를 가져와서 파싱합니다."""
-        try:
-            response = self.session.get(self.BASE_URL)
-            response.raise_for_status()
-            
-            # EUC-KR 인코딩 처리
-            content = response.content.decode('euc-kr', errors='ignore')
-            tree = html.fromstring(content)
-            
-            results = {}
-            
-            # 유가
-            oil_elem = tree.xpath('//*[@id="content"]/div[3]')
-            if oil_elem:
-                html_content = html.tostring(oil_elem[0], encoding='unicode')
-                results['oil_prices'] = self._html_to_markdown(html_content)
-            
-            # 귀금속
-            precious_metals_elem = tree.xpath('//*[@id="content"]/div[4]')
-            if precious_metals_elem:
-                html_content = html.tostring(precious_metals_elem[0], encoding='unicode')
-                results['precious_metals'] = self._html_to_markdown(html_content)
-            
-            return results
-            
-        except Exception as e:
-            logging.error(f"유가 및 귀금속 페이지 파싱 실패: {e}")
-            return {}
+    def _element_to_markdown(self, element: html.HtmlElement) -> str:
+        """HTML 요소를 마크다운으로 변환합니다."""
+        return self._html_to_markdown(html.tostring(element, encoding='unicode'))
+    
+    def _fetch_tree(self) -> Optional[html.HtmlElement]:
+        """유가 및 귀금속 페이지를 가져옵니다. (스냅샷이 캐시 역할을 하므로 응답 캐시는 우회)"""
+        return self.http_client.fetch_euc_kr(self.BASE_URL, use_cache=False)
     
     def get_oil_prices(self) -> str:
         """유가 정보 조회"""
-        data = self._fetch_page()
-        return data.get('oil_prices', '')
+        return self._snapshot.get('oil_prices')
     
     def get_precious_metals(self) -> str:
         """귀금속 정보 조회"""
-        data = self._fetch_page()
-        return data.get('precious_metals', '')
\ No newline at end of file
+        return self._snapshot.get('precious_metals')
+    
+    def get_oil_and_precious_metals(self) -> Dict[str, str]:
+        """유가 및 귀금속 정보 일괄 조회"""
+        return self._snapshot.get_all()
\ No newline at end of file
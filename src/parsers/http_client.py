@@ -1,76 +1,243 @@
 """
 공통 HTTP 클라이언트 모듈
 """
-import requests
-from typing import Optional
+import logging
+import threading
+from typing import Optional, Dict, Any, Sequence
 from lxml import html
 import re
 from markdownify import markdownify as md
+from core.charset import CharsetResolver, charset_resolver
+from core.disk_cache import DiskCache, disk_cache as shared_disk_cache
 from core.interfaces import HttpClientInterface
+from core.rate_limiter import RateLimiter, rate_limiter as shared_rate_limiter
+from core.resilience import Resilience, resilience as shared_resilience
+from core.response_cache import ResponseCache
+from core.single_flight import SingleFlight
+from core.stream_parser import ElementSelector, parse_until
+from core.validator_store import ValidatorStore
+from parsers.http_transport import PooledTransport, shared_transport
 
-try:
-    import chardet
-except ImportError:
-    chardet = None
+BLANK_LINES_PATTERN = re.compile(r"\n\s*\n\s*\n")
 
 
 class HttpClient(HttpClientInterface):
     """공통 HTTP 클라이언트 클래스"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Accept-Charset': 'UTF-8'
-        })
+    def __init__(self, cache: Optional[ResponseCache] = None,
+                 transport: Optional[PooledTransport] = None,
+                 disk_cache: Optional[DiskCache] = None,
+                 validators: Optional[ValidatorStore] = None,
+                 resilience: Optional[Resilience] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 charsets: Optional[CharsetResolver] = None):
+        self.transport = transport if transport is not None else shared_transport
+        self.session = self.transport.session
+        self.cache = cache if cache is not None else ResponseCache()
+        self.disk_cache = disk_cache if disk_cache is not None else shared_disk_cache
+        self.validators = validators if validators is not None else ValidatorStore()
+        self.resilience = resilience if resilience is not None else shared_resilience
+        self.rate_limiter = rate_limiter if rate_limiter is not None else shared_rate_limiter
+        self.charsets = charsets if charsets is not None else charset_resolver
+        self._single_flight = SingleFlight()
+        self._stream_lock = threading.Lock()
+        self._stream_stats = {"requests": 0, "aborted": 0, "bytes_read": 0}
     
-    def fetch_euc_kr(self, url: str) -> Optional[html.HtmlElement]:
+    def fetch_euc_kr(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
         """EUC-KR 인코딩 페이지를 가져와서 HTML 트리로 반환"""
+        return self._fetch(url, 'euc-kr', use_cache)
+    
+    def fetch_utf8(self, url: str, use_cache: bool = True) -> Optional[html.HtmlElement]:
+        """UTF-8 인코딩 페이지를 가져와서 HTML 트리로 반환"""
+        return self._fetch(url, 'utf-8', use_cache)
+    
+    def fetch_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                   timeout: Optional[float] = None, headers: Optional[Dict[str, str]] = None) -> Optional[Any]:
+        """JSON API 응답을 가져와서 파싱된 객체로 반환"""
         try:
-            response = self.session.get(url)
+            response = self.request("GET", url, params=params, headers=headers, read_timeout=timeout)
             response.raise_for_status()
-            content = response.content.decode('euc-kr', errors='ignore')
-            return html.fromstring(content)
-        except Exception:
+            return response.json()
+        except Exception as e:
+            logging.debug(f"JSON 조회 실패 ({url}): {e}")
             return None
     
-    def fetch_utf8(self, url: str) -> Optional[html.HtmlElement]:
-        """UTF-8 인코딩 페이지를 가져와서 HTML 트리로 반환"""
+    def request(self, method: str, url: str, read_timeout: Optional[float] = None, **kwargs) -> Any:
+        """호스트별 속도 제한, 타임아웃, 재시도, 서킷 브레이커를 적용해 요청 (read_timeout으로 읽기 타임아웃만 교체)
+        
+        토큰이 없으면 실패 대신 대기하고(재시도도 토큰 사용), 서킷이 열려 있으면 CircuitOpenError,
+        네트워크 오류는 재시도 후 원래 예외를 그대로 올립니다.
+        """
+        host = self.resilience.host_of(url)
+        
+        def send(timeout):
+            self.rate_limiter.acquire(host)
+            return self.session.request(method, url, timeout=timeout, **kwargs)
+        
+        return self.resilience.call(method, url, send, read_timeout)
+    
+    def fetch_until(self, url: str, selector: str, encoding: str = 'utf-8',
+                    count: int = 1, required: Sequence[str] = ()) -> Optional[html.HtmlElement]:
+        """응답을 청크 단위로 파싱하다가 selector에 맞는 요소 count개가 닫히면 다운로드를 중단하고 트리 반환
+        
+        파서가 함께 읽는 다른 요소는 required에 넣으면 각각 하나씩 닫힐 때까지 더 읽습니다.
+        반환되는 트리는 그 지점까지의 문서이므로, 이후 요소가 필요한 파서는 fetch_utf8을 사용해야 합니다.
+        결과는 (URL, 인코딩, 선택자, 개수, 추가 선택자) 단위로 메모리 캐시에 보관합니다.
+        """
+        key = (url, encoding, selector, count, tuple(required))
+        tree = self.cache.get(key)
+        if tree is not None:
+            return tree
+        
+        def load():
+            loaded = self._load_until(url, ElementSelector(selector), encoding, count,
+                                      [ElementSelector(extra) for extra in required])
+            if loaded is not None:
+                self.cache.set(key, loaded, self.cache.ttl_for(url))
+            return loaded
+        
+        return self._single_flight.do(key, load)
+    
+    def _load_until(self, url: str, selector: ElementSelector, encoding: str, count: int,
+                    required: Sequence[ElementSelector] = ()) -> Optional[html.HtmlElement]:
+        """스트리밍 요청으로 필요한 요소까지만 받아 파싱 (중단하면 커넥션은 재사용하지 않고 닫음)"""
         try:
-            response = self.session.get(url)
+            response = self.request("GET", url, stream=True)
+            try:
+                response.raise_for_status()
+                declared = (response.encoding or "").lower()
+                if encoding != 'euc-kr' and declared and declared not in ("iso-8859-1", "ascii"):
+                    encoding = declared
+                tree, aborted, size = parse_until(response.iter_content(chunk_size=16384), selector, encoding,
+                                                  count, required)
+            finally:
+                response.close()
+        except Exception as e:
+            logging.debug(f"스트리밍 조회 실패 ({url}): {e}")
+            return None
+        with self._stream_lock:
+            self._stream_stats["requests"] += 1
+            self._stream_stats["aborted"] += int(aborted)
+            self._stream_stats["bytes_read"] += size
+        return tree
+    
+    def fetch_persisted(self, url: str, key: str, encoding: str = 'utf-8',
+                        max_age: Optional[float] = None) -> Optional[html.HtmlElement]:
+        """메모리 캐시 -> 디스크 캐시 -> 조건부 요청 순으로 조회 (자주 바뀌지 않는 페이지용)
+        
+        디스크 항목이 max_age(기본: 메모리 캐시 TTL 규칙)보다 오래되면 ETag/Last-Modified로 재검증하고,
+        304 응답이면 저장된 본문을 그대로 사용합니다. 원본 서버가 실패하면 만료된 본문이라도 반환합니다.
+        """
+        memory_key = (url, encoding)
+        tree = self.cache.get(memory_key)
+        if tree is not None:
+            return tree
+        max_age = self.cache.ttl_for(url) if max_age is None else max_age
+        
+        def load():
+            loaded = self._load_persisted(url, key, encoding, max_age)
+            if loaded is not None:
+                self.cache.set(memory_key, loaded, self.cache.ttl_for(url))
+            return loaded
+        
+        return self._single_flight.do(memory_key, load)
+    
+    def _load_persisted(self, url: str, key: str, encoding: str, max_age: float) -> Optional[html.HtmlElement]:
+        """디스크 캐시 항목을 사용하거나 재검증 후 새 응답을 저장"""
+        entry = self.disk_cache.get(key)
+        if entry is not None and entry.is_fresh:
+            return self.build_tree(entry.content, encoding, entry.encoding, url)
+        try:
+            self.validators.record_request(entry is not None)
+            response = self.request("GET", url, headers=entry.validators() if entry is not None else None)
+            if response.status_code == 304 and entry is not None:
+                self.validators.record_not_modified(len(entry.content))
+                self.disk_cache.touch(key, max_age)
+                return self.build_tree(entry.content, encoding, entry.encoding, url)
+            response.raise_for_status()
+        except Exception as e:
+            logging.debug(f"페이지 조회 실패 ({url}): {e}")
+            return self.build_tree(entry.content, encoding, entry.encoding, url) if entry is not None else None
+        self.disk_cache.set(key, response.content, max_age, response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"), response.encoding)
+        return self.build_tree(response.content, encoding, response.encoding, url)
+    
+    def stats(self) -> Dict[str, Any]:
+        """클라이언트 통계 반환"""
+        return {
+            "cache": self.cache.stats(),
+            "disk_cache": self.disk_cache.stats(),
+            "conditional": self.validators.stats(),
+            "single_flight": self._single_flight.stats(),
+            "pool": self.transport.stats(),
+            "resilience": self.resilience.stats(),
+            "rate_limit": self.rate_limiter.stats(),
+            "streaming": self._streaming_stats(),
+            "charset": self.charsets.stats(),
+        }
+    
+    def _streaming_stats(self) -> Dict[str, int]:
+        """스트리밍 조회 통계 (요청 수, 중간 중단 수, 실제로 읽은 바이트 수)"""
+        with self._stream_lock:
+            return dict(self._stream_stats)
+    
+    def _fetch(self, url: str, encoding: str, use_cache: bool) -> Optional[html.HtmlElement]:
+        """캐시 조회 후 미스일 때만 원본 서버에서 가져오기 (동시 요청은 하나로 병합)"""
+        key = (url, encoding)
+        if use_cache:
+            tree = self.cache.get(key)
+            if tree is not None:
+                return tree
+        
+        def load():
+            loaded = self._load(url, encoding)
+            if loaded is not None and use_cache:
+                self.cache.set(key, loaded, self.cache.ttl_for(url))
+            return loaded
+        
+        return self._single_flight.do(key, load)
+    
+    def _load(self, url: str, encoding: str) -> Optional[html.HtmlElement]:
+        """원본 서버에서 페이지를 받아 HTML 트리로 변환 (이전 응답에 검증자가 있었으면 조건부 요청)"""
+        key = (url, encoding)
+        previous = self.validators.get(key)
+        try:
+            self.validators.record_request(previous is not None)
+            response = self.request("GET", url, headers=previous.headers() if previous is not None else None)
+            if response.status_code == 304 and previous is not None:
+                self.validators.record_not_modified(previous.size)
+                return previous.value
             response.raise_for_status()
-            
-            # 한글 인코딩 처리
-            if chardet and (
-                response.encoding is None
-                or response.encoding.lower() in ["iso-8859-1", "ascii"]
-            ):
-                detected = chardet.detect(response.content)
-                if detected["encoding"]:
-                    response.encoding = detected["encoding"]
-                else:
-                    response.encoding = "utf-8"
-            elif response.encoding is None:
-                response.encoding = "utf-8"
-            
-            return html.fromstring(
-                response.content, parser=html.HTMLParser(encoding=response.encoding)
-            )
-        except Exception:
+            tree = self.build_tree(response.content, encoding, response.encoding, url)
+            self.validators.remember(key, response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                                     tree, len(response.content))
+            return tree
+        except Exception as e:
+            logging.debug(f"페이지 조회 실패 ({url}): {e}")
             return None
     
+    def build_tree(self, content: bytes, encoding: str, declared_encoding: Optional[str] = None,
+                   url: Optional[str] = None) -> html.HtmlElement:
+        """응답 본문을 요청한 인코딩 규칙에 따라 HTML 트리로 변환 (UTF-8 요청은 문자셋 판별기로 인코딩 결정)"""
+        if encoding == 'euc-kr':
+            self.charsets.record("forced")
+            return html.fromstring(content.decode('euc-kr', errors='ignore'))
+        
+        # 헤더 -> <meta charset> -> 호스트별 인코딩 -> 앞부분 표본 추정 순 (본문 전체 추정 없음)
+        declared_encoding, _ = self.charsets.resolve(content, declared_encoding, url)
+        return html.fromstring(
+            content, parser=html.HTMLParser(encoding=declared_encoding)
+        )
+    
     @staticmethod
     def html_to_markdown(html_content: str) -> str:
         """HTML을 마크다운으로 변환"""
         if not html_content:
             return ""
         markdown = md(html_content, heading_style="ATX")
-        markdown = re.sub(r"\n\s*\n\s*\n", "\n\n", markdown)
+        markdown = BLANK_LINES_PATTERN.sub("\n\n", markdown)
         return markdown.strip()
 
 
 # 싱글톤 인스턴스
-http_client = HttpClient()
\ No newline at end of file
+http_client = HttpClient()
@@ -0,0 +1,88 @@
+"""
+공유 HTTP 전송 계층 모듈 - 호스트별 커넥션 풀 및 keep-alive 관리
+"""
+import threading
+from typing import Any, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'Accept-Charset': 'UTF-8',
+    'Connection': 'keep-alive',
+}
+
+# 호스트별 커넥션 풀 크기 (동시에 유지할 keep-alive 커넥션 수)
+DEFAULT_POOL_SIZES: Dict[str, int] = {
+    "finance.naver.com": 20,
+    "finance.yahoo.com": 20,
+    "comp.fnguide.com": 10,
+    "api.coingecko.com": 4,
+    "www.marketwatch.com": 4,
+    "kr.investing.com": 4,
+}
+
+
+class PooledTransport:
+    """모든 파서가 공유하는 requests 세션과 호스트별 커넥션 풀"""
+    
+    def __init__(self, pool_sizes: Optional[Dict[str, int]] = None,
+                 default_pool_size: int = 10, pool_block: bool = False):
+        self.pool_sizes = dict(DEFAULT_POOL_SIZES if pool_sizes is None else pool_sizes)
+        self.default_pool_size = default_pool_size
+        self.pool_block = pool_block
+        self._lock = threading.Lock()
+        
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        
+        default_adapter = HTTPAdapter(
+            pool_connections=max(len(self.pool_sizes), 10),
+            pool_maxsize=default_pool_size,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", default_adapter)
+        self.session.mount("http://", default_adapter)
+        for host, size in self.pool_sizes.items():
+            self._mount_host(host, size)
+    
+    def _mount_host(self, host: str, size: int) -> None:
+        """호스트 전용 어댑터 등록"""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, pool_block=self.pool_block)
+        self.session.mount(f"https://{host}/", adapter)
+        self.session.mount(f"http://{host}/", adapter)
+    
+    def set_pool_size(self, host: str, size: int) -> None:
+        """호스트의 커넥션 풀 크기 변경 (기존 커넥션은 새 어댑터로 교체)"""
+        with self._lock:
+            self.pool_sizes[host] = size
+            self._mount_host(host, size)
+    
+    def stats(self) -> Dict[str, Any]:
+        """호스트별 커넥션 생성/재사용 통계 반환"""
+        hosts: Dict[str, Dict[str, int]] = {}
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                entry = hosts.setdefault(pool.host, {
+                    "pool_maxsize": self.pool_sizes.get(pool.host, self.default_pool_size),
+                    "connections": 0,
+                    "requests": 0,
+                    "reused": 0,
+                })
+                entry["connections"] += pool.num_connections
+                entry["requests"] += pool.num_requests
+                entry["reused"] += max(0, pool.num_requests - pool.num_connections)
+        return hosts
+
+
+# 공유 인스턴스
+shared_transport = PooledTransport()
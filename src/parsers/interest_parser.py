@@ -2,11 +2,20 @@
 금리 및 채권 정보 파싱을 위한 유틸리티 모듈
 """
 import logging
-import re
 from typing import Dict, Any, List, Optional
 from lxml import html
 from core.base_parser import WebParserBase, ParserFactory
 from core.interfaces import HttpClientInterface, ParserInterface
+from core.records import TableResult, extract_records
+from core.selectors import selectors
+
+
+# 네이버 금융 시장지표(금리) 페이지 선택자
+selectors.register("naver.interest", "v1", xpaths={
+    "tables": '//table',
+}, patterns={
+    "detail_link": r'\(/marketindex/interestDetail\.naver\?marketindexCd=[^)]+\)',
+})
 
 
 class InterestParserInterface(ParserInterface):
@@ -23,7 +32,7 @@ class InterestParser(WebParserBase, InterestParserInterface):
     """네이버 금융 금리 및 채권 정보 파싱 클래스"""
     
     BASE_URL = "https://finance.naver.com/marketindex/"
-    LINK_PATTERN = r'\(/marketindex/interestDetail\.naver\?marketindexCd=[^)]+\)'
+    SITE = "naver.interest"
     
     def __init__(self, http_client: HttpClientInterface):
         super().__init__(http_client)
@@ -36,7 +45,7 @@ class InterestParser(WebParserBase, InterestParserInterface):
     
     def _find_table_by_keyword(self, tree: html.HtmlElement, keyword: str) -> Optional[html.HtmlElement]:
         """키워드로 테이블 찾기"""
-        tables = tree.xpath('//table')
+        tables = selectors.xpath(self.SITE, "tables")(tree)
         for table in tables:
             if keyword in table.text_content():
                 return table
@@ -46,7 +55,7 @@ class InterestParser(WebParserBase, InterestParserInterface):
         """테이블 추출 및 정리"""
         html_str = html.tostring(table, encoding='unicode')
         result = self.http_client.html_to_markdown(html_str)
-        return re.sub(self.LINK_PATTERN, '', result)
+        return selectors.pattern(self.SITE, "detail_link").sub('', result)
     
     def _filter_lines(self, text: str, keywords: List[str]) -> str:
         """키워드로 라인 필터링"""
@@ -54,16 +63,29 @@ class InterestParser(WebParserBase, InterestParserInterface):
         filtered_lines = [line for line in lines if any(keyword in line for keyword in keywords)]
         return '\n'.join(filtered_lines) if filtered_lines else text
     
-    def _parse_interest_data(self, keyword: str, filter_keywords: Optional[List[str]] = None) -> str:
-        """공통 금리 데이터 파싱 로직"""
+    def _table_to_records(self, table: html.HtmlElement, keywords: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """테이블을 구조화 레코드로 변환 (키워드가 주어지면 해당 행만, 없으면 전체)"""
+        records = extract_records(table)
+        if keywords:
+            filtered = [record for record in records if any(keyword in (record.name or '') for keyword in keywords)]
+            records = filtered or records
+        return [record.to_dict() for record in records]
+    
+    def _parse_interest_data(self, keyword: str, filter_keywords: Optional[List[str]] = None,
+                             structured: bool = False) -> TableResult:
+        """공통 금리 데이터 파싱 로직 (structured면 레코드 목록)"""
+        empty: TableResult = [] if structured else ""
         try:
             tree = self.http_client.fetch_euc_kr(self.BASE_URL)
             if tree is None:
-                return ""
+                return empty
             
             table = self._find_table_by_keyword(tree, keyword)
             if table is None:
-                return ""
+                return empty
+            
+            if structured:
+                return self._table_to_records(table, [keyword])
             
             result = self._extract_and_clean_table(table)
             
@@ -73,34 +95,37 @@ class InterestParser(WebParserBase, InterestParserInterface):
             return result
         except Exception as e:
             logging.error(f"{keyword} 파싱 실패: {e}")
-            return ""
+            return empty
     
-    def get_interest_rates(self) -> str:
+    def get_interest_rates(self, structured: bool = False) -> TableResult:
         """기준금리 및 주요 금리 정보 조회"""
+        empty: TableResult = [] if structured else ""
         try:
             tree = self.http_client.fetch_euc_kr(self.BASE_URL)
             if tree is None:
-                return ""
+                return empty
             
             table = self._find_table_by_keyword(tree, '금리')
             if table is not None and 'CD금리' in table.text_content():
+                if structured:
+                    return self._table_to_records(table)
                 return self._extract_and_clean_table(table)
-            return ""
+            return empty
         except Exception as e:
             logging.error(f"금리 정보 파싱 실패: {e}")
-            return ""
+            return empty
     
-    def get_bond_yields(self) -> str:
+    def get_bond_yields(self, structured: bool = False) -> TableResult:
         """국고채 수익률 및 채권 정보 조회"""
-        return self._parse_interest_data('국고채', ['국고채', '구분', '금리', '등락률'])
+        return self._parse_interest_data('국고채', ['국고채', '구분', '금리', '등락률'], structured)
     
-    def get_cd_rates(self) -> str:
+    def get_cd_rates(self, structured: bool = False) -> TableResult:
         """CD금리 정보 조회"""
-        return self._parse_interest_data('CD금리', ['CD금리', '구분', '금리', '등락률'])
+        return self._parse_interest_data('CD금리', ['CD금리', '구분', '금리', '등락률'], structured)
     
-    def get_corporate_bonds(self) -> str:
+    def get_corporate_bonds(self, structured: bool = False) -> TableResult:
         """회사채 수익률 정보 조회"""
-        return self._parse_interest_data('회사채', ['회사채', '구분', '금리', '등락률'])
+        return self._parse_interest_data('회사채', ['회사채', '구분', '금리', '등락률'], structured)
 
 
 # 팩토리에 파서 등록
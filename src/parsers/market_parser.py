@@ -2,10 +2,19 @@
 시장 지표 정보 파싱을 위한 유틸리티 모듈
 """
 import logging
-import re
-from typing import Dict, Any
+from typing import Dict, Any, List
 from core.base_parser import WebParserBase, ParserFactory
+from core.records import TableResult
 from core.interfaces import HttpClientInterface, ParserInterface
+from core.selectors import XPathLike, selectors
+
+
+# 네이버 금융 국내증시 페이지 선택자
+selectors.register("naver.sise", "v1", xpaths={
+    "market_indices": '//*[@id="content"]/div[2]',
+    "sector_table": '//*[@id="contentarea"]',
+    "ranking_table": '//*[@id="contentarea"]/div[3]/table',
+})
 
 
 class MarketParserInterface(ParserInterface):
@@ -24,7 +33,7 @@ class MarketParserInterface(ParserInterface):
 class MarketParser(WebParserBase, MarketParserInterface):
     """네이버 금융 시장 지표 파싱 클래스"""
     
-    LINK_PATTERN = r'\(/item/main\.naver\?code=\d+\)'
+    SITE = "naver.sise"
     
     def __init__(self, http_client: HttpClientInterface):
         super().__init__(http_client)
@@ -36,7 +45,7 @@ class MarketParser(WebParserBase, MarketParserInterface):
             "top_gainers": self.get_top_gainers()
         }
     
-    def _fetch_and_extract(self, url: str, xpath: str) -> str:
+    def _fetch_and_extract(self, url: str, xpath: XPathLike) -> str:
         """공통 데이터 추출 로직"""
         try:
             tree = self.http_client.fetch_euc_kr(url)
@@ -47,75 +56,65 @@ class MarketParser(WebParserBase, MarketParserInterface):
             logging.error(f"데이터 추출 실패 ({url}): {e}")
             return ""
     
-    def _clean_market_data(self, data: str, max_lines: int = 30) -> str:
-        """시장 데이터 정리 및 최적화"""
-        if not data:
-            return ""
-        
-        # 불필요한 링크 패턴 제거
-        data = re.sub(self.LINK_PATTERN, '', data)
-        
-        lines = data.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            if self._should_skip_line(line):
-                continue
-            if self._is_valid_market_line(line):
-                cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines[:max_lines])
-    
-    def _should_skip_line(self, line: str) -> bool:
-        """스킵할 라인 판단"""
-        stripped = line.strip()
-        return (stripped == '|  | | | | | | | | | | | |' or 
-                stripped == '|  | | | | | | | | |' or 
-                not stripped)
+    def _fetch_market_rows(self, url: str, xpath: XPathLike, max_rows: int, structured: bool = False) -> TableResult:
+        """테이블 행을 직접 순회하여 유효한 시장 데이터 행만 max_rows개까지 추출 (structured면 레코드 목록)"""
+        empty: TableResult = [] if structured else ""
+        try:
+            tree = self.http_client.fetch_euc_kr(url)
+            if tree is not None:
+                return self._extract_table(tree, xpath, max_rows, self._is_valid_market_row, structured)
+            return empty
+        except Exception as e:
+            logging.error(f"데이터 추출 실패 ({url}): {e}")
+            return empty
     
-    def _is_valid_market_line(self, line: str) -> bool:
-        """유효한 시장 데이터 라인 판단"""
-        return ('|' in line and 
-                any(keyword in line for keyword in ['상승', '하락', '종목명', 'N']))
+    def _is_valid_market_row(self, cells: List[str]) -> bool:
+        """유효한 시장 데이터 행 판단"""
+        row_text = ' '.join(cells)
+        return any(keyword in row_text for keyword in ['상승', '하락', '종목명', 'N'])
     
     def get_market_indices(self) -> str:
         """주요 지수 정보 조회 (KOSPI, KOSDAQ, 코스피200)"""
         return self._fetch_and_extract(
             "https://finance.naver.com/sise/", 
-            '//*[@id="content"]/div[2]'
+            selectors.xpath(self.SITE, "market_indices")
         )
     
-    def get_sector_performance(self) -> str:
+    def get_sector_performance(self, structured: bool = False) -> TableResult:
         """업종별 등락률 정보 조회"""
-        result = self._fetch_and_extract(
+        return self._fetch_market_rows(
             "https://finance.naver.com/sise/sise_group.naver?type=upjong",
-            '//*[@id="contentarea"]'
+            selectors.xpath(self.SITE, "sector_table"),
+            50,
+            structured
         )
-        return self._clean_market_data(result, 50)
     
-    def get_top_gainers(self) -> str:
+    def get_top_gainers(self, structured: bool = False) -> TableResult:
         """상승률 상위 종목 조회"""
-        result = self._fetch_and_extract(
+        return self._fetch_market_rows(
             "https://finance.naver.com/sise/sise_rise.naver",
-            '//*[@id="contentarea"]/div[3]/table'
+            selectors.xpath(self.SITE, "ranking_table"),
+            25,
+            structured
         )
-        return self._clean_market_data(result, 25)
     
-    def get_top_losers(self) -> str:
+    def get_top_losers(self, structured: bool = False) -> TableResult:
         """하락률 상위 종목 조회"""
-        result = self._fetch_and_extract(
+        return self._fetch_market_rows(
             "https://finance.naver.com/sise/sise_fall.naver",
-            '//*[@id="contentarea"]/div[3]/table'
+            selectors.xpath(self.SITE, "ranking_table"),
+            25,
+            structured
         )
-        return self._clean_market_data(result, 25)
     
-    def get_volume_leaders(self) -> str:
+    def get_volume_leaders(self, structured: bool = False) -> TableResult:
         """거래량 상위 종목 조회"""
-        result = self._fetch_and_extract(
+        return self._fetch_market_rows(
             "https://finance.naver.com/sise/sise_quant.naver",
-            '//*[@id="contentarea"]/div[3]/table'
+            selectors.xpath(self.SITE, "ranking_table"),
+            25,
+            structured
         )
-        return self._clean_market_data(result, 25)
 
 
 # 팩토리에 파서 등록
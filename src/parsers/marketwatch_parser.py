@@ -5,6 +5,13 @@ import logging
 from typing import Dict, Any, List
 from core.base_parser import WebParserBase, ParserFactory
 from core.interfaces import HttpClientInterface, ParserInterface
+from core.selectors import selectors
+
+
+# MarketWatch 페이지 선택자
+selectors.register("marketwatch", "v1", xpaths={
+    "links": '//a[@href]',
+})
 
 
 class MarketWatchParserInterface(ParserInterface):
@@ -54,7 +61,7 @@ class MarketWatchParser(WebParserBase, MarketWatchParserInterface):
                     all_content.append("\n=== Earnings Call 리스트 ===")
                     
                     # 어닝콜 관련 링크 찾기
-                    all_links = mw_tree.xpath('//a[@href]')
+                    all_links = selectors.xpath("marketwatch", "links")(mw_tree)
                     earnings_count = 0
                     
                     for link in all_links:
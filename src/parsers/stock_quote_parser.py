@@ -2,10 +2,23 @@
 개별 종목 정보 파싱을 위한 유틸리티 모듈 (국내 주식)
 """
 import logging
-import re
 from typing import Dict, Any, List
 from core.base_parser import WebParserBase, ParserFactory
+from core.batch_executor import batch_executor
 from core.interfaces import HttpClientInterface, ParserInterface
+from core.selectors import selectors
+
+
+# 네이버 금융 종목 페이지 선택자
+selectors.register("naver.item", "v1", xpaths={
+    "current_price": '//p[@class="no_today"]/em/span[@class="blind"]/text()',
+    "change": '//p[@class="no_exday"]/em/span[@class="blind"]/text()',
+    "change_rate": '//p[@class="no_exday"]/em[2]/span[@class="blind"]/text()',
+    "volume": '//td[contains(text(), "거래량")]/following-sibling::td/text()',
+}, patterns={
+    "price": r'[\d,]+(?:\.\d+)?',
+    "percentage": r'[+-]?\d+\.\d+%',
+})
 
 
 class StockQuoteParserInterface(ParserInterface):
@@ -19,6 +32,7 @@ class StockQuoteParser(WebParserBase, StockQuoteParserInterface):
     """네이버 금융 개별 종목 정보 파싱 클래스"""
     
     BASE_URL = "https://finance.naver.com/item/main.naver"
+    SITE = "naver.item"
     
     def __init__(self, http_client: HttpClientInterface):
         super().__init__(http_client)
@@ -35,13 +49,13 @@ class StockQuoteParser(WebParserBase, StockQuoteParserInterface):
         
         try:
             # 숫자와 기본 기호만 추출하여 간단한 정보 제공
-            import re
+            site = selectors.get(self.SITE)
             
             # 가격 정보 추출 (숫자, 콤마, 소수점)
-            prices = re.findall(r'[\d,]+(?:\.\d+)?', data)
+            prices = site.pattern("price").findall(data)
             
             # 백분율 정보 추출
-            percentages = re.findall(r'[+-]?\d+\.\d+%', data)
+            percentages = site.pattern("percentage").findall(data)
             
             # 결과 정리
             result_parts = []
@@ -65,53 +79,63 @@ class StockQuoteParser(WebParserBase, StockQuoteParserInterface):
         except Exception as e:
             return f"데이터 처리 오류: {str(e)}"
     
+    def _parse_domestic_quote(self, tree) -> str:
+        """종목 페이지에서 주가 정보 추출"""
+        if tree is None:
+            return ""
+        # 주가 정보 직접 추출
+        result_parts = []
+        site = selectors.get(self.SITE)
+        
+        # 현재가 추출
+        current_price = site.xpath("current_price")(tree)
+        if current_price:
+            result_parts.append(f"현재가: {current_price[0]}")
+        
+        # 전일대비 추출
+        change = site.xpath("change")(tree)
+        if change:
+            result_parts.append(f"전일대비: {change[0]}")
+        
+        # 등락률 추출
+        change_rate = site.xpath("change_rate")(tree)
+        if change_rate:
+            result_parts.append(f"등락률: {change_rate[0]}")
+        
+        # 거래량 추출
+        volume = site.xpath("volume")(tree)
+        if volume:
+            result_parts.append(f"거래량: {volume[0].strip()}")
+        
+        # 결과 반환
+        if result_parts:
+            return ' | '.join(result_parts)
+        else:
+            # 대체 방법: 전체 페이지에서 숫자 추출
+            page_text = tree.text_content()
+            return self._clean_stock_data(page_text)
+    
     def get_domestic_stock_quote(self, ticker: str) -> str:
         """국내 개별 주식 정보 조회"""
         try:
-            url = f"{self.BASE_URL}?code={ticker}"
-            tree = self.http_client.fetch_euc_kr(url)
-            if tree is not None:
-                # 주가 정보 직접 추출
-                result_parts = []
-                
-                # 현재가 추출
-                current_price = tree.xpath('//p[@class="no_today"]/em/span[@class="blind"]/text()')
-                if current_price:
-                    result_parts.append(f"현재가: {current_price[0]}")
-                
-                # 전일대비 추출
-                change = tree.xpath('//p[@class="no_exday"]/em/span[@class="blind"]/text()')
-                if change:
-                    result_parts.append(f"전일대비: {change[0]}")
-                
-                # 등락률 추출
-                change_rate = tree.xpath('//p[@class="no_exday"]/em[2]/span[@class="blind"]/text()')
-                if change_rate:
-                    result_parts.append(f"등락률: {change_rate[0]}")
-                
-                # 거래량 추출
-                volume = tree.xpath('//td[contains(text(), "거래량")]/following-sibling::td/text()')
-                if volume:
-                    result_parts.append(f"거래량: {volume[0].strip()}")
-                
-                # 결과 반환
-                if result_parts:
-                    return ' | '.join(result_parts)
-                else:
-                    # 대체 방법: 전체 페이지에서 숫자 추출
-                    page_text = tree.text_content()
-                    return self._clean_stock_data(page_text)
+            tree = self.http_client.fetch_euc_kr(f"{self.BASE_URL}?code={ticker}")
+            return self._parse_domestic_quote(tree)
+        except Exception as e:
+            logging.error(f"국내 주식 정보 파싱 실패 ({ticker}): {e}")
             return ""
+    
+    async def get_domestic_stock_quote_async(self, ticker: str) -> str:
+        """국내 개별 주식 정보 조회 (비동기)"""
+        try:
+            tree = await self._fetch_euc_kr_async(f"{self.BASE_URL}?code={ticker}")
+            return self._parse_domestic_quote(tree)
         except Exception as e:
             logging.error(f"국내 주식 정보 파싱 실패 ({ticker}): {e}")
             return ""
     
     def get_multiple_domestic_stock_quotes(self, tickers: List[str]) -> Dict[str, str]:
-        """복수 국내 주식 정보 조회"""
-        results = {}
-        for ticker in tickers:
-            results[ticker] = self.get_domestic_stock_quote(ticker)
-        return results
+        """복수 국내 주식 정보 조회 (병렬)"""
+        return batch_executor.map(self.get_domestic_stock_quote, tickers, host="finance.naver.com")
 
 
 # 팩토리에 파서 등록
@@ -0,0 +1,473 @@
+"""
+상장 종목 로컬 인덱스 모듈 - 국내(KOSPI/KOSDAQ/KONEX), 미국 상장 전 종목과 암호화폐 목록을 내려받아 오프라인 검색
+"""
+import bisect
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from core.cache_paths import load_json, save_json
+from core.interfaces import HttpClientInterface
+from core.rate_limiter import background
+from core.search_engine import CHOSEONG
+from core.table_extractor import iter_table_rows
+
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def normalize(text: str) -> str:
+    """검색 키 정규화 (소문자, 공백 제거)"""
+    return ''.join(text.split()).lower()
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 정규화만)"""
+    result = []
+    for char in normalize(text):
+        code = ord(char) - 0xAC00
+        result.append(CHOSEONG[code // 588] if 0 <= code < 11172 else char)
+    return ''.join(result)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성만으로 이루어진 검색어인지 확인 (예: 'ㅅㅅㅈㅈ')"""
+    text = normalize(text)
+    return bool(text) and all(char in CHOSEONG_SET for char in text)
+
+
+class TickerEntry:
+    """상장 종목 한 건 (종목코드, 한글명, 영문명, 시장)"""
+    
+    __slots__ = ("code", "name", "english_name", "market", "key", "english_key", "choseong")
+    
+    def __init__(self, code: str, name: str, english_name: str = "", market: str = ""):
+        self.code = code
+        self.name = name
+        self.english_name = english_name
+        self.market = market
+        self.key = normalize(name)
+        self.english_key = normalize(english_name)
+        self.choseong = to_choseong(name)
+    
+    def to_dict(self) -> Dict[str, str]:
+        """검색 결과 형식으로 변환 (웹 검색 결과와 같은 ticker/name 키 포함)"""
+        return {"ticker": self.code, "name": self.name, "english_name": self.english_name, "market": self.market}
+    
+    def to_row(self) -> List[str]:
+        """디스크 캐시 저장 형식"""
+        return [self.code, self.name, self.english_name, self.market]
+    
+    def search_document(self) -> Tuple[str, str, List[str], Dict[str, str], Optional[int]]:
+        """검색 엔진 색인 형식 (심볼, 이름, 추가 이름들, 결과 데이터, 우선순위)"""
+        return self.code, self.name, [self.english_name, self.choseong], self.to_dict(), None
+
+
+class ListingIndex(ABC):
+    """상장 종목 목록을 디스크에 보관하고 주기적으로 갱신하는 메모리 인덱스 (하위 클래스가 다운로드 소스 정의)"""
+    
+    CACHE_FILE = ""
+    LABEL = ""
+    ENTRY_TYPE: Any = TickerEntry
+    
+    def __init__(self, http_client: HttpClientInterface, max_age: float = 24 * 3600,
+                 retry_interval: float = 600):
+        self.http_client = http_client
+        self.max_age = max_age
+        self.retry_interval = retry_interval
+        self._entries: List[TickerEntry] = []
+        self._by_code: Dict[str, TickerEntry] = {}
+        self._by_key: Dict[str, List[TickerEntry]] = {}
+        self._sorted_keys: List[Tuple[str, int]] = []
+        self._fetched_at = 0.0
+        self._last_attempt = 0.0
+        self._loaded = False
+        self._refreshing = False
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def fetched_at(self) -> float:
+        return self._fetched_at
+    
+    def snapshot(self) -> Tuple[List[TickerEntry], float]:
+        """현재 종목 목록과 수집 시각 (검색 엔진 색인용)"""
+        self.ensure_loaded()
+        with self._lock:
+            return self._entries, self._fetched_at
+    
+    @abstractmethod
+    def _sources(self) -> List[Callable[[], List[TickerEntry]]]:
+        """우선순위 순 다운로드 함수 목록 (앞의 소스가 실패하면 다음 소스 사용)"""
+        pass
+    
+    def _build(self, entries: List[TickerEntry], fetched_at: float) -> None:
+        """조회용 자료구조를 새로 만든 뒤 한 번에 교체"""
+        by_code = {entry.code: entry for entry in entries}
+        by_key: Dict[str, List[TickerEntry]] = {}
+        sorted_keys = []
+        for index, entry in enumerate(entries):
+            for key in {entry.key, entry.english_key} - {""}:
+                by_key.setdefault(key, []).append(entry)
+                sorted_keys.append((key, index))
+        sorted_keys.sort()
+        self._entries, self._by_code, self._by_key, self._sorted_keys = entries, by_code, by_key, sorted_keys
+        self._fetched_at = fetched_at
+    
+    def _load_from_disk(self) -> None:
+        """디스크 캐시 읽기 (최초 1회)"""
+        data = load_json(self.CACHE_FILE)
+        if data and data.get("entries"):
+            entries = [self.ENTRY_TYPE(*row) for row in data["entries"]]
+            self._build(entries, data.get("fetched_at", 0.0))
+    
+    def refresh(self) -> bool:
+        """전 종목 목록을 내려받아 인덱스와 디스크 캐시 갱신 (소스 실패 시 다음 소스로 대체)"""
+        self._last_attempt = time.time()
+        entries: List[TickerEntry] = []
+        for source in self._sources():
+            try:
+                entries = source()
+            except Exception as e:
+                logging.warning(f"{self.LABEL} 종목 목록 다운로드 실패 ({source.__name__}): {e}")
+            if entries:
+                break
+        if not entries:
+            return False
+        
+        fetched_at = time.time()
+        with self._lock:
+            self._build(entries, fetched_at)
+        save_json(self.CACHE_FILE, {
+            "fetched_at": fetched_at,
+            "entries": [entry.to_row() for entry in entries],
+        })
+        logging.info(f"{self.LABEL} 종목 인덱스 갱신: {len(entries)}개 종목")
+        return True
+    
+    def _refresh_in_background(self) -> None:
+        """백그라운드 스레드에서 갱신 (이미 갱신 중이면 무시)"""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+            self._last_attempt = time.time()
+        
+        def run():
+            try:
+                with background():
+                    self.refresh()
+            finally:
+                self._refreshing = False
+        
+        threading.Thread(target=run, name="ticker-index-refresh", daemon=True).start()
+    
+    def ensure_loaded(self) -> None:
+        """디스크 캐시를 읽고, 비어 있거나 오래되었으면 백그라운드에서 갱신 (그동안은 웹 검색으로 대체)"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load_from_disk()
+                    self._loaded = True
+        now = time.time()
+        if now - self._fetched_at >= self.max_age and now - self._last_attempt >= self.retry_interval:
+            self._refresh_in_background()
+    
+    def get(self, code: str) -> Optional[Dict[str, str]]:
+        """종목코드로 조회"""
+        self.ensure_loaded()
+        with self._lock:
+            entry = self._by_code.get(code.strip().upper())
+        return entry.to_dict() if entry else None
+    
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, str]]:
+        """종목코드 -> 정확 일치 -> 접두어 -> 부분 문자열 순으로 검색 (초성 검색어는 초성 기준)"""
+        self.ensure_loaded()
+        key = normalize(query)
+        with self._lock:
+            entries, by_code, by_key, sorted_keys = self._entries, self._by_code, self._by_key, self._sorted_keys
+        if not key or not entries:
+            return []
+        
+        results: Dict[str, TickerEntry] = {}
+        if key.upper() in by_code:
+            results[key.upper()] = by_code[key.upper()]
+        
+        if is_choseong_query(key):
+            # 초성 접두어 일치를 먼저, 남는 자리는 초성 부분 일치로 채움
+            candidates = [entry for entry in entries if entry.choseong.startswith(key)]
+            candidates += [entry for entry in entries if key in entry.choseong]
+        else:
+            candidates = list(by_key.get(key, []))
+            # 정렬된 키에서 접두어 구간만 탐색 (짧은 이름 우선)
+            prefixed = []
+            position = bisect.bisect_left(sorted_keys, (key, -1))
+            while position < len(sorted_keys) and len(prefixed) < limit * 2:
+                candidate_key, index = sorted_keys[position]
+                if not candidate_key.startswith(key):
+                    break
+                prefixed.append((len(candidate_key), entries[index]))
+                position += 1
+            candidates += [entry for _, entry in sorted(prefixed, key=lambda item: item[0])]
+            if len(prefixed) < limit * 2:
+                candidates += [entry for entry in entries if key in entry.key or key in entry.english_key]
+        
+        for entry in candidates:
+            if len(results) >= limit:
+                break
+            results.setdefault(entry.code, entry)
+        return [entry.to_dict() for entry in results.values()]
+
+
+class DomesticTickerIndex(ListingIndex):
+    """KRX 전 종목 인덱스 (KRX 정보데이터시스템, 실패 시 KIND 상장법인 목록)"""
+    
+    CACHE_FILE = "domestic_tickers.json"
+    LABEL = "국내"
+    KRX_JSON_URL = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+    KRX_REFERER = "http://data.krx.co.kr/contents/MDC/MDI/mdiLoader/index.cmd?menuId=MDC0201020201"
+    KIND_URL = "https://kind.krx.co.kr/corpgeneral/corpList.do?method=download&marketType={market_type}"
+    KIND_MARKETS = {"stockMkt": "KOSPI", "kosdaqMkt": "KOSDAQ", "konexMkt": "KONEX"}
+    
+    def _sources(self) -> List[Callable[[], List[TickerEntry]]]:
+        return [self._download_krx, self._download_kind]
+    
+    def _download_krx(self) -> List[TickerEntry]:
+        """KRX 정보데이터시스템 전 종목 기본정보 (영문명 포함)"""
+        response = self.http_client.request(
+            "POST", self.KRX_JSON_URL,
+            data={"bld": "dbms/MDC/STAT/standard/MDCSTAT01901", "locale": "ko_KR", "mktId": "ALL",
+                  "share": "1", "csvxls_isNo": "false"},
+            headers={"Referer": self.KRX_REFERER},
+        )
+        response.raise_for_status()
+        rows = response.json().get("OutBlock_1", [])
+        return [
+            TickerEntry(row["ISU_SRT_CD"], row["ISU_ABBRV"], row.get("ISU_ENG_NM", ""), row.get("MKT_TP_NM", ""))
+            for row in rows if row.get("ISU_SRT_CD") and row.get("ISU_ABBRV")
+        ]
+    
+    def _download_kind(self) -> List[TickerEntry]:
+        """KIND 상장법인 목록 (영문명 없음, 시장별 다운로드)"""
+        entries = []
+        for market_type, market in self.KIND_MARKETS.items():
+            tree = self.http_client.fetch_euc_kr(self.KIND_URL.format(market_type=market_type), use_cache=False)
+            if tree is None:
+                continue
+            columns: Dict[str, int] = {}
+            for cells, _ in iter_table_rows(tree):
+                if not columns:
+                    if "회사명" in cells and "종목코드" in cells:
+                        columns = {"name": cells.index("회사명"), "code": cells.index("종목코드")}
+                    continue
+                if len(cells) <= max(columns.values()):
+                    continue
+                code = cells[columns["code"]].strip()
+                code = code.zfill(6) if code.isdigit() else code
+                entries.append(TickerEntry(code, cells[columns["name"]].strip(), "", market))
+        return entries
+
+
+class OverseasTickerIndex(ListingIndex):
+    """미국 상장 전 종목 인덱스 (NASDAQ Trader 심볼 디렉터리: NASDAQ, NYSE, NYSE American, NYSE Arca 등)"""
+    
+    CACHE_FILE = "overseas_tickers.json"
+    LABEL = "해외"
+    NASDAQ_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt"
+    OTHER_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt"
+    EXCHANGES = {"A": "NYSE American", "N": "NYSE", "P": "NYSE Arca", "Z": "Cboe BZX", "V": "IEX"}
+    
+    def _sources(self) -> List[Callable[[], List[TickerEntry]]]:
+        return [self._download_nasdaq_trader]
+    
+    def _read_listing(self, url: str) -> List[Dict[str, str]]:
+        """파이프(|) 구분 심볼 파일을 행 딕셔너리 목록으로 변환 (마지막 파일 생성 시각 행 제외)"""
+        response = self.http_client.request("GET", url)
+        response.raise_for_status()
+        lines = response.text.splitlines()
+        if not lines:
+            return []
+        header = lines[0].split("|")
+        return [
+            dict(zip(header, line.split("|")))
+            for line in lines[1:] if line and not line.startswith("File Creation Time")
+        ]
+    
+    @staticmethod
+    def _security_name(name: str) -> str:
+        """'Apple Inc. - Common Stock' -> 'Apple Inc.'"""
+        return name.split(" - ")[0].strip()
+    
+    def _download_nasdaq_trader(self) -> List[TickerEntry]:
+        """NASDAQ 상장 목록과 기타 거래소 상장 목록 (테스트 종목 제외)"""
+        entries = []
+        for row in self._read_listing(self.NASDAQ_LISTED_URL):
+            if row.get("Test Issue") == "Y" or not row.get("Symbol"):
+                continue
+            entries.append(TickerEntry(row["Symbol"], self._security_name(row.get("Security Name", "")), "", "NASDAQ"))
+        for row in self._read_listing(self.OTHER_LISTED_URL):
+            if row.get("Test Issue") == "Y" or not row.get("ACT Symbol"):
+                continue
+            exchange = self.EXCHANGES.get(row.get("Exchange", ""), row.get("Exchange", ""))
+            entries.append(TickerEntry(row["ACT Symbol"], self._security_name(row.get("Security Name", "")), "", exchange))
+        return entries
+
+
+class CoinEntry:
+    """암호화폐 한 건 (CoinGecko id, 심볼, 이름, 시가총액 순위)"""
+    
+    __slots__ = ("id", "symbol", "name", "rank", "symbol_key", "key")
+    
+    def __init__(self, id: str, symbol: str, name: str, rank: Optional[int] = None):
+        self.id = id
+        self.symbol = symbol.upper()
+        self.name = name
+        self.rank = rank
+        self.symbol_key = normalize(symbol)
+        self.key = normalize(name)
+    
+    @property
+    def sort_key(self) -> Tuple[float, str]:
+        """시가총액 순위 순 (순위 없는 코인은 뒤로)"""
+        return (self.rank if self.rank else float("inf"), self.id)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """검색 결과 형식으로 변환 (CoinGecko 검색 API 결과와 같은 키)"""
+        return {"symbol": self.symbol, "name": self.name, "id": self.id,
+                "market_cap_rank": self.rank or 0, "source": "CoinGecko API"}
+    
+    def to_row(self) -> List[Any]:
+        """디스크 캐시 저장 형식"""
+        return [self.id, self.symbol, self.name, self.rank]
+    
+    def search_document(self) -> Tuple[str, str, List[str], Dict[str, Any], Optional[int]]:
+        """검색 엔진 색인 형식 (심볼, 이름, 추가 이름들, 결과 데이터, 우선순위)"""
+        return self.symbol, self.name, [self.id], self.to_dict(), self.rank
+
+
+class CoinListIndex(ListingIndex):
+    """CoinGecko 전체 코인 목록 인덱스 (심볼/이름/id 조회, 같은 심볼은 시가총액 순위 순)"""
+    
+    CACHE_FILE = "coin_list.json"
+    LABEL = "암호화폐"
+    ENTRY_TYPE = CoinEntry
+    BASE_URL = "https://api.coingecko.com/api/v3"
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (compatible; CryptoSearch/1.0)',
+        'Accept': 'application/json'
+    }
+    RANKED_PAGES = 4
+    
+    def __init__(self, http_client: HttpClientInterface, max_age: float = 6 * 3600,
+                 retry_interval: float = 600):
+        super().__init__(http_client, max_age, retry_interval)
+        self._by_id: Dict[str, CoinEntry] = {}
+        self._by_symbol: Dict[str, List[CoinEntry]] = {}
+    
+    def _sources(self) -> List[Callable[[], List[CoinEntry]]]:
+        return [self._download_coingecko]
+    
+    def _download_ranks(self) -> Dict[str, int]:
+        """시가총액 상위 코인의 순위 (페이지당 250개, 실패한 페이지는 순위 없이 진행)"""
+        ranks: Dict[str, int] = {}
+        for page in range(1, self.RANKED_PAGES + 1):
+            data = self.http_client.fetch_json(
+                f"{self.BASE_URL}/coins/markets",
+                params={'vs_currency': 'usd', 'order': 'market_cap_desc', 'per_page': 250, 'page': page},
+                headers=self.HEADERS,
+            )
+            if not data:
+                break
+            for coin in data:
+                if coin.get('id') and coin.get('market_cap_rank'):
+                    ranks[coin['id']] = coin['market_cap_rank']
+        return ranks
+    
+    def _download_coingecko(self) -> List[CoinEntry]:
+        """CoinGecko 전체 코인 목록과 시가총액 순위"""
+        coins = self.http_client.fetch_json(f"{self.BASE_URL}/coins/list", timeout=30, headers=self.HEADERS)
+        if not coins:
+            return []
+        ranks = self._download_ranks()
+        entries = [
+            CoinEntry(coin['id'], coin.get('symbol', ''), coin.get('name', ''), ranks.get(coin['id']))
+            for coin in coins if coin.get('id') and coin.get('symbol')
+        ]
+        entries.sort(key=lambda entry: entry.sort_key)
+        return entries
+    
+    def _build(self, entries: List[CoinEntry], fetched_at: float) -> None:
+        """id/심볼/이름 조회용 자료구조를 새로 만든 뒤 한 번에 교체 (목록은 순위 순 정렬)"""
+        entries = sorted(entries, key=lambda entry: entry.sort_key)
+        by_id = {entry.id: entry for entry in entries}
+        by_symbol: Dict[str, List[CoinEntry]] = {}
+        by_key: Dict[str, List[CoinEntry]] = {}
+        sorted_keys = []
+        for index, entry in enumerate(entries):
+            by_symbol.setdefault(entry.symbol_key, []).append(entry)
+            if entry.key:
+                by_key.setdefault(entry.key, []).append(entry)
+                sorted_keys.append((entry.key, index))
+        sorted_keys.sort()
+        self._entries, self._by_id, self._by_symbol, self._by_key, self._sorted_keys = (
+            entries, by_id, by_symbol, by_key, sorted_keys)
+        self._fetched_at = fetched_at
+    
+    def get(self, coin_id: str) -> Optional[Dict[str, Any]]:
+        """CoinGecko id로 조회"""
+        self.ensure_loaded()
+        with self._lock:
+            entry = self._by_id.get(coin_id.strip().lower())
+        return entry.to_dict() if entry else None
+    
+    def resolve_symbols(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """여러 심볼을 한 번에 가장 시가총액 순위가 높은 코인으로 변환 (없으면 None)"""
+        self.ensure_loaded()
+        with self._lock:
+            by_symbol = self._by_symbol
+        resolved: Dict[str, Optional[Dict[str, Any]]] = {}
+        for symbol in symbols:
+            # 'BTC-KRW', 'ETH-USD' 같은 시세 심볼은 기초 자산 심볼만 사용
+            matches = by_symbol.get(normalize(symbol.split("-")[0]))
+            resolved[symbol] = matches[0].to_dict() if matches else None
+        return resolved
+    
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """심볼 -> id -> 이름 정확 일치 -> 이름 접두어 -> 부분 문자열 순으로 검색 (각 단계는 순위 순)"""
+        self.ensure_loaded()
+        key = normalize(query)
+        with self._lock:
+            entries, by_id, by_symbol, by_key, sorted_keys = (
+                self._entries, self._by_id, self._by_symbol, self._by_key, self._sorted_keys)
+        if not key or not entries:
+            return []
+        
+        candidates: List[CoinEntry] = list(by_symbol.get(key, []))
+        if query.strip().lower() in by_id:
+            candidates.append(by_id[query.strip().lower()])
+        candidates += by_key.get(key, [])
+        
+        prefixed = []
+        position = bisect.bisect_left(sorted_keys, (key, -1))
+        while position < len(sorted_keys) and len(prefixed) < limit * 2:
+            candidate_key, index = sorted_keys[position]
+            if not candidate_key.startswith(key):
+                break
+            prefixed.append(entries[index])
+            position += 1
+        candidates += sorted(prefixed, key=lambda entry: entry.sort_key)
+        if len(prefixed) < limit * 2:
+            for entry in entries:
+                if key in entry.key:
+                    candidates.append(entry)
+                    if len(candidates) >= limit * 4:
+                        break
+        
+        results: Dict[str, CoinEntry] = {}
+        for entry in candidates:
+            if len(results) >= limit:
+                break
+            results.setdefault(entry.id, entry)
+        return [entry.to_dict() for entry in results.values()]
@@ -3,227 +3,221 @@
 """
 import logging
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from urllib.parse import quote
+from lxml import html
 from core.base_parser import BaseTickerParser, ParserFactory
 from core.interfaces import HttpClientInterface
+from core.selectors import selectors
+from parsers.ticker_index import DomesticTickerIndex
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 네이버 금융 검색 페이지(및 리다이렉트 대상 종목 페이지) 선택자
+selectors.register("naver.search", "v1", xpaths={
+    # 리다이렉트 스크립트, 단일 종목 페이지의 종목명/종목코드, 국내/해외 결과 표와 각 행 첫 열의 첫 링크
+    # (문서 순서로 한 번에, 결과 표 요소가 해당 구역 링크보다 먼저 나옴: 국내는 table, 해외는 tbody)
+    "results": (
+        '//script'
+        ' | //*[@id="middle"]//h2/a'
+        ' | //input[@id="code"]'
+        ' | //*[@id="content"]/div[4]/table'
+        ' | //*[@id="content"]/div[4]/table//tr/td[1]/descendant::a[@href][1]'
+        ' | //*[@id="content"]/div[8]/table/tbody'
+        ' | //*[@id="content"]/div[8]/table/tbody/tr/td[1]/descendant::a[@href][1]'
+    ),
+    "item_name": '//*[@id="middle"]//h2/a',
+}, patterns={
+    "redirect": r'location\.href\s*=\s*["\']([^"\']+)["\']',
+    "domestic_href": r'/item/main\.naver\?code=([0-9A-Z]+)',
+    "overseas_href": r'/stock/([A-Z]+)',
+    "code": r'code=([0-9A-Z]+)',
+})
+
+
+class SearchPageResult:
+    """네이버 검색 페이지 한 장에서 추출한 결과"""
+    
+    __slots__ = ("redirect_url", "single", "domestic", "overseas")
+    
+    def __init__(self):
+        self.redirect_url: Optional[str] = None
+        self.single: Optional[Dict[str, str]] = None
+        self.domestic: List[Dict[str, str]] = []
+        self.overseas: List[Dict[str, str]] = []
 
 
 class TickerParser(BaseTickerParser):
     """네이버 금융 티커 정보 파싱 클래스"""
     
     BASE_URL = "https://finance.naver.com/search/search.naver"
+    ITEM_URL = "https://finance.naver.com/item/main.naver"
+    SITE = "naver.search"
     
     def __init__(self, http_client: HttpClientInterface):
         super().__init__(http_client)
+        self.ticker_index = DomesticTickerIndex(http_client)
+        self._names: Dict[str, str] = {}
     
     def _clean_text(self, text: str) -> str:
         """HTML 태그와 불필요한 공백을 제거합니다."""
         if not text:
             return ""
         # HTML 태그 제거
-        clean_text = re.sub(r'<[^>]+>', '', text)
+        clean_text = TAG_PATTERN.sub('', text)
         # 연속된 공백을 하나로 변환
-        clean_text = re.sub(r'\s+', ' ', clean_text)
+        clean_text = WHITESPACE_PATTERN.sub(' ', clean_text)
         return clean_text.strip()
     
+    def parse(self, query: str) -> Dict[str, Any]:
+        return self.search(query)
+    
+    def search(self, query: str) -> Dict[str, List[Dict[str, str]]]:
+        """국내/해외 티커 통합 검색 (네이버 검색 페이지는 한 번만 조회해 두 결과를 함께 추출)"""
+        indexed = self.ticker_index.search(query)
+        page = self._search_page(query)
+        return {
+            "domestic": indexed or self._domestic_results(page),
+            "overseas": page.overseas if page is not None else [],
+        }
+    
     def search_domestic(self, query: str) -> List[Dict[str, str]]:
-        """국내 티커 검색"""
-        tree, content = self._fetch_search_page(query)
-        if tree is None:
+        """국내 티커 검색 (로컬 종목 인덱스에서 먼저 찾고, 없을 때만 네이버 검색)"""
+        indexed = self.ticker_index.search(query)
+        if indexed:
+            return indexed
+        return self._domestic_results(self._search_page(query))
+    
+    def search_overseas(self, query: str) -> List[Dict[str, str]]:
+        """해외 티커 검색"""
+        page = self._search_page(query)
+        return page.overseas if page is not None else []
+    
+    def _domestic_results(self, page: Optional["SearchPageResult"]) -> List[Dict[str, str]]:
+        """검색 페이지 결과에서 국내 티커 목록 결정 (리다이렉트 -> 단일 종목 페이지 -> 결과 목록 순)"""
+        if page is None:
             return []
         
         # JavaScript 리다이렉트 확인 (검색 결과 1개일 때)
-        redirect_ticker = self._check_js_redirect(content)
-        if redirect_ticker:
-            return [redirect_ticker]
+        if page.redirect_url:
+            redirect_ticker = self._check_js_redirect(page.redirect_url)
+            if redirect_ticker:
+                return [redirect_ticker]
         
         # 검색 결과가 1개면 종목 페이지로 리다이렉트됨
-        single_ticker = self._parse_single_ticker_page(tree)
-        if single_ticker:
-            return [single_ticker]
+        if page.single:
+            return [page.single]
         
         # 여러 개면 검색 결과 리스트 페이지
-        return self._parse_domestic_tickers(tree)
-    
-    def search_overseas(self, query: str) -> List[Dict[str, str]]:
-        """해외 티커 검색"""
-        tree, _ = self._fetch_search_page(query)
-        return self._parse_overseas_tickers(tree) if tree is not None else []
-    
-    def _fetch_search_page(self, query: str):
-        """검색 페이지 가져오기"""
-        try:
-            encoded_query = quote(query)
-            url = f"{self.BASE_URL}?query={encoded_query}&endUrl=&encoding=UTF-8&page=1"
-            
-            # 원본 콘텐츠도 함께 반환 (JavaScript 리다이렉트 확인용)
-            import requests
-            response = self.http_client.session.get(url)
-            response.raise_for_status()
-            content = response.content.decode('euc-kr', errors='ignore')
-            
-            from lxml import html
-            tree = html.fromstring(content)
-            return tree, content
-        except Exception as e:
-            logging.error(f"티커 검색 중 오류 발생: {e}")
-            return None, None
+        return page.domestic
     
-    def _check_js_redirect(self, content: str) -> Dict[str, str]:
-        """
-        JavaScript 리다이렉트를 확인하고 종목 페이지에서 정보를 가져옵니다.
-        
-        Args:
-            content: HTML 콘텐츠 문자열
-            
-        Returns:
-            Dict[str, str]: 티커 정보 또는 None
-        """
+    def _search_page(self, query: str) -> Optional["SearchPageResult"]:
+        """검색 페이지를 공용 클라이언트로 가져와서 결과 추출 (캐시, 커넥션 풀, 타임아웃 공유)"""
         try:
-            # location.href = '/item/main.naver?code=080160' 패턴 찾기
-            redirect_match = re.search(r'location\.href\s*=\s*["\']([^"\']+)["\']', content)
-            if not redirect_match:
-                return None
-            
-            redirect_url = redirect_match.group(1)
-            code_match = re.search(r'code=([0-9A-Z]+)', redirect_url)
-            if not code_match:
-                return None
-            
-            ticker_code = code_match.group(1)
-            
-            # 종목 페이지에서 종목명 가져오기
-            item_url = f"https://finance.naver.com{redirect_url}" if redirect_url.startswith('/') else redirect_url
-            tree = self.http_client.fetch_utf8(item_url)
+            url = f"{self.BASE_URL}?query={quote(query)}&endUrl=&encoding=UTF-8&page=1"
+            tree = self.http_client.fetch_euc_kr(url)
             if tree is None:
                 return None
-            
-            # 종목명 추출
-            name_elem = tree.xpath('//*[@id="middle"]//h2/a')
-            if name_elem:
-                company_name = self._clean_text(name_elem[0].text_content())
-                return {
-                    "ticker": ticker_code,
-                    "name": company_name
-                }
-            
-            return None
+            return self._extract_search_results(tree)
         except Exception as e:
-            logging.debug(f"JavaScript 리다이렉트 처리 실패: {e}")
+            logging.error(f"티커 검색 중 오류 발생: {e}")
             return None
     
-    def _parse_single_ticker_page(self, tree) -> Dict[str, str]:
+    def _extract_search_results(self, tree: html.HtmlElement) -> "SearchPageResult":
+        """리다이렉트 스크립트, 단일 종목 정보, 국내/해외 결과 링크를 한 번의 XPath 순회로 추출"""
+        site = selectors.get(self.SITE)
+        redirect_pattern = site.pattern("redirect")
+        domestic_pattern = site.pattern("domestic_href")
+        overseas_pattern = site.pattern("overseas_href")
+        result = SearchPageResult()
+        name = code = None
+        sections = {}
+        for element in site.xpath("results")(tree):
+            tag = element.tag
+            if tag == 'script':
+                # location.href = '/item/main.naver?code=080160' 패턴 찾기
+                if result.redirect_url is None and element.text:
+                    redirect_match = redirect_pattern.search(element.text)
+                    if redirect_match:
+                        result.redirect_url = redirect_match.group(1)
+            elif tag == 'input':
+                code = code or element.get('value')
+            elif tag == 'table':
+                sections[element] = (result.domestic, domestic_pattern)
+            elif tag == 'tbody':
+                sections[element] = (result.overseas, overseas_pattern)
+            elif tag == 'a':
+                section = next((sections[ancestor] for ancestor in element.iterancestors()
+                                if ancestor in sections), None)
+                if section is None:
+                    # 단일 종목 페이지의 종목명 링크
+                    name = name or self._clean_text(element.text_content())
+                    continue
+                # 국내: /item/main.naver?code=005930에서 005930 추출
+                # 해외: https://m.stock.naver.com/worldstock/stock/TSLA.O/total에서 TSLA 추출
+                tickers, pattern = section
+                ticker_match = pattern.search(element.get('href', ''))
+                if ticker_match:
+                    tickers.append({
+                        "ticker": ticker_match.group(1),
+                        "name": self._clean_text(element.text_content())
+                    })
+        if name and code:
+            result.single = {"ticker": code, "name": name}
+        return result
+    
+    def _check_js_redirect(self, redirect_url: str) -> Optional[Dict[str, str]]:
         """
-        단일 종목 페이지에서 티커 정보를 파싱합니다.
-        검색 결과가 1개일 때 바로 종목 페이지로 리다이렉트됩니다.
+        JavaScript 리다이렉트 대상 종목의 티커 정보를 만듭니다.
         
         Args:
-            tree: lxml HTML 트리 객체
+            redirect_url: location.href로 지정된 종목 페이지 URL
             
         Returns:
             Dict[str, str]: 티커 정보 또는 None
         """
-        try:
-            # 종목명 추출: //*[@id="middle"]/div[1]/div[1]/h2/a
-            name_elem = tree.xpath('//*[@id="middle"]//h2/a')
-            if not name_elem:
-                return None
-            
-            company_name = self._clean_text(name_elem[0].text_content())
-            
-            # 종목코드 추출: URL에서 code 파라미터
-            code_elem = tree.xpath('//input[@id="code"]')
-            if code_elem:
-                ticker_code = code_elem[0].get('value')
-                if ticker_code:
-                    return {
-                        "ticker": ticker_code,
-                        "name": company_name
-                    }
-            
+        code_match = selectors.pattern(self.SITE, "code").search(redirect_url)
+        if not code_match:
             return None
-        except Exception as e:
-            logging.debug(f"단일 종목 페이지 파싱 실패: {e}")
+        
+        ticker_code = code_match.group(1)
+        company_name = self.resolve_name(ticker_code, redirect_url)
+        if not company_name:
             return None
+        return {
+            "ticker": ticker_code,
+            "name": company_name
+        }
     
-    def _parse_domestic_tickers(self, tree) -> List[Dict[str, str]]:
-        """
-        국내 주식 티커 정보를 파싱합니다.
+    def resolve_name(self, code: str, item_url: Optional[str] = None) -> Optional[str]:
+        """종목코드 -> 종목명 (메모 -> 로컬 종목 인덱스 -> 종목 페이지 순, 페이지 조회는 인덱스에 없을 때만)"""
+        name = self._names.get(code)
+        if name:
+            return name
         
-        XPath: //*[@id="content"]/div[4]/table//tr
-        
-        Args:
-            tree: lxml HTML 트리 객체
-            
-        Returns:
-            List[Dict[str, str]]: 국내 티커 목록
-        """
-        try:
-            rows = tree.xpath('//*[@id="content"]/div[4]/table//tr')
-            tickers = []
-            
-            for row in rows:
-                tds = row.xpath('./td')
-                if not tds:  # 헤더 행 스킵
-                    continue
-                    
-                # 첫 번째 td에서 링크 찾기
-                link_elem = row.xpath('./td[1]//a[@href]')
-                if link_elem:
-                    href = link_elem[0].get('href')
-                    # /item/main.naver?code=005930에서 005930 추출
-                    code_match = re.search(r'code=([0-9A-Z]+)', href)
-                    if code_match:
-                        ticker_code = code_match.group(1)
-                        company_name = self._clean_text(link_elem[0].text_content())
-                        tickers.append({
-                            "ticker": ticker_code,
-                            "name": company_name
-                        })
-            
-            return tickers
-        except Exception as e:
-            logging.debug(f"국내 티커 파싱 실패: {e}")
-            return []
+        entry = self.ticker_index.get(code)
+        name = entry["name"] if entry else self._fetch_item_name(code, item_url)
+        if name:
+            self._names[code] = name
+        return name
     
-    def _parse_overseas_tickers(self, tree) -> List[Dict[str, str]]:
-        """
-        해외 주식 티커 정보를 파싱합니다.
-        
-        XPath: //*[@id="content"]/div[8]/table/tbody/tr/td[1]
-        
-        Args:
-            tree: lxml HTML 트리 객체
-            
-        Returns:
-            List[Dict[str, str]]: 해외 티커 목록
-        """
+    def _fetch_item_name(self, code: str, item_url: Optional[str] = None) -> Optional[str]:
+        """종목 페이지에서 종목명 가져오기 (신규 상장 등 인덱스에 아직 없는 종목용)"""
         try:
-            rows = tree.xpath('//*[@id="content"]/div[8]/table/tbody/tr')
-            tickers = []
-            
-            for row in rows:
-                ticker_elem = row.xpath('./td[1]')
-                if ticker_elem:
-                    # 링크에서 티커 코드 추출
-                    link_elem = ticker_elem[0].xpath('.//a[@href]')
-                    if link_elem:
-                        href = link_elem[0].get('href')
-                        # https://m.stock.naver.com/worldstock/stock/TSLA.O/total에서 TSLA 추출
-                        ticker_match = re.search(r'/stock/([A-Z]+)', href)
-                        if ticker_match:
-                            ticker_code = ticker_match.group(1)
-                            company_name = self._clean_text(link_elem[0].text_content())
-                            tickers.append({
-                                "ticker": ticker_code,
-                                "name": company_name
-                            })
+            if not item_url:
+                item_url = f"{self.ITEM_URL}?code={code}"
+            elif item_url.startswith('/'):
+                item_url = f"https://finance.naver.com{item_url}"
+            tree = self.http_client.fetch_utf8(item_url)
+            if tree is None:
+                return None
             
-            return tickers
+            name_elem = selectors.xpath(self.SITE, "item_name")(tree)
+            return self._clean_text(name_elem[0].text_content()) if name_elem else None
         except Exception as e:
-            logging.warning(f"해외 티커 파싱 실패: {e}")
-            return []
+            logging.debug(f"종목명 조회 실패 ({code}): {e}")
+            return None
 
 
 # 팩토리에 파서 등록
@@ -1,11 +1,35 @@
 """
 Yahoo Finance 글로벌 금융 데이터 파싱을 위한 유틸리티 모듈
 """
+import asyncio
 import logging
-import re
-from typing import Dict, Any, List
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional
+from lxml import html
 from core.base_parser import WebParserBase, ParserFactory
+from core.batch_executor import batch_executor
 from core.interfaces import HttpClientInterface, ParserInterface
+from core.records import TableResult, map_columns, record_from_cells
+from core.selectors import XPathLike, selectors
+from core.table_extractor import iter_table_rows, rows_to_markdown
+from parsers.ticker_index import OverseasTickerIndex
+
+
+# Yahoo Finance 페이지 선택자
+selectors.register("yahoo", "v1", xpaths={
+    "vix_quote": '//div[contains(@class, "quote")]',
+    # QUOTE_SELECTOR, QUOTE_REQUIRED와 같은 조건
+    "quote_price": '//div[contains(@class, "price")]',
+    "quote_title": '//h1',
+    "tables": '//table',
+    "lookup_rows": '//table//tr',
+    # lookup_rows의 행 기준 상대 경로 (셀, 첫 셀의 티커 링크)
+    "lookup_cells": './/td',
+    "lookup_link": './/a',
+}, patterns={
+    "quote_link": r'\(/quote/[^)]+\)',
+})
 
 
 class YahooParserInterface(ParserInterface):
@@ -18,13 +42,85 @@ class YahooParserInterface(ParserInterface):
         pass
 
 
+# 세계 지수 심볼별 지역 (목록에 없는 심볼은 지수 이름 키워드로 분류)
+WORLD_INDEX_REGIONS: Dict[str, str] = {
+    **dict.fromkeys(["^GSPC", "^DJI", "^IXIC", "^NYA", "^XAX", "^RUT", "^VIX", "^GSPTSE", "^BVSP", "^MXX",
+                     "^IPSA", "^MERV"], "americas"),
+    **dict.fromkeys(["^FTSE", "^GDAXI", "^FCHI", "^STOXX50E", "^N100", "^BFX", "^BUK100P", "^IBEX", "^AEX",
+                     "^SSMI", "MOEX.ME", "^125904-USD-STRD"], "europe"),
+    **dict.fromkeys(["^N225", "^HSI", "000001.SS", "399001.SZ", "^STI", "^AXJO", "^AORD", "^BSESN", "^NSEI",
+                     "^JKSE", "^KLSE", "^NZ50", "^KS11", "^KQ11", "^TWII"], "asia"),
+    **dict.fromkeys(["^TA125.TA", "^CASE30", "^JN0U.JO"], "middle_east_africa"),
+    **dict.fromkeys(["DX-Y.NYB", "^XDB", "^XDE", "^XDN", "^XDA"], "currency"),
+}
+
+
+class WorldIndices:
+    """세계 지수 페이지 한 번의 파싱 결과 (지역/심볼 색인 포함, 생성 후 변경하지 않음)"""
+    
+    __slots__ = ("header", "rows", "records", "by_region", "by_symbol", "fetched_at")
+    
+    def __init__(self, header: List[str], rows: List[List[str]], records: List[Dict[str, Any]], fetched_at: float):
+        self.header = header
+        self.rows = rows
+        self.records = records
+        self.fetched_at = fetched_at
+        self.by_region: Dict[str, List[int]] = {}
+        self.by_symbol: Dict[str, int] = {}
+        for index, record in enumerate(records):
+            self.by_region.setdefault(record["region"], []).append(index)
+            if record.get("symbol"):
+                self.by_symbol[record["symbol"].upper()] = index
+    
+    def select(self, regions: Optional[Iterable[str]] = None, symbols: Optional[Iterable[str]] = None,
+               max_rows: Optional[int] = None) -> List[int]:
+        """지역/심볼 조건에 맞는 행 번호 (원래 페이지 순서 유지)"""
+        if regions is None and symbols is None:
+            selected = range(len(self.records))
+        else:
+            chosen = set()
+            for region in regions or ():
+                chosen.update(self.by_region.get(region.lower(), ()))
+            for symbol in symbols or ():
+                index = self.by_symbol.get(symbol.upper())
+                if index is not None:
+                    chosen.add(index)
+            selected = sorted(chosen)
+        return list(selected)[:max_rows] if max_rows is not None else list(selected)
+    
+    def render(self, indexes: List[int], structured: bool = False) -> TableResult:
+        """선택한 행을 레코드 목록 또는 마크다운 표로 변환"""
+        if structured:
+            return [dict(self.records[index]) for index in indexes]
+        if not indexes:
+            return ""
+        return rows_to_markdown([(self.header, True)] + [(self.rows[index], False) for index in indexes])
+
+
 class YahooParser(WebParserBase, YahooParserInterface):
     """Yahoo Finance 글로벌 금융 데이터 파싱 클래스"""
     
-    BASE_URL = "https://finance.yahoo.com"
+    HOST = "finance.yahoo.com"
+    BASE_URL = f"https://{HOST}"
+    WORLD_INDICES_URL = f"{BASE_URL}/world-indices/"
+    SITE = "yahoo"
+    # 시세 페이지는 가격 영역 5개와 종목명(h1)이 모두 닫히면 중단 (_parse_quote가 읽는 요소 전부)
+    QUOTE_SELECTOR = "div.price"
+    QUOTE_PRICE_COUNT = 5
+    QUOTE_REQUIRED = ("h1",)
+    ASIAN_KEYWORDS = ['Nikkei', 'Hang Seng', 'Shanghai', 'KOSPI', 'Taiwan', 'BSE']
+    EUROPEAN_KEYWORDS = ['FTSE', 'DAX', 'CAC', 'IBEX', 'AEX', 'SMI']
+    GLOBAL_MAX_ROWS = 20
+    REGION_MAX_ROWS = 15
     
-    def __init__(self, http_client: HttpClientInterface):
+    def __init__(self, http_client: HttpClientInterface, snapshot_ttl: float = 30):
         super().__init__(http_client)
+        self.overseas_index = OverseasTickerIndex(http_client)
+        self.snapshot_ttl = snapshot_ttl
+        self._world_indices: Optional[WorldIndices] = None
+        self._world_lock = threading.Lock()
+        # 비동기 재구성 중인 요청 (동시 호출은 같은 결과를 기다림)
+        self._world_pending: Optional[asyncio.Future] = None
     
     def parse(self, *args, **kwargs) -> Dict[str, Any]:
         return {
@@ -36,134 +132,217 @@ class YahooParser(WebParserBase, YahooParserInterface):
         """데이터 정리"""
         if not data:
             return ""
-        data = re.sub(r'\(/quote/[^)]+\)', '', data)
+        data = selectors.pattern(self.SITE, "quote_link").sub('', data)
         lines = [line.strip() for line in data.split('\n') if line.strip() and '|' in line]
         return '\n'.join(lines[:20])
     
-    def get_global_indices(self) -> str:
-        """글로벌 주요 지수 정보 조회"""
+    def _parse_section(self, tree, xpath: Optional[XPathLike] = None, structured: bool = False) -> TableResult:
+        """페이지에서 섹션 추출 (xpath가 없으면 첫 번째 테이블 행을 직접 추출)
+        
+        structured는 테이블 섹션에만 적용되며 레코드 딕셔너리 목록을 반환합니다.
+        """
+        if tree is None:
+            return [] if structured and xpath is None else ""
+        if xpath is None:
+            return self._extract_table(tree, selectors.xpath(self.SITE, "tables"), 20, structured=structured)
+        result = self._extract_element(tree, xpath) or ""
+        return self._clean_data(result)
+    
+    def _fetch_section(self, url: str, label: str, xpath: Optional[XPathLike] = None,
+                       structured: bool = False) -> TableResult:
+        """페이지 조회 후 섹션 추출"""
         try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/world-indices/")
-            if tree is not None:
-                result = self._extract_element(tree, '//table') or ""
-                return self._clean_data(result)
-            return ""
+            tree = self.http_client.fetch_utf8(url)
+            return self._parse_section(tree, xpath, structured)
         except Exception as e:
-            logging.error(f"글로벌 지수 파싱 실패: {e}")
-            return ""
+            logging.error(f"{label} 파싱 실패: {e}")
+            return [] if structured and xpath is None else ""
     
-    def get_us_treasury_yields(self) -> str:
-        """미국 국채 수익률 정보 조회"""
+    async def _fetch_section_async(self, url: str, label: str, xpath: Optional[XPathLike] = None,
+                                   structured: bool = False) -> TableResult:
+        """페이지 비동기 조회 후 섹션 추출"""
         try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/bonds/")
-            if tree is not None:
-                result = self._extract_element(tree, '//table') or ""
-                return self._clean_data(result)
-            return ""
+            tree = await self._fetch_utf8_async(url)
+            return self._parse_section(tree, xpath, structured)
         except Exception as e:
-            logging.error(f"미국 국채 수익률 파싱 실패: {e}")
-            return ""
+            logging.error(f"{label} 파싱 실패: {e}")
+            return [] if structured and xpath is None else ""
     
-    def get_vix_data(self) -> str:
-        """VIX 공포지수 정보 조회"""
-        try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/quote/%5EVIX/")
-            if tree is not None:
-                result = self._extract_element(tree, '//div[contains(@class, "quote")]') or ""
-                return self._clean_data(result)
+    def _parse_quote(self, tree, symbol: str) -> str:
+        """시세 페이지에서 가격 정보와 종목명 추출"""
+        if tree is None:
             return ""
-        except Exception as e:
-            logging.error(f"VIX 데이터 파싱 실패: {e}")
+        site = selectors.get(self.SITE)
+        # 가격 정보 추출 (QUOTE_SELECTOR와 같은 조건)
+        price_elements = site.xpath("quote_price")(tree)
+        if not price_elements:
             return ""
+        price_data = []
+        for elem in price_elements[:self.QUOTE_PRICE_COUNT]:  # 상위 5개만
+            text = elem.text_content().strip()
+            if text and len(text) < 50:  # 짧은 텍스트만
+                price_data.append(text)
+        
+        # 종목 이름 추출
+        title_elem = site.xpath("quote_title")(tree)
+        title = title_elem[0].text_content().strip() if title_elem else symbol
+        
+        return f"**{title}**\n" + "\n".join(price_data[:10])
     
-    def get_commodities(self) -> str:
-        """글로벌 원자재 가격 정보 조회"""
+    @staticmethod
+    def _normalize_crypto_symbol(symbol: str) -> str:
+        """암호화폐 심볼 정규화 (BTC -> BTC-USD)"""
+        return symbol if symbol.endswith('-USD') else f"{symbol}-USD"
+    
+    def _classify_region(self, symbol: Optional[str], name: Optional[str]) -> str:
+        """지수의 지역 (심볼 표 우선, 없으면 이름 키워드)"""
+        region = WORLD_INDEX_REGIONS.get((symbol or "").upper())
+        if region:
+            return region
+        if any(keyword in (name or "") for keyword in self.ASIAN_KEYWORDS):
+            return "asia"
+        if any(keyword in (name or "") for keyword in self.EUROPEAN_KEYWORDS):
+            return "europe"
+        return "other"
+    
+    def _build_world_indices(self, tree: Optional[html.HtmlElement]) -> Optional[WorldIndices]:
+        """세계 지수 테이블을 한 번 순회해 행, 레코드, 지역/심볼 색인 생성"""
+        if tree is None:
+            return None
+        tables = selectors.xpath(self.SITE, "tables")(tree)
+        if not tables:
+            return None
+        header: List[str] = []
+        columns: Dict[str, int] = {}
+        rows: List[List[str]] = []
+        records: List[Dict[str, Any]] = []
+        for cells, is_header in iter_table_rows(tables[0]):
+            if not columns:
+                header, columns = cells, map_columns(cells)
+                continue
+            if is_header:
+                continue
+            record = record_from_cells(cells, columns)
+            if record is None:
+                continue
+            item = record.to_dict()
+            item["region"] = self._classify_region(record.symbol, record.name)
+            rows.append(cells)
+            records.append(item)
+        if not records:
+            return None
+        return WorldIndices(header, rows, records, time.monotonic())
+    
+    def _world_indices_fresh(self) -> Optional[WorldIndices]:
+        """유효 기간 안의 세계 지수 데이터 (없거나 만료되었으면 None)"""
+        dataset = self._world_indices
+        if dataset is not None and time.monotonic() - dataset.fetched_at < self.snapshot_ttl:
+            return dataset
+        return None
+    
+    def _load_world_indices(self) -> Optional[WorldIndices]:
+        """세계 지수 데이터 반환 (만료 시 페이지 한 번만 다시 가져와 전체 재구성)"""
+        dataset = self._world_indices_fresh()
+        if dataset is not None:
+            return dataset
+        with self._world_lock:
+            dataset = self._world_indices_fresh()
+            if dataset is None:
+                dataset = self._build_world_indices(self.http_client.fetch_utf8(self.WORLD_INDICES_URL))
+                if dataset is not None:
+                    self._world_indices = dataset
+        return dataset
+    
+    async def _load_world_indices_async(self) -> Optional[WorldIndices]:
+        """세계 지수 데이터 반환 (비동기, 만료 시 동시 호출은 진행 중인 한 번의 재구성을 함께 기다림)"""
+        dataset = self._world_indices_fresh()
+        if dataset is not None:
+            return dataset
+        pending = self._world_pending
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._world_pending = future
         try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/commodities/")
-            if tree is not None:
-                result = self._extract_element(tree, '//table') or ""
-                return self._clean_data(result)
-            return ""
-        except Exception as e:
-            logging.error(f"원자재 데이터 파싱 실패: {e}")
-            return ""
+            dataset = self._build_world_indices(await self._fetch_utf8_async(self.WORLD_INDICES_URL))
+            if dataset is not None:
+                self._world_indices = dataset
+            future.set_result(dataset)
+            return dataset
+        except BaseException:
+            # 선행 요청이 실패/취소되면 대기 중인 요청은 조회 실패(None)로 처리
+            future.set_result(None)
+            raise
+        finally:
+            self._world_pending = None
     
-    def get_forex_majors(self) -> str:
-        """주요 환율 정보 조회"""
+    def _world_indices_view(self, dataset: Optional[WorldIndices], regions: Optional[List[str]],
+                            symbols: Optional[List[str]], max_rows: Optional[int], structured: bool) -> TableResult:
+        """세계 지수 데이터에서 지역/심볼 조건에 맞는 행만 반환"""
+        if dataset is None:
+            return [] if structured else ""
+        return dataset.render(dataset.select(regions, symbols, max_rows), structured)
+    
+    def get_world_indices(self, regions: Optional[List[str]] = None, symbols: Optional[List[str]] = None,
+                          structured: bool = False, max_rows: Optional[int] = None) -> TableResult:
+        """세계 지수 조회 (regions: americas/europe/asia/middle_east_africa/currency, symbols: ^GSPC 등)"""
         try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/currencies/")
-            if tree is not None:
-                result = self._extract_element(tree, '//table') or ""
-                return self._clean_data(result)
-            return ""
+            return self._world_indices_view(self._load_world_indices(), regions, symbols, max_rows, structured)
         except Exception as e:
-            logging.error(f"환율 데이터 파싱 실패: {e}")
-            return ""
+            logging.error(f"세계 지수 파싱 실패: {e}")
+            return [] if structured else ""
     
-    def get_asian_indices(self) -> str:
-        """아시아 주요 지수 정보 조회"""
+    async def get_world_indices_async(self, regions: Optional[List[str]] = None,
+                                      symbols: Optional[List[str]] = None, structured: bool = False,
+                                      max_rows: Optional[int] = None) -> TableResult:
+        """세계 지수 조회 (비동기)"""
         try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/world-indices/")
-            if tree is not None:
-                result = self._extract_element(tree, '//table') or ""
-                # 아시아 지수만 필터링
-                lines = result.split('\n')
-                asian_lines = [line for line in lines if any(keyword in line for keyword in ['Nikkei', 'Hang Seng', 'Shanghai', 'KOSPI', 'Taiwan', 'BSE'])]
-                return '\n'.join(asian_lines[:15])
-            return ""
+            dataset = await self._load_world_indices_async()
+            return self._world_indices_view(dataset, regions, symbols, max_rows, structured)
         except Exception as e:
-            logging.error(f"아시아 지수 파싱 실패: {e}")
-            return ""
+            logging.error(f"세계 지수 파싱 실패: {e}")
+            return [] if structured else ""
     
-    def get_european_indices(self) -> str:
+    def get_global_indices(self, structured: bool = False) -> TableResult:
+        """글로벌 주요 지수 정보 조회"""
+        return self.get_world_indices(structured=structured, max_rows=self.GLOBAL_MAX_ROWS)
+    
+    def get_us_treasury_yields(self, structured: bool = False) -> TableResult:
+        """미국 국채 수익률 정보 조회"""
+        return self._fetch_section(f"{self.BASE_URL}/bonds/", "미국 국채 수익률", structured=structured)
+    
+    def get_vix_data(self) -> str:
+        """VIX 공포지수 정보 조회"""
+        return self._fetch_section(f"{self.BASE_URL}/quote/%5EVIX/", "VIX 데이터",
+                                   selectors.xpath(self.SITE, "vix_quote"))
+    
+    def get_commodities(self, structured: bool = False) -> TableResult:
+        """글로벌 원자재 가격 정보 조회"""
+        return self._fetch_section(f"{self.BASE_URL}/commodities/", "원자재 데이터", structured=structured)
+    
+    def get_forex_majors(self, structured: bool = False) -> TableResult:
+        """주요 환율 정보 조회"""
+        return self._fetch_section(f"{self.BASE_URL}/currencies/", "환율 데이터", structured=structured)
+    
+    def get_asian_indices(self, structured: bool = False) -> TableResult:
+        """아시아 주요 지수 정보 조회"""
+        return self.get_world_indices(["asia"], structured=structured, max_rows=self.REGION_MAX_ROWS)
+    
+    def get_european_indices(self, structured: bool = False) -> TableResult:
         """유럽 주요 지수 정보 조회"""
-        try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/world-indices/")
-            if tree is not None:
-                result = self._extract_element(tree, '//table') or ""
-                # 유럽 지수만 필터링
-                lines = result.split('\n')
-                european_lines = [line for line in lines if any(keyword in line for keyword in ['FTSE', 'DAX', 'CAC', 'IBEX', 'AEX', 'SMI'])]
-                return '\n'.join(european_lines[:15])
-            return ""
-        except Exception as e:
-            logging.error(f"유럽 지수 파싱 실패: {e}")
-            return ""
+        return self.get_world_indices(["europe"], structured=structured, max_rows=self.REGION_MAX_ROWS)
     
-    def get_sector_performance(self) -> str:
+    def get_sector_performance(self, structured: bool = False) -> TableResult:
         """섹터별 성과 정보 조회"""
-        try:
-            tree = self.http_client.fetch_utf8("https://finance.yahoo.com/sectors/")
-            if tree is not None:
-                result = self._extract_element(tree, '//table') or ""
-                return self._clean_data(result)
-            return ""
-        except Exception as e:
-            logging.error(f"섹터 성과 파싱 실패: {e}")
-            return ""
+        return self._fetch_section(f"{self.BASE_URL}/sectors/", "섹터 성과", structured=structured)
     
     def get_stock_quote(self, symbol: str) -> str:
         """개별 주식 정보 조회 (Yahoo Finance)"""
         try:
-            url = f"https://finance.yahoo.com/quote/{symbol}/"
-            tree = self.http_client.fetch_utf8(url)
-            if tree is not None:
-                # 가격 정보 추출
-                price_elements = tree.xpath('//div[contains(@class, "price")]')
-                if price_elements:
-                    price_data = []
-                    for elem in price_elements[:5]:  # 상위 5개만
-                        text = elem.text_content().strip()
-                        if text and len(text) < 50:  # 짧은 텍스트만
-                            price_data.append(text)
-                    
-                    # 주식 이름 추출
-                    title_elem = tree.xpath('//h1')
-                    title = title_elem[0].text_content().strip() if title_elem else symbol
-                    
-                    result = f"**{title}**\n" + "\n".join(price_data[:10])
-                    return result
-            return ""
+            tree = self.http_client.fetch_until(f"{self.BASE_URL}/quote/{symbol}/", self.QUOTE_SELECTOR,
+                                                count=self.QUOTE_PRICE_COUNT, required=self.QUOTE_REQUIRED)
+            return self._parse_quote(tree, symbol)
         except Exception as e:
             logging.error(f"주식 정보 파싱 실패 ({symbol}): {e}")
             return ""
@@ -171,46 +350,75 @@ class YahooParser(WebParserBase, YahooParserInterface):
     def get_crypto_quote(self, symbol: str) -> str:
         """개별 암호화폐 정보 조회 (Yahoo Finance)"""
         try:
-            # 암호화폐 심볼 정규화 (BTC -> BTC-USD)
-            if not symbol.endswith('-USD'):
-                symbol = f"{symbol}-USD"
-            
-            url = f"https://finance.yahoo.com/quote/{symbol}/"
-            tree = self.http_client.fetch_utf8(url)
-            if tree is not None:
-                # 가격 정보 추출
-                price_elements = tree.xpath('//div[contains(@class, "price")]')
-                if price_elements:
-                    price_data = []
-                    for elem in price_elements[:5]:
-                        text = elem.text_content().strip()
-                        if text and len(text) < 50:
-                            price_data.append(text)
-                    
-                    # 암호화폐 이름 추출
-                    title_elem = tree.xpath('//h1')
-                    title = title_elem[0].text_content().strip() if title_elem else symbol
-                    
-                    result = f"**{title}**\n" + "\n".join(price_data[:10])
-                    return result
+            symbol = self._normalize_crypto_symbol(symbol)
+            tree = self.http_client.fetch_until(f"{self.BASE_URL}/quote/{symbol}/", self.QUOTE_SELECTOR,
+                                                count=self.QUOTE_PRICE_COUNT, required=self.QUOTE_REQUIRED)
+            return self._parse_quote(tree, symbol)
+        except Exception as e:
+            logging.error(f"암호화폐 정보 파싱 실패 ({symbol}): {e}")
             return ""
+    
+    async def get_global_indices_async(self, structured: bool = False) -> TableResult:
+        """글로벌 주요 지수 정보 조회 (비동기)"""
+        return await self.get_world_indices_async(structured=structured, max_rows=self.GLOBAL_MAX_ROWS)
+    
+    async def get_us_treasury_yields_async(self, structured: bool = False) -> TableResult:
+        """미국 국채 수익률 정보 조회 (비동기)"""
+        return await self._fetch_section_async(f"{self.BASE_URL}/bonds/", "미국 국채 수익률", structured=structured)
+    
+    async def get_vix_data_async(self) -> str:
+        """VIX 공포지수 정보 조회 (비동기)"""
+        return await self._fetch_section_async(f"{self.BASE_URL}/quote/%5EVIX/", "VIX 데이터",
+                                               selectors.xpath(self.SITE, "vix_quote"))
+    
+    async def get_commodities_async(self, structured: bool = False) -> TableResult:
+        """글로벌 원자재 가격 정보 조회 (비동기)"""
+        return await self._fetch_section_async(f"{self.BASE_URL}/commodities/", "원자재 데이터", structured=structured)
+    
+    async def get_forex_majors_async(self, structured: bool = False) -> TableResult:
+        """주요 환율 정보 조회 (비동기)"""
+        return await self._fetch_section_async(f"{self.BASE_URL}/currencies/", "환율 데이터", structured=structured)
+    
+    async def get_asian_indices_async(self, structured: bool = False) -> TableResult:
+        """아시아 주요 지수 정보 조회 (비동기)"""
+        return await self.get_world_indices_async(["asia"], structured=structured, max_rows=self.REGION_MAX_ROWS)
+    
+    async def get_european_indices_async(self, structured: bool = False) -> TableResult:
+        """유럽 주요 지수 정보 조회 (비동기)"""
+        return await self.get_world_indices_async(["europe"], structured=structured, max_rows=self.REGION_MAX_ROWS)
+    
+    async def get_sector_performance_async(self, structured: bool = False) -> TableResult:
+        """섹터별 성과 정보 조회 (비동기)"""
+        return await self._fetch_section_async(f"{self.BASE_URL}/sectors/", "섹터 성과", structured=structured)
+    
+    async def get_stock_quote_async(self, symbol: str) -> str:
+        """개별 주식 정보 조회 (비동기)"""
+        try:
+            tree = await self._fetch_until_async(f"{self.BASE_URL}/quote/{symbol}/", self.QUOTE_SELECTOR,
+                                                 self.QUOTE_PRICE_COUNT, self.QUOTE_REQUIRED)
+            return self._parse_quote(tree, symbol)
+        except Exception as e:
+            logging.error(f"주식 정보 파싱 실패 ({symbol}): {e}")
+            return ""
+    
+    async def get_crypto_quote_async(self, symbol: str) -> str:
+        """개별 암호화폐 정보 조회 (비동기)"""
+        try:
+            symbol = self._normalize_crypto_symbol(symbol)
+            tree = await self._fetch_until_async(f"{self.BASE_URL}/quote/{symbol}/", self.QUOTE_SELECTOR,
+                                                 self.QUOTE_PRICE_COUNT, self.QUOTE_REQUIRED)
+            return self._parse_quote(tree, symbol)
         except Exception as e:
             logging.error(f"암호화폐 정보 파싱 실패 ({symbol}): {e}")
             return ""
     
     def get_multiple_stock_quotes(self, symbols: List[str]) -> Dict[str, str]:
-        """복수 해외 주식 정보 조회"""
-        results = {}
-        for symbol in symbols:
-            results[symbol] = self.get_stock_quote(symbol)
-        return results
+        """복수 해외 주식 정보 조회 (병렬)"""
+        return batch_executor.map(self.get_stock_quote, symbols, host=self.HOST)
     
     def get_multiple_crypto_quotes(self, symbols: List[str]) -> Dict[str, str]:
-        """복수 암호화폐 정보 조회"""
-        results = {}
-        for symbol in symbols:
-            results[symbol] = self.get_crypto_quote(symbol)
-        return results
+        """복수 암호화폐 정보 조회 (병렬)"""
+        return batch_executor.map(self.get_crypto_quote, symbols, host=self.HOST)
     
     def search_overseas_ticker(self, query: str) -> List[Dict[str, str]]:
         """해외 주식 티커 검색 (Yahoo Finance 웹 스크래핑)"""
@@ -223,14 +431,17 @@ class YahooParser(WebParserBase, YahooParserInterface):
             tree = self.http_client.fetch_utf8(url)
             if tree is not None:
                 # 검색 결과 테이블에서 티커 추출
-                rows = tree.xpath('//table//tr')
+                site = selectors.get(self.SITE)
+                rows = site.xpath("lookup_rows")(tree)
+                cells_xpath = site.xpath("lookup_cells")
+                link_xpath = site.xpath("lookup_link")
                 tickers = []
                 
                 for row in rows[1:11]:  # 헤더 제외, 상위 10개
-                    cells = row.xpath('.//td')
+                    cells = cells_xpath(row)
                     if len(cells) >= 2:
                         # 첫 번째 셀에서 티커 추출
-                        ticker_elem = cells[0].xpath('.//a')
+                        ticker_elem = link_xpath(cells[0])
                         if ticker_elem:
                             ticker_text = ticker_elem[0].text_content().strip()
                             name_text = cells[1].text_content().strip() if len(cells) > 1 else ''
@@ -246,7 +457,7 @@ class YahooParser(WebParserBase, YahooParserInterface):
                 return tickers
             
             return []
-            
+        
         except Exception as e:
             logging.error(f"해외 티커 검색 실패: {e}")
             return []
@@ -15,9 +15,22 @@ from api_routes.fnguide_routes import router as fnguide_router
 from api_routes.materials_routes import materials_router, gold_router
 from api_routes.exchange_routes import router as exchange_router
 from api_routes.yahoo_routes import router as yahoo_router
+from core.prefetch_scheduler import prefetch_enabled
+from core.service_manager import service_manager
 
 app = FastAPI(title="Search Economy Index API")
 
+@app.on_event("startup")
+async def startup():
+    """자주 조회되는 시장 데이터 백그라운드 갱신 시작"""
+    if prefetch_enabled():
+        service_manager.start_prefetch()
+
+@app.on_event("shutdown")
+async def shutdown():
+    """백그라운드 갱신 중지 및 비동기 HTTP 커넥션 풀 정리"""
+    await service_manager.aclose()
+
 @app.get("/")
 def root():
     return {"message": "Search Economy Index API"}
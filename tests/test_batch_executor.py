@@ -0,0 +1,62 @@
+"""
+BatchExecutor 순서 보존, 오류 기록, 타임아웃 테스트
+"""
+import threading
+import time
+
+from core.batch_executor import BatchExecutor
+
+
+def test_results_keep_input_order_and_record_errors():
+    executor = BatchExecutor(max_workers=4, default_host_limit=2)
+    
+    def fn(item):
+        if item == "bad":
+            raise ValueError("no quote")
+        time.sleep(0.01 * len(item))
+        return item.upper()
+    
+    result = executor.map(fn, ["ccc", "a", "bad", "a"])
+    assert list(result) == ["ccc", "a", "bad"]
+    assert result["ccc"] == "CCC" and result["a"] == "A"
+    assert result["bad"] == ""
+    assert result.errors == {"bad": "no quote"}
+
+
+def test_host_limit_bounds_concurrency():
+    executor = BatchExecutor(max_workers=8, host_limits={"slow.example": 2})
+    running = []
+    peak = []
+    lock = threading.Lock()
+    
+    def fn(item):
+        with lock:
+            running.append(item)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(item)
+        return item
+    
+    executor.map(fn, range(6), host="slow.example")
+    assert max(peak) == 2
+
+
+def test_slow_host_cannot_hold_batch_past_deadline():
+    # 동시 실행 1개, 항목 3개 -> 배치 기한은 제출 시점부터 0.2s x 3
+    executor = BatchExecutor(max_workers=4, host_limits={"slow.example": 1})
+    release = threading.Event()
+    
+    def fn(item):
+        # 타임아웃 후에도 세마포어를 잡고 계속 실행되는 항목
+        release.wait(5)
+        return item
+    
+    started = time.monotonic()
+    result = executor.map(fn, ["a", "b", "c"], host="slow.example", timeout=0.2)
+    elapsed = time.monotonic() - started
+    release.set()
+    
+    assert elapsed < 0.6 + 0.2
+    assert set(result.errors) == {"a", "b", "c"}
+    assert all("timeout" in reason for reason in result.errors.values())
@@ -0,0 +1,38 @@
+"""
+캐시 파일 원자적 저장 테스트 (동시 저장은 각자 임시 파일 사용)
+"""
+import os
+import threading
+
+from core.cache_paths import CACHE_DIR_ENV, load_json, save_json
+
+
+def test_round_trip_leaves_no_temp_files(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    save_json("index.json", {"name": "삼성전자"})
+    assert load_json("index.json") == {"name": "삼성전자"}
+    assert os.listdir(tmp_path) == ["index.json"]
+
+
+def test_concurrent_saves_do_not_share_temp_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    payloads = [{"writer": index, "rows": list(range(2000))} for index in range(8)]
+    barrier = threading.Barrier(len(payloads))
+
+    def write(payload):
+        barrier.wait()
+        save_json("index.json", payload)
+
+    threads = [threading.Thread(target=write, args=(payload,)) for payload in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert load_json("index.json") in payloads
+    assert os.listdir(tmp_path) == ["index.json"]
+
+
+def test_failed_save_removes_temp_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    save_json("index.json", {"bad": object()})
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,77 @@
+"""
+문자셋 판별 순서 테스트 (헤더 -> <meta> -> 호스트 -> 학습 -> 추정 -> 기본값)
+"""
+import pytest
+
+from core import charset
+from core.charset import CharsetResolver, canonical_encoding, is_generic_encoding
+
+KOREAN_PAGE = "<html><body>삼성전자</body></html>".encode("cp949")
+
+
+class FakeChardet:
+    """항상 같은 인코딩을 돌려주는 추정기 (받은 표본 크기 기록)"""
+    
+    def __init__(self, encoding):
+        self.encoding = encoding
+        self.sample_sizes = []
+    
+    def detect(self, sample):
+        self.sample_sizes.append(len(sample))
+        return {"encoding": self.encoding}
+
+
+@pytest.fixture
+def resolver():
+    return CharsetResolver(host_encodings={"finance.naver.com": "euc-kr"}, meta_window=128, sample_size=16)
+
+
+def test_canonical_names_and_aliases():
+    assert canonical_encoding(" UTF-8 ") == "utf-8"
+    assert canonical_encoding("ks_c_5601-1987") == "cp949"
+    assert canonical_encoding("x-unknown") is None
+    assert canonical_encoding(None) is None
+    assert is_generic_encoding("ISO-8859-1") and is_generic_encoding("latin-1") and is_generic_encoding("ascii")
+    assert not is_generic_encoding("euc-kr")
+
+
+def test_header_wins(resolver):
+    assert resolver.resolve(b'<meta charset="utf-8">', "EUC-KR", "https://example.com/") == ("euc-kr", "header")
+
+
+def test_generic_header_is_ignored_for_meta(resolver):
+    content = b'<html><head><meta charset="x-windows-949"></head>'
+    assert resolver.resolve(content, "ISO-8859-1", "https://example.com/") == ("cp949", "meta")
+
+
+def test_meta_outside_window_is_not_read(resolver, monkeypatch):
+    monkeypatch.setattr(charset, "chardet", None)
+    content = b" " * 200 + b'<meta charset="euc-kr">'
+    assert resolver.resolve(content, None, "https://example.com/") == ("utf-8", "default")
+
+
+def test_known_host_then_learned_host(resolver, monkeypatch):
+    monkeypatch.setattr(charset, "chardet", None)
+    assert resolver.resolve(KOREAN_PAGE, None, "https://finance.naver.com/sise/") == ("euc-kr", "host")
+    # <meta>로 한 번 판별한 호스트는 다음부터 단서가 없어도 같은 인코딩
+    resolver.resolve(b'<meta http-equiv="Content-Type" content="text/html; charset=EUC-KR">', None,
+                     "https://news.example.com/a")
+    assert resolver.resolve(KOREAN_PAGE, None, "https://news.example.com/b") == ("euc-kr", "learned")
+    assert resolver.stats()["learned_hosts"] == {"news.example.com": "euc-kr"}
+
+
+def test_detection_uses_only_sample(resolver, monkeypatch):
+    fake = FakeChardet("EUC-KR")
+    monkeypatch.setattr(charset, "chardet", fake)
+    assert resolver.resolve(KOREAN_PAGE * 10, None, "https://other.example.com/") == ("euc-kr", "detect")
+    assert fake.sample_sizes == [16]
+    assert resolver.resolve(KOREAN_PAGE, None, "https://other.example.com/x") == ("euc-kr", "learned")
+
+
+def test_stats_count_paths(resolver, monkeypatch):
+    monkeypatch.setattr(charset, "chardet", None)
+    resolver.resolve(b"", "utf-8")
+    resolver.resolve(b"")
+    resolver.record("forced")
+    paths = resolver.stats()["paths"]
+    assert paths["header"] == 1 and paths["default"] == 1 and paths["forced"] == 1
@@ -0,0 +1,125 @@
+"""
+조건부 요청(ETag/Last-Modified, 304) 처리 테스트 (가짜 세션으로 네트워크 없이 실행)
+"""
+import pytest
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from core import disk_cache
+from core.disk_cache import DiskCache
+from core.rate_limiter import RateLimiter
+from core.resilience import HostPolicy, Resilience
+from core.response_cache import ResponseCache
+from core.validator_store import ValidatorStore
+from parsers.http_client import HttpClient
+
+URL = "https://example.com/page"
+PAGE = b"<html><body><p>v1</p></body></html>"
+
+
+def make_response(status: int, content: bytes = b"", headers=None) -> Response:
+    response = Response()
+    response.status_code = status
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = "utf-8"
+    response.url = URL
+    return response
+
+
+class FakeSession:
+    """준비된 응답을 차례로 돌려주고 요청 헤더를 기록하는 세션"""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+    
+    def request(self, method, url, timeout=None, headers=None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class FakeTransport:
+    """세션만 제공하는 커넥션 풀"""
+    
+    def __init__(self, session):
+        self.session = session
+
+
+class FakeClock:
+    """time.time 대체용 수동 시계"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(disk_cache, "time", fake)
+    return fake
+
+
+def make_client(tmp_path, *responses) -> HttpClient:
+    return HttpClient(cache=ResponseCache(), transport=FakeTransport(FakeSession(*responses)),
+                      disk_cache=DiskCache(str(tmp_path / "cache.sqlite3")), validators=ValidatorStore(),
+                      resilience=Resilience(default_policy=HostPolicy(retries=0)),
+                      rate_limiter=RateLimiter(default_rate=None))
+
+
+def test_not_modified_reuses_parsed_tree(tmp_path):
+    client = make_client(tmp_path, make_response(200, PAGE, {"ETag": '"v1"'}), make_response(304))
+    first = client.fetch_utf8(URL, use_cache=False)
+    second = client.fetch_utf8(URL, use_cache=False)
+    assert second is first
+    assert client.session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+    stats = client.validators.stats()
+    assert stats["conditional_requests"] == 1 and stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(PAGE)
+
+
+def test_changed_page_replaces_stored_tree(tmp_path):
+    page = b"<html><body><p>v2</p></body></html>"
+    client = make_client(tmp_path, make_response(200, PAGE, {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+                         make_response(200, page, {"ETag": '"v2"'}), make_response(304))
+    client.fetch_utf8(URL, use_cache=False)
+    assert client.fetch_utf8(URL, use_cache=False).xpath("//p/text()") == ["v2"]
+    assert client.fetch_utf8(URL, use_cache=False).xpath("//p/text()") == ["v2"]
+    assert client.session.sent_headers[1] == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert client.session.sent_headers[2] == {"If-None-Match": '"v2"'}
+
+
+def test_response_without_validators_is_not_revalidated(tmp_path):
+    client = make_client(tmp_path, make_response(200, PAGE), make_response(200, PAGE))
+    client.fetch_utf8(URL, use_cache=False)
+    client.fetch_utf8(URL, use_cache=False)
+    assert client.session.sent_headers == [{}, {}]
+    assert client.validators.stats()["entries"] == 0
+
+
+def test_persisted_page_is_revalidated_after_max_age(tmp_path, clock):
+    client = make_client(tmp_path, make_response(200, PAGE, {"ETag": '"v1"'}), make_response(304),
+                         ConnectionError("down"))
+    assert client.fetch_persisted(URL, "page", max_age=60) is not None
+    client.cache.clear()
+    clock.now += 30
+    assert client.fetch_persisted(URL, "page", max_age=60) is not None
+    assert len(client.session.sent_headers) == 1  # 디스크 항목이 신선하면 요청하지 않음
+
+    client.cache.clear()
+    clock.now += 61
+    tree = client.fetch_persisted(URL, "page", max_age=60)
+    assert tree.xpath("//p/text()") == ["v1"]
+    assert client.session.sent_headers[1] == {"If-None-Match": '"v1"'}
+    assert client.disk_cache.get("page").expires_at == clock.now + 60
+
+    # 원본 서버가 실패하면 만료된 본문이라도 사용
+    client.cache.clear()
+    clock.now += 61
+    assert client.fetch_persisted(URL, "page", max_age=60).xpath("//p/text()") == ["v1"]
@@ -0,0 +1,48 @@
+"""
+Investing.com 암호화폐 시세 표 스트리밍 조회 테스트 (다른 표를 시세로 내보내지 않는지)
+"""
+from lxml import html
+
+from core.stream_parser import ElementSelector, parse_until
+from parsers.crypto_parser import CryptoParser
+from parsers.http_client import HttpClient
+
+PAGE = (b"<html><body><div id='__next'><table class='promo'><tr><td>Ad</td></tr></table>"
+        b"<table class='datatable-v2_table__93S4Y'><tr><th>Name</th><th>Price</th></tr>"
+        b"<tr><td>Bitcoin</td><td>95,000</td></tr></table>"
+        + b"<p>news</p>" * 2000 + b"</div></body></html>")
+
+
+class StreamingClient:
+    """fetch_until은 주어진 선택자로 실제 중단 조건을 적용하고, 전체 조회 횟수를 기록하는 클라이언트"""
+    
+    def __init__(self, page: bytes):
+        self.page = page
+        self.full_fetches = 0
+        self.selectors = []
+    
+    def fetch_until(self, url, selector, encoding="utf-8", count=1, required=()):
+        self.selectors.append(selector)
+        chunks = [self.page[start:start + 64] for start in range(0, len(self.page), 64)]
+        tree, _, _ = parse_until(chunks, ElementSelector(selector), encoding, count)
+        return tree
+    
+    def fetch_utf8(self, url, use_cache=True):
+        self.full_fetches += 1
+        return html.fromstring(self.page)
+    
+    html_to_markdown = staticmethod(HttpClient.html_to_markdown)
+
+
+def test_streams_until_quote_table_not_first_table():
+    client = StreamingClient(PAGE)
+    result = CryptoParser(client).get_crypto_data()
+    assert "Bitcoin" in result and "Ad" not in result
+    assert client.selectors == [CryptoParser.CRYPTO_TABLE_SELECTOR]
+    assert client.full_fetches == 0
+
+
+def test_missing_quote_table_refetches_full_page_instead_of_other_table():
+    client = StreamingClient(PAGE.replace(b"datatable-v2_table__93S4Y", b"renamed"))
+    assert CryptoParser(client).get_crypto_data() == ""
+    assert client.full_fetches == 1
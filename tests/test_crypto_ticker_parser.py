@@ -0,0 +1,51 @@
+"""
+암호화폐 심볼 일괄 변환 테스트 (로컬 코인 목록 정확 일치, 없는 심볼만 검색 API)
+"""
+import pytest
+
+from core.cache_paths import CACHE_DIR_ENV
+from parsers.crypto_ticker_parser import CryptoTickerParser
+
+COIN_LIST = [
+    {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
+    {"id": "pepe", "symbol": "pepe", "name": "Pepe"},
+]
+
+
+class CoinGeckoClient:
+    """CoinGecko API 경로별 고정 응답을 돌려주고 검색 호출을 기록하는 클라이언트"""
+    
+    def __init__(self):
+        self.searches = []
+    
+    def fetch_json(self, url, params=None, timeout=None, headers=None):
+        if url.endswith("/coins/list"):
+            return COIN_LIST
+        if url.endswith("/coins/markets"):
+            return [{"id": "bitcoin", "market_cap_rank": 1}] if params["page"] == 1 else []
+        if url.endswith("/search"):
+            self.searches.append(params["query"])
+            if params["query"] == "PEP":
+                return {"coins": [{"id": "pep-token", "symbol": "pep", "name": "Pep", "market_cap_rank": 900}]}
+            return {"coins": []}
+        return None
+
+
+@pytest.fixture
+def parser(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    return CryptoTickerParser(CoinGeckoClient())
+
+
+def test_missing_symbol_uses_search_api_not_local_substring(parser):
+    # 로컬 목록에서 'PEP'는 'Pepe'의 접두어로만 걸리므로 검색 API로 정확한 심볼을 찾음
+    resolved = parser.resolve_symbols(["BTC-KRW", "PEP", "NOPE"])
+    assert resolved["BTC-KRW"]["id"] == "bitcoin"
+    assert resolved["PEP"]["id"] == "pep-token"
+    assert resolved["NOPE"] is None
+    assert sorted(parser.http_client.searches) == ["NOPE", "PEP"]
+
+
+def test_local_symbols_do_not_call_search_api(parser):
+    assert parser.resolve_symbols(["PEPE"])["PEPE"]["id"] == "pepe"
+    assert parser.http_client.searches == []
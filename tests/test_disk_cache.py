@@ -0,0 +1,83 @@
+"""
+DiskCache 저장/재검증/크기 기준 LRU 축출 테스트
+"""
+import os
+
+import pytest
+
+from core import disk_cache
+from core.disk_cache import DiskCache
+
+
+class FakeClock:
+    """time.time 대체용 수동 시계"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(disk_cache, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    # 압축되지 않는 1000바이트 본문 두 개까지만 들어가는 크기
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=2500)
+    yield cache
+    cache.close()
+
+
+def body() -> bytes:
+    return os.urandom(1000)
+
+
+def test_round_trip_keeps_validators(cache, clock):
+    content = b"<html>" * 100
+    cache.set("a", content, ttl=60, etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT", encoding="utf-8")
+    entry = cache.get("a")
+    assert entry.content == content and entry.encoding == "utf-8"
+    assert entry.validators() == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted_by_size(cache, clock):
+    cache.set("a", body(), ttl=60)
+    clock.now += 1
+    cache.set("b", body(), ttl=60)
+    clock.now += 1
+    assert cache.get("a") is not None  # a를 최근 사용으로 갱신
+    clock.now += 1
+    cache.set("c", body(), ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 2 and stats["bytes"] <= 2500
+
+
+def test_oversized_body_is_not_stored(cache):
+    cache.set("big", os.urandom(3000), ttl=60)
+    assert cache.get("big") is None
+
+
+def test_touch_extends_expiry(cache, clock):
+    cache.set("a", b"x", ttl=10)
+    clock.now += 11
+    assert not cache.get("a").is_fresh
+    cache.touch("a", ttl=10)
+    assert cache.get("a").expires_at == clock.now + 10
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = DiskCache(str(tmp_path / "off.sqlite3"), max_bytes=0)
+    cache.set("a", b"x", ttl=60)
+    assert cache.get("a") is None
+    assert not (tmp_path / "off.sqlite3").exists()
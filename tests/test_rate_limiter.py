@@ -0,0 +1,71 @@
+"""
+토큰 버킷 속도 제한과 우선순위 대기열 테스트
+"""
+import threading
+import time
+
+from core.rate_limiter import BACKGROUND, INTERACTIVE, RateLimiter, TokenBucket, background, current_priority
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_burst_then_try_acquire_fails():
+    bucket = TokenBucket(rate=1, burst=2)
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.stats()["interactive"]["acquired"] == 2
+
+
+def test_acquire_waits_for_refill():
+    bucket = TokenBucket(rate=20, burst=1)
+    assert bucket.acquire() < 0.01
+    waited = bucket.acquire(BACKGROUND)
+    assert 0.03 < waited < 0.5
+    assert bucket.stats()["background"]["delayed"] == 1
+
+
+def test_interactive_waiter_overtakes_queued_background():
+    bucket = TokenBucket(rate=10, burst=1)
+    bucket.acquire()
+    order = []
+    lock = threading.Lock()
+
+    def take(name, priority):
+        bucket.acquire(priority)
+        with lock:
+            order.append(name)
+
+    threads = []
+    for index in range(3):
+        threads.append(threading.Thread(target=take, args=(f"background-{index}", BACKGROUND)))
+        threads[-1].start()
+        wait_for(lambda: bucket.stats()["queued"] == index + 1)
+    threads.append(threading.Thread(target=take, args=("interactive", INTERACTIVE)))
+    threads[-1].start()
+    wait_for(lambda: bucket.stats()["queued"] == 4)
+    # 대기자가 있으면 try_acquire는 새치기하지 않음
+    assert not bucket.try_acquire()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert order == ["interactive", "background-0", "background-1", "background-2"]
+
+
+def test_background_context_sets_priority():
+    assert current_priority() == INTERACTIVE
+    with background():
+        assert current_priority() == BACKGROUND
+    assert current_priority() == INTERACTIVE
+
+
+def test_unlisted_host_is_not_limited_without_default_rate():
+    limiter = RateLimiter(host_rates={"slow.example.com": (1.0, 1)}, default_rate=None)
+    assert limiter.bucket("fast.example.com") is None
+    assert limiter.acquire("fast.example.com") == 0.0
+    assert limiter.try_acquire("slow.example.com")
+    assert not limiter.try_acquire("slow.example.com")
+    assert set(limiter.stats()) == {"slow.example.com"}
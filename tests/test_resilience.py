@@ -0,0 +1,121 @@
+"""
+서킷 브레이커 상태 전이와 재시도 정책 테스트
+"""
+import pytest
+
+from core import resilience
+from core.resilience import CircuitBreaker, CircuitOpenError, HostPolicy, Resilience
+
+URL = "https://example.com/data"
+
+
+class FakeClock:
+    """time.monotonic/time.sleep 대체용 수동 시계 (sleep은 시간만 진행)"""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    """상태 코드와 헤더만 가진 응답"""
+    
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+    
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience, "time", fake)
+    return fake
+
+
+def test_breaker_closed_open_half_open_closed(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.stats()["short_circuited"] == 1
+
+    clock.now += 10
+    assert breaker.allow()  # 시험 요청 1건
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()  # 시험 중에는 나머지 차단
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+    assert breaker.stats()["trips"] == 1
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5)
+    breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_in() == 5
+    assert breaker.stats()["trips"] == 2
+
+
+def test_retries_transient_status_then_succeeds(clock):
+    engine = Resilience(host_policies={}, default_policy=HostPolicy(retries=2, backoff=0.1))
+    responses = [FakeResponse(503), FakeResponse(429, {"Retry-After": "2"}), FakeResponse(200)]
+    sent = []
+
+    def send(timeout):
+        sent.append(timeout)
+        return responses[len(sent) - 1]
+
+    assert engine.call("GET", URL, send).status_code == 200
+    assert len(sent) == 3
+    assert responses[0].closed and responses[1].closed
+    assert clock.sleeps[0] <= 0.1 and clock.sleeps[1] == 2  # Retry-After 우선
+    stats = engine.stats()["example.com"]
+    assert stats["retries"] == 2 and stats["failures"] == 0 and stats["state"] == "closed"
+
+
+def test_non_idempotent_request_is_not_retried(clock):
+    engine = Resilience(host_policies={}, default_policy=HostPolicy(retries=2))
+    calls = []
+
+    def send(timeout):
+        calls.append(timeout)
+        raise ConnectionError("reset")
+
+    with pytest.raises(ConnectionError):
+        engine.call("POST", URL, send)
+    assert len(calls) == 1 and clock.sleeps == []
+
+
+def test_open_circuit_fails_fast(clock):
+    engine = Resilience(host_policies={}, default_policy=HostPolicy(retries=0), failure_threshold=2,
+                        reset_timeout=30)
+
+    def send(timeout):
+        raise TimeoutError("read timed out")
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            engine.call("GET", URL, send)
+    with pytest.raises(CircuitOpenError) as error:
+        engine.call("GET", URL, send)
+    assert error.value.host == "example.com" and error.value.retry_in == 30
+    stats = engine.stats()["example.com"]
+    assert stats["timeouts"] == 2 and stats["state"] == "open"
@@ -0,0 +1,69 @@
+"""
+ResponseCache TTL/LRU 동작 테스트
+"""
+import pytest
+
+from core import response_cache
+from core.response_cache import ResponseCache
+
+
+class FakeClock:
+    """time.monotonic 대체용 수동 시계"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache, "time", fake)
+    return fake
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = ResponseCache()
+    cache.set("a", 1, ttl=5)
+    clock.now += 4.9
+    assert cache.get("a") == 1
+    clock.now += 0.2
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_non_positive_ttl_is_not_stored(clock):
+    cache = ResponseCache()
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a") is None
+
+
+def test_ttl_rules_first_match_wins():
+    cache = ResponseCache(default_ttl=7)
+    assert cache.ttl_for("https://finance.naver.com/sise/sise_index.naver") == 5
+    assert cache.ttl_for("https://comp.fnguide.com/SVO2/ASP/SVD_Invest.asp?gicode=A005930") == 3600
+    assert cache.ttl_for("https://comp.fnguide.com/other") == 600
+    assert cache.ttl_for("https://example.com/") == 7
+
+
+def test_hit_ratio_counts_hits_and_misses(clock):
+    cache = ResponseCache()
+    cache.set("a", 1, ttl=60)
+    cache.get("a")
+    cache.get("missing")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
@@ -0,0 +1,144 @@
+"""
+티커 검색 엔진 테스트 (편집 거리, 일치 등급 순서, 웹 검색 대체 기준)
+"""
+import pytest
+
+from core.search_engine import (CONFIDENT_SCORE, SearchEngine, bigrams, edit_distances, is_symbol_query,
+                                search_form, similarity)
+from core.service_manager import ServiceManager
+from parsers.ticker_index import TickerEntry
+
+
+ENTRIES = [
+    TickerEntry("005930", "삼성전자", "SamsungElec", "KOSPI"),
+    TickerEntry("005935", "삼성전자우", "SamsungElec(1P)", "KOSPI"),
+    TickerEntry("000660", "SK하이닉스", "SK hynix", "KOSPI"),
+    TickerEntry("035720", "카카오", "Kakao", "KOSPI"),
+    TickerEntry("323410", "카카오뱅크", "KakaoBank", "KOSPI"),
+    TickerEntry("035420", "NAVER", "NAVER", "KOSPI"),
+]
+
+
+@pytest.fixture
+def engine():
+    engine = SearchEngine(memo_size=0)
+    engine.replace_universe("domestic", (entry.search_document() for entry in ENTRIES), version=1)
+    return engine
+
+
+def names(results):
+    return [result["name"] for result in results]
+
+
+def test_edit_distances():
+    assert edit_distances("abc", "abd") == (1, 1)
+    assert edit_distances("kitten", "sitting")[0] == 3
+    assert edit_distances("apple", "appleinc") == (3, 0)  # 접두어 거리 0
+    assert similarity("samsung", "samsung") == 1.0
+    assert similarity("aple", "appleinc") > similarity("aple", "google")
+
+
+def test_symbol_query_shape():
+    for query in ("005930", "AAPL", "BRK.B", "^GSPC", "BTC-USD", "GC=F"):
+        assert is_symbol_query(query), query
+    for query in ("삼성전자", "apple", "Tesla"):
+        assert not is_symbol_query(query), query
+
+
+def test_exact_before_prefix_before_fuzzy(engine):
+    results = engine.search("카카오", ["domestic"])
+    assert names(results)[:2] == ["카카오", "카카오뱅크"]
+    assert [result["match"] for result in results[:2]] == ["exact", "prefix"]
+    results = engine.search("삼성전자", ["domestic"])
+    assert names(results)[:2] == ["삼성전자", "삼성전자우"]
+    assert engine.search("samsungelc", ["domestic"])[0]["match"] == "fuzzy"
+
+
+def test_code_query_matches_only_exact_symbol(engine):
+    results = engine.search("005930", ["domestic"])
+    assert names(results) == ["삼성전자"]
+    assert results[0]["match"] == "exact"
+    assert engine.search("005931", ["domestic"]) == []
+
+
+def test_near_miss_is_not_confident(engine):
+    # 카카오페이는 목록에 없으므로 카카오/카카오뱅크로 답하면 안 됨
+    assert engine.search("카카오페이", ["domestic"], min_score=CONFIDENT_SCORE) == []
+    assert names(engine.search("카카오뱅크", ["domestic"], min_score=CONFIDENT_SCORE)) == ["카카오뱅크"]
+
+
+def test_candidates_match_brute_force_overlap(engine):
+    index = engine._universes["domestic"]
+    form = search_form("삼성전자")
+    expected = {key_id for key_id, key in enumerate(index.key_forms) if key.startswith(form)}
+    assert expected <= set(index.candidates(form, 100))
+
+
+def test_learned_documents_become_searchable(engine):
+    engine.search("카카오페이", ["domestic"])  # 비트 집합을 먼저 만들어 둠
+    engine.add("domestic", "377300", "카카오페이")
+    assert names(engine.search("카카오페이", ["domestic"], min_score=CONFIDENT_SCORE)) == ["카카오페이"]
+
+
+def test_add_swaps_in_a_copy(engine):
+    published = engine._universes["domestic"]
+    engine.search("카카오페이", ["domestic"])
+    engine.add("domestic", "377300", "카카오페이")
+    # 검색 중인 스레드가 쥐고 있던 색인은 바뀌지 않음
+    assert len(published.documents) == len(ENTRIES)
+    assert engine._universes["domestic"] is not published
+    # 이미 만든 비트 집합에는 새 키가 반영됨
+    learned = engine._universes["domestic"]
+    gram = bigrams(search_form("카카오페이"))[1]
+    key_id = learned.key_forms.index(search_form("카카오페이"))
+    assert learned.gram_bits(gram) == published.gram_bits(gram) | 1 << key_id
+
+
+class FakeIndex:
+    """고정 목록 스냅샷만 제공하는 종목 인덱스"""
+    
+    def snapshot(self):
+        return list(ENTRIES), 1.0
+
+
+class FakeTickerParser:
+    """웹 검색 호출을 기록하는 국내 티커 파서"""
+    
+    def __init__(self):
+        self.ticker_index = FakeIndex()
+        self.queries = []
+    
+    def search_domestic(self, query):
+        self.queries.append(query)
+        return [{"ticker": "377300", "name": "카카오페이"}] if query == "카카오페이" else []
+
+
+@pytest.fixture
+def manager():
+    manager = ServiceManager()
+    manager._parsers["ticker"] = FakeTickerParser()
+    return manager
+
+
+def test_confident_local_match_skips_web(manager):
+    assert names(manager.search_domestic_ticker("카카오")) == ["카카오", "카카오뱅크"]
+    assert manager.get_parser("ticker").queries == []
+
+
+def test_unknown_name_falls_back_to_web_and_is_learned(manager):
+    parser = manager.get_parser("ticker")
+    web = manager.search_domestic_ticker("카카오페이")
+    assert names(web) == ["카카오페이"] and parser.queries == ["카카오페이"]
+    local = manager.search_domestic_ticker("카카오페이")
+    assert local[0]["ticker"] == "377300" and parser.queries == ["카카오페이"]
+    # 웹 결과와 로컬 결과는 같은 형식
+    assert set(web[0]) == set(local[0]) == {"ticker", "name", "universe", "score", "match"}
+    assert web[0]["match"] == "web" and local[0]["match"] == "exact" and web[0]["universe"] == "domestic"
+    assert parser.queries == ["카카오페이"]
+
+
+def test_search_syncs_only_queried_universe(manager):
+    manager.search_domestic_ticker("삼성전자")
+    manager.search_domestic_ticker("하이닉스")
+    assert set(manager._parsers) == {"ticker"}
+    assert manager._search_engine.version("domestic") == 1.0
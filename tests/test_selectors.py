@@ -0,0 +1,99 @@
+"""
+선택자 저장소 테스트 (버전 상속, 롤백, 파일 적용, 컴파일 실패)
+"""
+import json
+
+import pytest
+from lxml import html
+
+from core.selectors import SelectorRegistry
+from parsers.yahoo_parser import YahooParser
+
+PAGE = html.fromstring("""<html><body>
+<h1>Title</h1>
+<div class="price">100</div>
+<div class="new-price">101</div>
+</body></html>""")
+
+LOOKUP_PAGE = """<html><body><table>
+<tr><th>Symbol</th><th>Name</th></tr>
+<tr><td><a href="/quote/AAPL">AAPL</a></td><td>Apple Inc.</td></tr>
+<tr><td><a href="/quote/X">VERYLONGTICKER</a></td><td>Too long</td></tr>
+<tr><td>no link</td><td>Skipped</td></tr>
+</table></body></html>"""
+
+
+@pytest.fixture
+def registry():
+    registry = SelectorRegistry()
+    registry.register("site", "v1", xpaths={"title": "//h1", "price": '//div[@class="price"]'},
+                      patterns={"number": r"\d+"})
+    return registry
+
+
+def texts(elements):
+    return [element.text_content() for element in elements]
+
+
+def test_new_version_inherits_unchanged_selectors(registry):
+    registry.register("site", "v2", xpaths={"price": '//div[@class="new-price"]'})
+    assert registry.get("site").version == "v2"
+    assert texts(registry.xpath("site", "price")(PAGE)) == ["101"]
+    assert texts(registry.xpath("site", "title")(PAGE)) == ["Title"]
+    assert registry.pattern("site", "number").pattern == r"\d+"
+    assert registry.versions("site") == ["v1", "v2"]
+
+
+def test_activate_rolls_back(registry):
+    registry.register("site", "v2", xpaths={"price": '//div[@class="new-price"]'})
+    view = registry.view("site")
+    registry.activate("site", "v1")
+    assert texts(view["price"](PAGE)) == ["100"]
+    assert registry.stats()["site"]["active"] == "v1"
+    with pytest.raises(KeyError):
+        registry.activate("site", "v9")
+
+
+def test_register_without_activate_keeps_current(registry):
+    registry.register("site", "v2", xpaths={"price": '//div[@class="new-price"]'}, activate=False)
+    assert registry.get("site").version == "v1"
+    assert registry.versions("site") == ["v1", "v2"]
+
+
+def test_invalid_xpath_raises_value_error_and_keeps_active(registry):
+    with pytest.raises(ValueError):
+        registry.register("site", "broken", xpaths={"price": "//div[@class="})
+    with pytest.raises(ValueError):
+        registry.register("site", "broken", patterns={"number": "("})
+    assert registry.get("site").version == "v1"
+    assert registry.versions("site") == ["v1"]
+
+
+def test_load_file_applies_valid_sites_and_skips_broken(registry, tmp_path):
+    path = tmp_path / "selectors.json"
+    path.write_text(json.dumps({
+        "site": {"version": "v2", "xpaths": {"price": '//div[@class="new-price"]'}},
+        "missing-version": {"xpaths": {"title": "//h1"}},
+        "broken": {"version": "v1", "xpaths": {"title": "//h1["}},
+    }), encoding="utf-8")
+    assert registry.load_file(str(path)) == ["site"]
+    assert texts(registry.xpath("site", "price")(PAGE)) == ["101"]
+    assert set(registry.stats()) == {"site"}
+    with pytest.raises(FileNotFoundError):
+        registry.load_file(str(tmp_path / "absent.json"))
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        registry.load_file(str(path))
+
+
+class LookupClient:
+    """Yahoo 종목 검색 페이지만 돌려주는 클라이언트"""
+    
+    def fetch_utf8(self, url):
+        return html.fromstring(LOOKUP_PAGE)
+
+
+def test_yahoo_lookup_uses_registered_row_selectors():
+    parser = YahooParser(LookupClient())
+    assert parser.search_overseas_ticker("apple") == [
+        {"ticker": "AAPL", "name": "Apple Inc.", "exchange": "Yahoo Finance", "type": "EQUITY"}]
@@ -0,0 +1,78 @@
+"""
+서비스 매니저 의존성 주입 테스트 (HttpClient가 아닌 클라이언트 주입)
+"""
+import asyncio
+import threading
+import time
+
+from lxml import html
+
+from core.base_parser import ParserFactory
+from core.interfaces import HttpClientInterface
+from core.service_manager import ServiceManager
+from parsers.http_client import HttpClient
+
+PAGE = "<html><body><p>ok</p></body></html>"
+
+
+class StaticClient(HttpClientInterface):
+    """고정 페이지만 돌려주는 최소 구현 (캐시/세션 등 HttpClient 구성 요소 없음)"""
+    
+    def fetch_euc_kr(self, url, use_cache=True):
+        return html.fromstring(PAGE)
+    
+    def fetch_utf8(self, url, use_cache=True):
+        return html.fromstring(PAGE)
+    
+    def fetch_json(self, url, params=None, timeout=None, headers=None):
+        return None
+    
+    def request(self, method, url, read_timeout=None, **kwargs):
+        raise ConnectionError("offline")
+    
+    html_to_markdown = staticmethod(HttpClient.html_to_markdown)
+
+
+def test_other_interface_implementation_uses_sync_fallback():
+    manager = ServiceManager(http_client=StaticClient())
+    assert manager.async_http_client is None
+    parser = manager.get_parser("yahoo")
+    assert parser.http_client is manager.http_client and parser.async_http_client is None
+    tree = asyncio.run(parser._fetch_utf8_async("https://example.com"))
+    assert tree.xpath("//p/text()") == ["ok"]
+    asyncio.run(manager.aclose())
+
+
+def test_async_client_is_created_once_for_http_client():
+    manager = ServiceManager()
+    assert manager._async_http_client is None
+    client = manager.async_http_client
+    assert client is not None and client.sync_client is manager.http_client
+    assert manager.async_http_client is client
+    assert manager.get_parser("market").async_http_client is client
+
+
+def test_concurrent_get_parser_creates_one_instance(monkeypatch):
+    manager = ServiceManager(http_client=StaticClient())
+    created = []
+    barrier = threading.Barrier(8)
+
+    def create_parser(parser_type, http_client):
+        created.append(parser_type)
+        time.sleep(0.05)
+        return object()
+
+    monkeypatch.setattr(ParserFactory, "create_parser", staticmethod(create_parser))
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(manager.get_parser("ticker"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert created == ["ticker"]
+    assert len(results) == 8 and all(result is results[0] for result in results)
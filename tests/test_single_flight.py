@@ -0,0 +1,75 @@
+"""
+SingleFlight 요청 병합 테스트
+"""
+import threading
+import time
+
+import pytest
+
+from core.single_flight import SingleFlight
+
+
+def _run_concurrently(flight: SingleFlight, key, fn, callers: int):
+    """callers개 스레드가 같은 키로 동시에 do를 호출하고 (결과, 예외) 목록 반환"""
+    results = []
+    lock = threading.Lock()
+    
+    def call():
+        try:
+            value = (flight.do(key, fn), None)
+        except Exception as e:
+            value = (None, e)
+        with lock:
+            results.append(value)
+    
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "page"
+    
+    leader, leader_results = _run_concurrently(flight, "url", fetch, 1)
+    assert started.wait(5)
+    followers, results = _run_concurrently(flight, "url", fetch, 4)
+    # 후속 호출이 모두 대기 상태로 등록될 때까지 기다린 뒤 리더를 끝냄
+    while flight.stats()["shared"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in leader + followers:
+        thread.join(5)
+    
+    assert len(calls) == 1
+    assert leader_results + results == [("page", None)] * 5
+    assert flight.stats() == {"in_flight": 0, "executed": 1, "shared": 4}
+
+
+def test_failed_call_releases_key():
+    flight = SingleFlight()
+    
+    def fail():
+        raise ValueError("boom")
+    
+    with pytest.raises(ValueError):
+        flight.do("url", fail)
+    # 실패 후에는 같은 키로 새 실행이 가능해야 함
+    assert flight.do("url", lambda: "retry") == "retry"
+    assert flight.stats()["executed"] == 2
+
+
+def test_different_keys_run_independently():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.stats()["shared"] == 0
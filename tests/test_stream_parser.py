@@ -0,0 +1,61 @@
+"""
+스트리밍 파싱 중단 조건 테스트 (중단된 트리가 전체 페이지와 같은 시세 결과를 내는지)
+"""
+from pathlib import Path
+
+import pytest
+from lxml import html
+
+from core.stream_parser import ElementSelector, parse_until
+from parsers.yahoo_parser import YahooParser
+
+# 가격 영역 5개 뒤에 종목명(h1)이 오고 긴 본문이 이어지는 Yahoo 시세 페이지 배치
+QUOTE_PAGE = Path(__file__).resolve().parents[1] / "benchmarks" / "fixtures" / "finance.yahoo.com_b2dcb7502baa.html"
+
+
+def chunked(content: bytes, size: int = 64):
+    return [content[start:start + size] for start in range(0, len(content), size)]
+
+
+def test_selector_matching():
+    element = html.fromstring('<div id="quote" class="main price-box">x</div>')
+    assert ElementSelector("div").matches(element)
+    assert ElementSelector("#quote").matches(element)
+    assert ElementSelector("div.price").matches(element)  # 부분 문자열 일치
+    assert ElementSelector("div#quote.main").matches(element)
+    assert not ElementSelector("span.price").matches(element)
+    with pytest.raises(ValueError):
+        ElementSelector("div > span")
+
+
+def test_stops_after_nested_matches_close():
+    page = (b"<html><body><div class='box'><div class='box'>inner</div>tail</div>"
+            + b"<p>rest</p>" * 2000 + b"</body></html>")
+    tree, aborted, size = parse_until(chunked(page), ElementSelector("div.box"), "utf-8")
+    assert aborted and size < len(page)
+    outer = tree.xpath("//div[@class='box']")[0]
+    assert outer.text_content() == "innertail"
+
+
+def test_unmatched_selector_reads_whole_page():
+    page = b"<html><body>" + b"<p>x</p>" * 500 + b"</body></html>"
+    tree, aborted, size = parse_until(chunked(page), ElementSelector("table"), "utf-8")
+    assert not aborted and size == len(page)
+    assert len(tree.xpath("//p")) == 500
+
+
+def test_truncated_quote_page_keeps_every_parsed_field():
+    content = QUOTE_PAGE.read_bytes()
+    parser = YahooParser(http_client=None)
+    expected = parser._parse_quote(html.fromstring(content), "AAPL")
+    assert expected.startswith("**Apple Inc. (AAPL)**")
+
+    selector = ElementSelector(parser.QUOTE_SELECTOR)
+    required = [ElementSelector(extra) for extra in parser.QUOTE_REQUIRED]
+    tree, aborted, size = parse_until(chunked(content), selector, "utf-8", parser.QUOTE_PRICE_COUNT, required)
+    assert aborted and size < len(content) // 4
+    assert parser._parse_quote(tree, "AAPL") == expected
+
+    # 가격 영역만 기다리면 뒤에 오는 종목명이 잘려 나감
+    tree, _, _ = parse_until(chunked(content), selector, "utf-8", parser.QUOTE_PRICE_COUNT)
+    assert parser._parse_quote(tree, "AAPL") != expected
@@ -0,0 +1,106 @@
+"""
+상장 종목 로컬 인덱스 검색 순서 테스트 (다운로드 없이 고정 목록 사용)
+"""
+import pytest
+
+from core.cache_paths import CACHE_DIR_ENV
+from parsers.ticker_index import (DomesticTickerIndex, ListingIndex, OverseasTickerIndex, TickerEntry,
+                                  is_choseong_query, to_choseong)
+
+
+ENTRIES = [
+    TickerEntry("005930", "삼성전자", "SamsungElec", "KOSPI"),
+    TickerEntry("005935", "삼성전자우", "SamsungElec(1P)", "KOSPI"),
+    TickerEntry("028260", "삼성물산", "SAMSUNG C&T", "KOSPI"),
+    TickerEntry("000660", "SK하이닉스", "SK hynix", "KOSPI"),
+    TickerEntry("035720", "카카오", "Kakao", "KOSPI"),
+    TickerEntry("323410", "카카오뱅크", "KakaoBank", "KOSPI"),
+]
+
+
+class FixedIndex(ListingIndex):
+    """고정 목록을 내려받는 것처럼 동작하는 인덱스"""
+    
+    CACHE_FILE = "fixed_tickers.json"
+    LABEL = "테스트"
+    
+    def _sources(self):
+        return [lambda: list(ENTRIES)]
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    index = FixedIndex(http_client=None)
+    assert index.refresh()
+    return index
+
+
+def test_listing_index_requires_sources():
+    with pytest.raises(TypeError):
+        ListingIndex(http_client=None)
+
+
+def test_code_lookup(index):
+    assert index.get("005930")["name"] == "삼성전자"
+    assert index.search("000660")[0]["name"] == "SK하이닉스"
+
+
+def test_exact_match_before_prefix_and_substring(index):
+    names = [result["name"] for result in index.search("카카오")]
+    assert names == ["카카오", "카카오뱅크"]
+    names = [result["name"] for result in index.search("삼성")]
+    assert names[:2] == ["삼성물산", "삼성전자"]  # 짧은 이름 우선
+    assert [result["name"] for result in index.search("하이닉스")] == ["SK하이닉스"]
+
+
+def test_english_name_and_choseong_search(index):
+    assert index.search("kakaobank")[0]["ticker"] == "323410"
+    assert is_choseong_query("ㅅㅅㅈㅈ") and to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+    assert index.search("ㅅㅅㅈㅈ")[0]["ticker"] == "005930"
+
+
+def test_refresh_persists_to_disk(index):
+    reloaded = FixedIndex(http_client=None, max_age=float("inf"))
+    reloaded.ensure_loaded()
+    assert len(reloaded) == len(ENTRIES)
+
+
+class FakeResponse:
+    """JSON/텍스트 본문만 가진 응답"""
+    
+    def __init__(self, payload=None, text=""):
+        self.payload = payload
+        self.text = text
+    
+    def raise_for_status(self):
+        pass
+    
+    def json(self):
+        return self.payload
+
+
+class RequestOnlyClient:
+    """인터페이스의 request()만 쓰는 다운로드를 기록하는 클라이언트"""
+    
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+    
+    def request(self, method, url, read_timeout=None, **kwargs):
+        self.calls.append((method, url))
+        return self.response
+
+
+def test_downloads_go_through_interface_request():
+    client = RequestOnlyClient(FakeResponse({"OutBlock_1": [
+        {"ISU_SRT_CD": "005930", "ISU_ABBRV": "삼성전자", "ISU_ENG_NM": "SamsungElec", "MKT_TP_NM": "KOSPI"},
+        {"ISU_SRT_CD": "", "ISU_ABBRV": "빈 코드"},
+    ]}))
+    entries = DomesticTickerIndex(client)._download_krx()
+    assert [(entry.code, entry.name) for entry in entries] == [("005930", "삼성전자")]
+    assert client.calls == [("POST", DomesticTickerIndex.KRX_JSON_URL)]
+
+    client = RequestOnlyClient(FakeResponse(text="Symbol|Security Name\nAAPL|Apple Inc.\nFile Creation Time: 0101|"))
+    assert OverseasTickerIndex(client)._read_listing("https://example.com/list.txt") == [
+        {"Symbol": "AAPL", "Security Name": "Apple Inc."}]
@@ -0,0 +1,67 @@
+"""
+네이버 검색 페이지 결과 추출 테스트 (국내/해외 결과 표 구역만 읽음)
+"""
+from lxml import html
+
+from parsers.ticker_parser import TickerParser
+
+
+SEARCH_PAGE = """<html><body><div id="content">
+<div class="section_search">검색어</div>
+<div class="notice"><table><tr><td><a href="/item/main.naver?code=999999">광고 종목</a></td></tr></table></div>
+<div class="tab"></div>
+<div class="tbl_search">
+<table>
+<tr><th>종목명</th><th>현재가</th></tr>
+<tr><td><a href="/item/main.naver?code=005930">삼성전자</a> <a href="/item/main.naver?code=000000">토론</a></td><td>70,000</td></tr>
+<tr><td><a href="/item/main.naver?code=005935">삼성전자우</a></td><td>60,000</td></tr>
+<tr><td>링크 없음</td><td><a href="/item/main.naver?code=111111">둘째 열</a></td></tr>
+</table>
+</div>
+<div></div><div></div>
+<div class="related"><table><tr><td><a href="https://m.stock.naver.com/worldstock/stock/FAKE/total">관련</a></td></tr></table></div>
+<div class="tbl_search overseas">
+<table>
+<thead><tr><th>종목명</th></tr></thead>
+<tbody>
+<tr><td><a href="https://m.stock.naver.com/worldstock/stock/TSLA.O/total">테슬라</a></td></tr>
+<tr><td><a href="/item/main.naver?code=222222">국내 링크</a></td></tr>
+</tbody>
+</table>
+</div>
+</div></body></html>"""
+
+ITEM_PAGE = """<html><head><script>var x = 1;</script></head><body>
+<div id="middle"><div><div><h2><a href="#">삼성전자</a></h2></div></div></div>
+<input type="hidden" id="code" value="005930">
+</body></html>"""
+
+REDIRECT_PAGE = """<html><head>
+<script>parent.location.href = '/item/main.naver?code=080160';</script>
+</head><body></body></html>"""
+
+
+def make_parser() -> TickerParser:
+    return TickerParser(http_client=None)
+
+
+def test_results_come_only_from_result_sections():
+    result = make_parser()._extract_search_results(html.fromstring(SEARCH_PAGE))
+    assert result.domestic == [
+        {"ticker": "005930", "name": "삼성전자"},
+        {"ticker": "005935", "name": "삼성전자우"},
+    ]
+    assert result.overseas == [{"ticker": "TSLA", "name": "테슬라"}]
+    assert result.single is None and result.redirect_url is None
+
+
+def test_single_item_page():
+    result = make_parser()._extract_search_results(html.fromstring(ITEM_PAGE))
+    assert result.single == {"ticker": "005930", "name": "삼성전자"}
+    assert result.domestic == [] and result.overseas == []
+
+
+def test_redirect_script():
+    result = make_parser()._extract_search_results(html.fromstring(REDIRECT_PAGE))
+    assert result.redirect_url == "/item/main.naver?code=080160"
+    assert result.single is None
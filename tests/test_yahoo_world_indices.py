@@ -0,0 +1,98 @@
+"""
+세계 지수 비동기 조회 병합 테스트 (동시 호출은 페이지를 한 번만 받음)
+"""
+import asyncio
+
+from lxml import html
+
+from parsers.yahoo_parser import YahooParser
+
+
+PAGE = """<html><body><table>
+<tr><th>Symbol</th><th>Name</th><th>Price</th><th>Change</th><th>Change %</th></tr>
+<tr><td>^GSPC</td><td>S&amp;P 500</td><td>5,000.00</td><td>+10.00</td><td>+0.20%</td></tr>
+<tr><td>^N225</td><td>Nikkei 225</td><td>38,000.00</td><td>-50.00</td><td>-0.13%</td></tr>
+</table></body></html>"""
+
+
+class SlowAsyncClient:
+    """호출 수를 세고 응답을 잠시 늦추는 비동기 클라이언트"""
+    
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+    
+    async def fetch_utf8(self, url):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise ConnectionError("boom")
+        return html.fromstring(PAGE)
+
+
+def make_parser(client):
+    parser = YahooParser(http_client=None)
+    parser.async_http_client = client
+    return parser
+
+
+def test_concurrent_async_loads_share_one_fetch():
+    client = SlowAsyncClient()
+    parser = make_parser(client)
+
+    async def run():
+        return await asyncio.gather(*(parser.get_world_indices_async(structured=True) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert client.calls == 1
+    assert all(result == results[0] for result in results)
+    assert [item["symbol"] for item in results[0]] == ["^GSPC", "^N225"]
+    # 유효 기간 안에는 다시 받지 않음
+    asyncio.run(parser.get_world_indices_async(["asia"], structured=True))
+    assert client.calls == 1
+
+
+def test_failed_async_load_releases_waiters():
+    client = SlowAsyncClient(fail=True)
+    parser = make_parser(client)
+
+    async def run():
+        return await asyncio.gather(*(parser.get_world_indices_async() for _ in range(3)))
+
+    assert asyncio.run(run()) == ["", "", ""]
+    assert client.calls == 1
+    assert parser._world_pending is None
+
+
+class RegionClient:
+    """아시아/유럽 지수가 각각 20개인 페이지를 돌려주는 클라이언트 (동기/비동기)"""
+    
+    SYMBOLS = ["^N225", "^HSI", "^KS11", "^FTSE", "^GDAXI", "^FCHI"]
+    
+    def page(self):
+        rows = "".join(f"<tr><td>{symbol}</td><td>{symbol} {index}</td><td>1.00</td><td>0</td><td>0%</td></tr>"
+                       for index in range(7) for symbol in self.SYMBOLS)
+        return html.fromstring(f"<html><body><table><tr><th>Symbol</th><th>Name</th><th>Price</th>"
+                               f"<th>Change</th><th>Change %</th></tr>{rows}</table></body></html>")
+    
+    def fetch_utf8(self, url):
+        return self.page()
+
+
+class AsyncRegionClient(RegionClient):
+    """RegionClient의 비동기 버전"""
+    
+    async def fetch_utf8(self, url):
+        return self.page()
+
+
+def test_regional_views_keep_fifteen_row_cap():
+    parser = YahooParser(http_client=RegionClient())
+    asia = parser.get_asian_indices(structured=True)
+    assert len(asia) == YahooParser.REGION_MAX_ROWS == 15
+    assert {item["symbol"] for item in asia} == {"^N225", "^HSI", "^KS11"}
+    assert len(parser.get_european_indices(structured=True)) == 15
+
+    parser = make_parser(AsyncRegionClient())
+    assert len(asyncio.run(parser.get_asian_indices_async(structured=True))) == 15
+    assert len(asyncio.run(parser.get_european_indices_async(structured=True))) == 15